@@ -0,0 +1,88 @@
+"""
+asyncio counterparts of the blocking generator and ats_logic entry points.
+
+Each call runs the synchronous function in an executor, so an event loop
+never blocks on python-docx, ReportLab or file I/O:
+
+    score, feedback = await async_api.score_async(resume)
+    pdf = await async_api.render_resume_async(resume, 'pdf')
+    async for pdf in async_api.render_many(resumes, 'pdf', limit=4):
+        ...
+
+With executor=None work goes to a thread via asyncio.to_thread, which keeps
+context variables (an instrument.record() block sees the stages; render_many
+records each render in its own Trace and adds it to the block's as it
+finishes, so stage times are summed over the concurrent renders). Rendering is
+CPU-bound Python, so for real parallelism pass a ProcessPoolExecutor; the
+arguments are then pickled to the workers.
+"""
+import asyncio
+import functools
+from collections import deque
+
+import ats_logic
+import generator
+import instrument
+
+DEFAULT_CONCURRENCY = 4
+
+async def _offload(executor, fn, *args, **kwargs):
+    if executor is None:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
+
+async def score_async(resume_data, job_description=None, term_stats=None, executor=None):
+    """Awaitable ats_logic.calculate_ats_score"""
+    return await _offload(executor, ats_logic.calculate_ats_score, resume_data, job_description, term_stats)
+
+async def render_resume_async(data, export_format='docx', cache=None, executor=None):
+    """Awaitable generator.render_resume; returns the rendered bytes"""
+    return await _offload(executor, generator.render_resume, data, export_format, cache=cache)
+
+async def generate_resume_async(data, output_path, export_format='docx', cache=None, executor=None):
+    """Awaitable generator.generate_resume; the file is written off the loop too"""
+    return await _offload(executor, generator.generate_resume, data, output_path, export_format, cache=cache)
+
+async def _aiter(items):
+    if hasattr(items, '__aiter__'):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+def _render_recorded(data, export_format, cache):
+    """render_resume in a Trace of its own, for one of several renders running at once"""
+    with instrument.record() as trace:
+        content = generator.render_resume(data, export_format, cache=cache)
+    return content, trace
+
+async def _render_into(trace, data, export_format, cache):
+    content, child = await asyncio.to_thread(_render_recorded, data, export_format, cache)
+    trace.merge(child) # On the loop, one child at a time
+    return content
+
+async def render_many(resumes, export_format='pdf', limit=DEFAULT_CONCURRENCY, cache=None, executor=None):
+    """
+    Renders an iterable or async iterable of resumes, yielding the bytes in
+    input order. Resumes are pulled lazily and at most `limit` renders are in
+    flight; pending renders are cancelled if the consumer stops early.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    # Concurrent threads sharing one Trace would mix up each other's lap() timings
+    trace = instrument.active() if executor is None else None
+    pending = deque()
+    try:
+        async for data in _aiter(resumes):
+            render = (_render_into(trace, data, export_format, cache) if trace
+                      else render_resume_async(data, export_format, cache, executor))
+            pending.append(asyncio.ensure_future(render))
+            if len(pending) >= limit:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
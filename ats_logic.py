@@ -1,17 +1,52 @@
 
 import re
-from constants import WEAK_WORDS, ROLE_KEYWORDS, MEASURABLE_REGEX, ACTION_VERBS
+from constants import (
+    WEAK_WORDS, ROLE_KEYWORDS, ROLE_ALIASES, MEASURABLE_REGEX, ACTION_VERBS,
+    JD_COVERAGE_WEIGHT, JD_MISSING_TERMS_SHOWN, MAX_PAGES, MIN_PAGE_FILL
+)
+import instrument
+import pagefit
+from matcher import PhraseMatcher, PatternSetMatcher
+from models import as_resume_dict
+from roles import RoleIndex
+from sanitize import sanitize_resume, sanitize_text
 
-def calculate_ats_score(resume_data):
+# Compiled once at import. Only the measurable patterns are found in a single
+# walk of the text (PatternSetMatcher). An action verb counts when it appears
+# between single spaces (or the text edges), i.e. as one of the ' '-separated
+# tokens of the lowercase text. Weak phrases count as plain substrings; WEAK_WORDS
+# is small enough that PhraseMatcher.find_all searches for each phrase in turn.
+_VERBS = [verb.lower() for verb in ACTION_VERBS] # Duplicates are counted twice, as before
+_MULTI_WORD_VERBS = {verb for verb in _VERBS if ' ' in verb}
+_WEAK_MATCHER = PhraseMatcher(WEAK_WORDS)
+_MEASURABLE_MATCHER = PatternSetMatcher(MEASURABLE_REGEX, re.IGNORECASE)
+
+# Role index used by get_role_keywords; replace it to load a larger taxonomy
+ROLE_INDEX = RoleIndex.from_roles(ROLE_KEYWORDS, ROLE_ALIASES)
+
+@instrument.traced('calculate_ats_score')
+def calculate_ats_score(resume_data, job_description=None, term_stats=None, sanitize=False):
     """
     Calculates a heuristic ATS score based on various factors.
     Returns a score out of 100 and a list of feedback messages.
+    Accepts a resume dict or a models.Resume.
+    If a job description is given, keyword coverage of it is scored too
+    (term_stats: a jd_match.TermStats, defaults to the saved corpus stats).
+    sanitize=True scores the text as sanitize.sanitize_resume would clean it.
     """
+    trace = instrument.active()
+    if trace:
+        trace.lap()
+    resume_data = as_resume_dict(resume_data)
+    if sanitize:
+        resume_data, changes = sanitize_resume(resume_data)
+        if trace:
+            trace.lap('sanitize')
+            trace.count('sanitized_fields', len(changes))
     score = 100
     feedback = []
 
-    # 1. Content Length Check (Simple word count estimation)
-    # Assuming avg 500-1000 words for 1-2 pages
+    # 1. Content Length Check (predicted PDF layout, see pagefit.py)
     total_text = " ".join([str(v) for v in resume_data.values() if isinstance(v, str)])
     # Add experience text
     for exp in resume_data.get('experience', []):
@@ -21,30 +56,39 @@ def calculate_ats_score(resume_data):
     for proj in resume_data.get('projects', []):
         total_text += " " + proj.get('description', '')
     
-    word_count = len(total_text.split())
-    if word_count < 200:
+    if trace:
+        trace.lap('text')
+    fit = pagefit.estimate_pages(resume_data)
+    if trace:
+        trace.lap('length')
+        trace.count('pages', fit.pages)
+    if fit.pages == 1 and fit.last_page_fill < MIN_PAGE_FILL:
         score -= 20
-        feedback.append("Resume is too short. Add more detail to Experience and Projects.")
-    elif word_count > 1200:
+        feedback.append(f"Resume is too short (fills about {fit.last_page_fill:.0%} of a page). Add more detail to Experience and Projects.")
+    elif fit.overflow_lines:
         score -= 10
-        feedback.append("Resume might be too long (over 2 pages). condense bullet points.")
+        feedback.append(f"Resume runs to {fit.pages} pages ({fit.overflow_lines} lines past page {MAX_PAGES}). Condense bullet points.")
 
     # 2. Measurable Results Check
-    measurable_count = 0
-    for pattern in MEASURABLE_REGEX:
-        if re.search(pattern, total_text, re.IGNORECASE):
-            measurable_count += 1
-    
+    measurable_count = len(_MEASURABLE_MATCHER.matched(total_text))
+    if trace:
+        trace.lap('measurable')
+
     if measurable_count < 3:
         score -= 15
         feedback.append(f"Found only {measurable_count} measurable result(s). Aim for at least 3-5 (e.g., 'Increased sales by 20%', 'Saved $10k').")
 
     # 3. Action Verb Check
-    verb_count = 0
     total_text_lower = total_text.lower()
-    for verb in ACTION_VERBS:
-        if f" {verb.lower()} " in f" {total_text_lower} ": # weak match
-            verb_count += 1
+    tokens = set(total_text_lower.split(' '))
+    verb_count = 0
+    for verb in _VERBS:
+        if verb in _MULTI_WORD_VERBS:
+            verb_count += f" {verb} " in f" {total_text_lower} " # weak match
+        else:
+            verb_count += verb in tokens
+    if trace:
+        trace.lap('verbs')
     
     if verb_count < 5:
         score -= 10
@@ -60,44 +104,51 @@ def calculate_ats_score(resume_data):
         feedback.append("LinkedIn profile is recommended for better visibility.")
 
     # 5. Weak Words Check
+    weak_found = _WEAK_MATCHER.find_all(total_text_lower)
     weak_word_hits = []
     for weak, strong in WEAK_WORDS.items():
-        if weak in total_text_lower:
+        if weak in weak_found and weak != strong.lower(): # "proficient in" is its own suggestion
             weak_word_hits.append(f"'{weak}' -> '{strong}'")
             score -= 2
     
     if weak_word_hits:
         feedback.append(f"Found weak words: {', '.join(weak_word_hits[:3])}...")
+    if trace:
+        trace.lap('weak_words') # Includes the contact checks
+
+    # 6. Job Description Coverage (optional)
+    if job_description:
+        import jd_match # NumPy is only needed when a posting is given
+        match = jd_match.score_job_match(resume_data, job_description, term_stats)
+        score -= round(JD_COVERAGE_WEIGHT * (1 - match.score))
+        if match.missing:
+            feedback.append(f"Covers {match.score:.0%} of the job description's keywords. "
+                            f"Missing: {', '.join(match.missing[:JD_MISSING_TERMS_SHOWN])}")
+        if trace:
+            trace.lap('job_match')
 
     return max(0, score), feedback
 
-def get_role_keywords(target_role):
+def get_role_keywords(target_role, index=None):
     """
     Returns a list of keywords for a given target role.
+    Matches exact names, aliases, roles named inside a longer title,
+    then falls back to fuzzy matching; returns [] if nothing is close.
     """
     if not target_role:
         return []
-    
-    target_role_lower = target_role.lower()
-    for role, keywords in ROLE_KEYWORDS.items():
-        if role in target_role_lower:
-            return keywords
-            
-    # Fallback: simple split if no match found (naive)
-    return []
+    return (index or ROLE_INDEX).keywords(target_role)
 
 def refine_text_with_ats_rules(text):
     """
     Simple function to clean text:
-    - remove emojis (basic range)
-    - standardise quotes
+    - remove emojis
+    - standardise quotes and dashes, transliterate accents (see sanitize.py)
     """
     if not text:
         return ""
         
-    # Remove basic emojis (ranges can be extensive, using a simple broad range for now)
-    # This is a basic regex for some emojis, might not catch everything but good enough for a constraint
-    text = re.sub(r'[^\x00-\x7F]+', '', text) 
+    text = sanitize_text(text)
     
     # Capitalize first letter if it's a sentence/bullet
     text = text.strip()
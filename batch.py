@@ -0,0 +1,132 @@
+"""
+Batch scoring across all cores.
+
+Reads resume dicts from a directory of .json files, a JSONL file, or stdin
+('-'), scores them in a process pool and streams one JSON result per line in
+input order:
+
+    python batch.py resumes.jsonl -o scores.jsonl
+    python batch.py resumes_dir/ --workers 8
+    cat resumes.jsonl | python batch.py -
+    python batch.py resumes.jsonl --sanitize   # score cleaned text, list what changed
+"""
+import argparse
+import functools
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import ats_logic
+from sanitize import sanitize_resume
+
+DEFAULT_CHUNKSIZE = 32
+
+def iter_records(source):
+    """
+    Yields (record_id, raw_json) pairs lazily from a directory, a JSONL file
+    or '-' for stdin. Directory entries are read in name order; JSONL records
+    are identified by line number and blank lines are skipped.
+    """
+    if source != '-' and os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.endswith('.json'):
+                with open(os.path.join(source, name), encoding='utf-8') as f:
+                    yield name, f.read()
+        return
+
+    stream = sys.stdin if source == '-' else open(source, encoding='utf-8')
+    try:
+        for line_no, line in enumerate(stream, start=1):
+            if line.strip():
+                yield line_no, line
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def _map_chunk(fn, chunk):
+    return [fn(item) for item in chunk]
+
+def _chunked(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def imap_ordered(fn, items, workers=None, chunksize=DEFAULT_CHUNKSIZE, window=None):
+    """
+    Maps a picklable fn over items in a process pool and yields the results
+    in input order. Items are consumed lazily and at most `window` chunks are
+    in flight, so memory stays flat however long the input is.
+    With workers=1 everything runs in the calling process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    window = window or workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunked(items, chunksize):
+            pending.append(pool.submit(_map_chunk, fn, chunk))
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def score_record(record, sanitize=False):
+    """
+    Scores one (record_id, resume) pair, where resume is a dict or its JSON
+    text. Bad input is reported in the result instead of stopping the batch.
+    With sanitize=True the cleaned text is scored and the result lists the
+    fields sanitize.sanitize_resume changed.
+    """
+    record_id, resume = record
+    try:
+        if isinstance(resume, str):
+            resume = json.loads(resume)
+        if sanitize:
+            resume, changes = sanitize_resume(resume)
+        score, feedback = ats_logic.calculate_ats_score(resume)
+    except Exception as e:
+        return {'id': record_id, 'error': f"{type(e).__name__}: {e}"}
+    result = {'id': record_id, 'score': score, 'feedback': feedback}
+    if sanitize:
+        result['changes'] = [change._asdict() for change in changes]
+    return result
+
+def score_batch(records, workers=None, chunksize=DEFAULT_CHUNKSIZE, sanitize=False):
+    """
+    Scores an iterable of (record_id, resume) pairs on all cores.
+    Yields result dicts in input order.
+    """
+    fn = functools.partial(score_record, sanitize=True) if sanitize else score_record
+    return imap_ordered(fn, records, workers=workers, chunksize=chunksize)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score resumes in bulk and write JSONL results.")
+    parser.add_argument("source", help="Directory of .json files, a .jsonl file, or '-' for stdin")
+    parser.add_argument("-o", "--output", default="-", help="Output JSONL path (default: stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Records sent to a worker at once")
+    parser.add_argument("--sanitize", action="store_true", help="Clean quotes, accents and emoji first and report the changes")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for result in score_batch(iter_records(args.source), workers=args.workers, chunksize=args.chunksize,
+                                  sanitize=args.sanitize):
+            out.write(json.dumps(result) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()
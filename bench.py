@@ -0,0 +1,253 @@
+"""
+Benchmark suite for scoring and rendering.
+
+Builds synthetic resumes of configurable size, times the scoring helpers and
+each renderer, and reports per-call latency percentiles as JSON:
+
+    python bench.py                                  # default sizes, JSON to stdout
+    python bench.py --sizes 1x1 10x5 100x50 --repeat 20 -o bench.json
+    python bench.py --save-baseline baseline.json
+    python bench.py --compare baseline.json --threshold 0.25   # exit 1 on regression
+    python bench.py --startup ats_logic generator --sizes 1x1  # import cost only matters here
+    python bench.py --formats pdf --min-speedup 50              # exit 1 if page estimates get too slow
+
+A size is JOBSxBULLETS (1-100 jobs, 1-50 bullets per job). Startup entries
+time `import MODULE` in a fresh interpreter, minus a bare interpreter start.
+When the PDF renderer is timed, 'estimate_speedup' is how many times faster
+a first estimate_pages of a 30x10 resume is than params_to_pdf; the run
+exits 1 when it drops under --min-speedup (default 50).
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import ats_logic
+import generator
+import pagefit
+from constants import ACTION_VERBS, MEASURABLE_REGEX, ROLE_KEYWORDS, WEAK_WORDS
+from sanitize import sanitize_resume
+
+DEFAULT_SIZES = ["1x1", "10x5", "30x10", "100x50"]
+DEFAULT_REPEAT = 10
+DEFAULT_STARTUP = ["ats_logic", "generator", "render_docx", "render_pdf"]
+DEFAULT_THRESHOLD = 0.25 # A p50 more than 25% slower than the baseline is a regression
+ZERO_BASELINE_FLOOR_MS = 1.0 # Against a 0 ms baseline (clamped startup times), only a p50 above this regresses
+MIN_ESTIMATE_SPEEDUP = 50.0 # A first estimate_pages must stay this many times faster than rendering the PDF
+SPEEDUP_SIZE = "30x10" # The resume the speedup is checked on
+MAX_JOBS = 100
+MAX_BULLETS = 50
+
+_NOUNS = ["pipeline", "platform", "dashboard", "service", "campaign", "budget", "onboarding flow",
+          "data model", "release process", "vendor contract", "test suite", "API"]
+_METRICS = ["by 20%", "by $15k", "saving 40 hours a month", "for 3M users", "by 12%", "within 2 weeks"]
+_FILLER = ["across three regions", "with a team of five", "ahead of schedule", "for enterprise clients", ""]
+
+def synthetic_bullet(rng):
+    phrase = rng.choice(list(WEAK_WORDS)) if rng.random() < 0.15 else rng.choice(ACTION_VERBS)
+    return " ".join(p for p in (phrase, "the", rng.choice(_NOUNS), rng.choice(_METRICS), rng.choice(_FILLER)) if p)
+
+def synthetic_resume(jobs=10, bullets=5, seed=0):
+    """Builds a deterministic resume dict with `jobs` jobs of `bullets` bullets each"""
+    if not 1 <= jobs <= MAX_JOBS or not 1 <= bullets <= MAX_BULLETS:
+        raise ValueError(f"jobs must be 1-{MAX_JOBS} and bullets 1-{MAX_BULLETS}")
+    rng = random.Random(seed)
+    role = rng.choice(list(ROLE_KEYWORDS))
+    return {
+        'full_name': f"Synthetic Candidate {seed}",
+        'email': f"candidate{seed}@example.com",
+        'phone': "555-0100",
+        'city': "Springfield", 'country': "USA",
+        'linkedin': f"linkedin.com/in/candidate{seed}",
+        'github': f"github.com/candidate{seed}",
+        'summary': f"{role.title()} with a record of results. " + synthetic_bullet(rng) + ".",
+        'skills': ", ".join(ROLE_KEYWORDS[role]),
+        'experience': [
+            {
+                'company': f"Company {j}", 'location': "Remote", 'title': role.title(),
+                'start_date': str(2024 - j), 'end_date': "Present" if j == 0 else str(2025 - j),
+                'responsibilities': "\n".join(synthetic_bullet(rng) for _ in range(bullets)),
+            }
+            for j in range(jobs)
+        ],
+        'projects': [{'name': f"Project {p}", 'description': synthetic_bullet(rng)} for p in range(3)],
+        'education': [{'institution': "State University", 'degree': "B.S. Computer Science", 'year': "2015"}],
+        'certifications': ["AWS Certified Solutions Architect", "PMP"],
+    }
+
+def parse_size(text):
+    jobs, _, bullets = text.lower().partition("x")
+    return int(jobs), int(bullets or 1)
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+    return {
+        'n': len(ordered),
+        'min': ordered[0],
+        'mean': statistics.fmean(ordered),
+        'p50': pct(50), 'p90': pct(90), 'p99': pct(99),
+        'max': ordered[-1],
+    }
+
+def time_call(fn, repeat):
+    fn() # Warm-up: fills import, template and style caches
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return percentiles(samples)
+
+def _interpreter_ms(code):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    return (time.perf_counter() - start) * 1000.0
+
+def estimate_first(resume):
+    """estimate_pages of a resume never estimated before: no word, paragraph or estimate cached"""
+    pagefit.clear_caches()
+    return pagefit.estimate_pages(resume)
+
+_edits = itertools.count()
+
+def estimate_after_edit(resume):
+    """estimate_pages after rewording one bullet, as live scoring does while the user types"""
+    bullets = resume['experience'][0]['responsibilities'].split('\n')
+    bullets[0] = f"Cut deploy time by {next(_edits)}% with parallel builds"
+    edited = dict(resume, experience=[dict(resume['experience'][0], responsibilities="\n".join(bullets))] + resume['experience'][1:])
+    return pagefit.estimate_pages(edited)
+
+def estimate_speedup(results, repeat, directory):
+    """How many times faster a first estimate_pages of a SPEEDUP_SIZE resume is than params_to_pdf"""
+    jobs, bullets = parse_size(SPEEDUP_SIZE)
+    tag = f"[{jobs}x{bullets}]"
+    if f"params_to_pdf{tag}" not in results: # Not among the timed sizes
+        resume = synthetic_resume(jobs, bullets)
+        path = os.path.join(directory, "speedup.pdf")
+        results[f"estimate_pages{tag}"] = time_call(lambda: estimate_first(resume), repeat)
+        results[f"params_to_pdf{tag}"] = time_call(lambda: generator.params_to_pdf(resume, path), repeat)
+    return results[f"params_to_pdf{tag}"]['p50'] / results[f"estimate_pages{tag}"]['p50']
+
+def startup_time(module, repeat):
+    """Milliseconds `import module` adds to a fresh interpreter's start"""
+    bare = statistics.median(_interpreter_ms("pass") for _ in range(repeat))
+    return percentiles([max(0.0, _interpreter_ms(f"import {module}") - bare) for _ in range(repeat)])
+
+def run(sizes=DEFAULT_SIZES, repeat=DEFAULT_REPEAT, formats=('docx', 'pdf', 'txt'), startup=DEFAULT_STARTUP):
+    """Runs every benchmark; timings are milliseconds per call"""
+    results = {}
+    for module in startup:
+        results[f"import {module}"] = startup_time(module, repeat)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            jobs, bullets = parse_size(size)
+            resume = synthetic_resume(jobs, bullets)
+            all_bullets = [b for exp in resume['experience'] for b in exp['responsibilities'].split('\n')]
+            tag = f"[{jobs}x{bullets}]"
+
+            results[f"calculate_ats_score{tag}"] = time_call(lambda: ats_logic.calculate_ats_score(resume), repeat)
+            results[f"refine_text_with_ats_rules{tag}"] = time_call(
+                lambda: [ats_logic.refine_text_with_ats_rules(b) for b in all_bullets], repeat)
+            results[f"sanitize_resume{tag}"] = time_call(lambda: sanitize_resume(resume), repeat)
+            results[f"estimate_pages{tag}"] = time_call(lambda: estimate_first(resume), repeat)
+            results[f"estimate_pages_after_edit{tag}"] = time_call(lambda: estimate_after_edit(resume), repeat)
+            for fmt in formats:
+                render = getattr(generator, f"params_to_{fmt}")
+                path = os.path.join(tmp, f"bench.{fmt}")
+                results[f"params_to_{fmt}{tag}"] = time_call(lambda: render(resume, path), repeat)
+        speedup = estimate_speedup(results, repeat, tmp) if 'pdf' in formats else None
+
+    roles = list(ROLE_KEYWORDS) + ["Senior Software Engineer II", "sofware enginer", "unknown role"]
+    results["get_role_keywords"] = time_call(lambda: [ats_logic.get_role_keywords(r) for r in roles], repeat)
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'sizes': list(sizes),
+            'startup': list(startup),
+            'unit': 'ms',
+        },
+        'results': results,
+        'estimate_speedup': speedup,
+    }
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """Returns (regressions, rows): benchmarks whose p50 grew by more than threshold"""
+    rows = []
+    regressions = []
+    for name, stats in current['results'].items():
+        base = baseline['results'].get(name)
+        if not base:
+            continue
+        if base['p50']:
+            ratio = stats['p50'] / base['p50']
+            regressed = ratio > 1 + threshold
+        else:
+            ratio = float('inf') if stats['p50'] else 1.0
+            regressed = stats['p50'] > ZERO_BASELINE_FLOOR_MS
+        row = {'name': name, 'baseline_p50': base['p50'], 'p50': stats['p50'], 'ratio': ratio}
+        rows.append(row)
+        if regressed:
+            regressions.append(row)
+    return regressions, rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ATS scoring and resume rendering.")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="Resume sizes as JOBSxBULLETS")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed calls per benchmark")
+    parser.add_argument("--formats", nargs="+", default=['docx', 'pdf', 'txt'], help="Renderers to time")
+    parser.add_argument("--startup", nargs="*", default=DEFAULT_STARTUP, metavar="MODULE",
+                        help="Modules whose import time is measured (none to skip)")
+    parser.add_argument("-o", "--output", default="-", help="Write the JSON report here (default: stdout)")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Also save the report as a baseline")
+    parser.add_argument("--compare", metavar="BASELINE", help="Flag regressions against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed p50 slowdown (0.25 = 25%%)")
+    parser.add_argument("--min-speedup", type=float, default=MIN_ESTIMATE_SPEEDUP,
+                        help="Required estimate_pages speedup over params_to_pdf")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.repeat, args.formats, args.startup)
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    failed = False
+    speedup = report['estimate_speedup']
+    if speedup is not None:
+        failed = speedup < args.min_speedup
+        flag = "TOO SLOW" if failed else "ok"
+        print(f"{flag:>10}  estimate_pages[{SPEEDUP_SIZE}] x{speedup:.0f} faster than params_to_pdf (min x{args.min_speedup:.0f})",
+              file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions, rows = compare(report, baseline, args.threshold)
+        for row in rows:
+            flag = "REGRESSION" if row in regressions else "ok"
+            print(f"{flag:>10}  {row['name']:<45} {row['baseline_p50']:9.3f} -> {row['p50']:9.3f} ms  (x{row['ratio']:.2f})",
+                  file=sys.stderr)
+        if regressions:
+            failed = True
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 
 # Constants for ATS Resume Generator
+import os
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Standard Fonts
 FONT_NAME = "Arial"
@@ -7,12 +10,16 @@ FONT_SIZE_BODY = 11
 FONT_SIZE_HEADING = 12 # Slightly larger, but kept minimal
 FONT_SIZE_NAME = 14
 
+PDF_LEADING = 1.2 # PDF line height as a multiple of the font size
+
 # Margins (Inches)
 MARGIN_TOP = 1.0
 MARGIN_BOTTOM = 0.5 # Slightly smaller bottom to fit more
 MARGIN_LEFT = 1.0
 MARGIN_RIGHT = 1.0
 
+PARAGRAPH_SPACING = 1.0 # Multiplier on the renderers' space before/after paragraphs
+
 # Action Verbs (Categorized for potential future logic, but flattened for now)
 ACTION_VERBS = [
     # Management / Leadership
@@ -89,6 +96,25 @@ ROLE_KEYWORDS = {
      ]
 }
 
+# Common alternative titles and abbreviations for the roles above
+ROLE_ALIASES = {
+    "swe": "software engineer",
+    "software developer": "software engineer",
+    "backend engineer": "software engineer",
+    "frontend engineer": "software engineer",
+    "full stack developer": "software engineer",
+    "ml engineer": "data scientist",
+    "machine learning engineer": "data scientist",
+    "data analyst": "data scientist",
+    "product owner": "product manager",
+    "digital marketing manager": "marketing manager",
+    "program manager": "project manager",
+    "hr": "human resources",
+    "hrbp": "human resources",
+    "hr business partner": "human resources",
+    "recruiter": "human resources",
+}
+
 # ATS formatting rules
 SECTION_ORDER = [
     "Contact",
@@ -112,3 +138,22 @@ MEASURABLE_REGEX = [
     r"improved",      # improved
     r"grew",          # grew
 ]
+
+# Job description coverage (optional factor in calculate_ats_score)
+JD_STATS_PATH = os.path.join(APP_DIR, "jd_stats.npz") # Built with: python jd_match.py build <postings dir>
+JD_COVERAGE_WEIGHT = 15        # Max points deducted for a resume covering none of the posting
+JD_MISSING_TERMS_SHOWN = 5
+
+# Render cache (render_cache.py)
+CACHE_APP_NAME = "ats_resume_generator"      # Per-user cache directory name; the disk tier lives in it
+RENDER_CACHE_MEMORY_BYTES = 32 * 1024 * 1024  # In-memory tier cap per process
+RENDER_CACHE_DISK_BYTES = 256 * 1024 * 1024
+
+# Page length (pagefit.py, used by calculate_ats_score)
+MAX_PAGES = 2         # Longer resumes lose points
+MIN_PAGE_FILL = 0.5   # A one-page resume filling less of the page than this is "too short"
+
+# Fit-to-pages limits (pagefit.fit_to_pages); tighter than this starts to hurt ATS parsing and readability
+FIT_MIN_SPACING = 0.5
+FIT_MIN_MARGIN = 0.5   # Inches
+FIT_MIN_FONT_SIZE = 10
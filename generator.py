@@ -1,313 +1,194 @@
+"""
+Resume rendering front end.
+
+Each format lives in its own backend module (render_docx, render_pdf,
+render_txt) that is imported the first time that format is rendered, so
+importing this module (or ats_logic, for scoring) loads neither python-docx
+nor ReportLab.
+"""
+import io
+import importlib
+
+import instrument
+import pagefit
+import pdf_text
+from layout import build_layout
+from render_cache import cache_key
+from sanitize import sanitize_resume
+from styling import current_styling
+
+# Format -> backend module exposing render(layout, stream)
+BACKENDS = {
+    'docx': 'render_docx',
+    'pdf': 'render_pdf',
+    'txt': 'render_txt',
+}
+FIT_VERIFY_SLACK = (0.0, 0.03, 0.08) # Last-page headroom for each fit attempt when the real PDF runs over
+
+def backend(export_format):
+    """Returns the backend module for a format, importing it on first use"""
+    name = BACKENDS.get(export_format)
+    if name is None:
+        raise ValueError(f"Unsupported format: {export_format}")
+    return importlib.import_module(name)
 
-import os
-from docx import Document
-from docx.shared import Pt, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from reportlab.lib.pagesizes import LETTER
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-
-from constants import (
-    FONT_NAME, FONT_SIZE_BODY, FONT_SIZE_HEADING, FONT_SIZE_NAME,
-    MARGIN_TOP, MARGIN_BOTTOM, MARGIN_LEFT, MARGIN_RIGHT
-)
-
-def generate_resume(data, output_path, export_format='docx'):
+@instrument.traced('render_resume')
+def render_resume(data, export_format='docx', stream=None, cache=None, sanitize=False, style=None):
     """
-    Dispatcher for resume generation.
+    Renders a resume in memory, without touching the filesystem.
+    Writes into `stream` (any writable binary file-like object) and returns
+    it, or returns the rendered bytes when no stream is given.
+    With a render_cache.RenderCache, a hit skips the backend entirely.
+    sanitize=True runs the text through sanitize.sanitize_resume first.
+    style: a styling.Styling to use instead of the current constants.
     """
-    if export_format == 'docx':
-        return params_to_docx(data, output_path)
-    elif export_format == 'pdf':
-        return params_to_pdf(data, output_path)
-    elif export_format == 'txt':
-        return params_to_txt(data, output_path)
+    layout = _normalize(data, sanitize)
+    if cache is not None:
+        content = _render_cached(layout, export_format, style, cache)
+    elif stream is not None:
+        start = _position(stream)
+        backend(export_format).render(layout, stream, style)
+        if start is not None:
+            instrument.active().count(f'{export_format}.bytes', stream.tell() - start)
+        return stream
     else:
-        raise ValueError(f"Unsupported format: {export_format}")
-
-def params_to_docx(data, output_path):
-    doc = Document()
-    
-    # Setup Margins
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Inches(MARGIN_TOP)
-        section.bottom_margin = Inches(MARGIN_BOTTOM)
-        section.left_margin = Inches(MARGIN_LEFT)
-        section.right_margin = Inches(MARGIN_RIGHT)
-    
-    # Setup Default Font
-    style = doc.styles['Normal']
-    font = style.font
-    font.name = FONT_NAME
-    font.size = Pt(FONT_SIZE_BODY)
-
-    # --- Header (Contact Info) ---
-    name_paragraph = doc.add_paragraph()
-    name_paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    run = name_paragraph.add_run(data.get('full_name', '').upper())
-    run.bold = True
-    run.font.size = Pt(FONT_SIZE_NAME)
-    run.font.name = FONT_NAME
-
-    contact_lines = []
-    if data.get('city') or data.get('country'):
-        contact_lines.append(f"{data.get('city', '')}, {data.get('country', '')}")
-    if data.get('phone'):
-        contact_lines.append(data.get('phone'))
-    if data.get('email'):
-        contact_lines.append(data.get('email'))
-    if data.get('linkedin'):
-        contact_lines.append(data.get('linkedin'))
-    if data.get('github'):
-        contact_lines.append(data.get('github'))
-    
-    contact_paragraph = doc.add_paragraph(" | ".join([c for c in contact_lines if c]))
-    contact_paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    contact_paragraph.paragraph_format.space_after = Pt(12)
-
-    # --- Helper for Heading ---
-    def add_heading(text):
-        p = doc.add_paragraph()
-        run = p.add_run(text.upper())
-        run.bold = True
-        run.font.size = Pt(FONT_SIZE_HEADING)
-        run.font.name = FONT_NAME
-        p.paragraph_format.space_before = Pt(12)
-        p.paragraph_format.space_after = Pt(6)
-        # Add a simple bottom border if possible, or just a line divider? 
-        # Word borders are tricky with python-docx without XML hacking.
-        # Staying simple (No visual lines to avoid graphics issues is safer for strict ATS, 
-        # though border-bottom is usually fine. We'll stick to bold caps).
-
-    # --- Professional Summary ---
-    if data.get('summary'):
-        add_heading("Professional Summary")
-        p = doc.add_paragraph(data.get('summary'))
-        p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-
-    # --- Skills ---
-    if data.get('skills'):
-        add_heading("Skills")
-        # Just comma separated as requested in some ATS formats to save space, 
-        # or bullet points? Prompt says "Skills (comma-separated)" in form.
-        # Let's display them as a clean paragraph or list. Paragraph is safer for density.
-        p = doc.add_paragraph(data.get('skills'))
-        p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-
-    # --- Work Experience ---
-    experiences = data.get('experience', [])
-    if experiences:
-        add_heading("Work Experience")
-        for exp in experiences:
-            # Header: Role | Company | Location | Dates 
-            # (Or variations. Standard is typically: Company on left, Date on right.
-            # But plain text usually easier if linear or pipe separated)
-            
-            # Line 1: Company -- Location
-            p_comp = doc.add_paragraph()
-            r_comp = p_comp.add_run(f"{exp.get('company', '')}")
-            r_comp.bold = True
-            if exp.get('location'):
-                p_comp.add_run(f" | {exp.get('location', '')}")
-
-            # Line 2: Title -- Dates
-            p_role = doc.add_paragraph()
-            r_role = p_role.add_run(f"{exp.get('title', '')}")
-            r_role.italic = True
-            if exp.get('start_date') or exp.get('end_date'):
-                p_role.add_run(f" | {exp.get('start_date', '')} - {exp.get('end_date', '')}")
-            
-            # Bullets
-            bullets = exp.get('responsibilities', '').split('\n')
-            for b in bullets:
-                if b.strip():
-                    p_bull = doc.add_paragraph(b.strip(), style='List Bullet')
-                    p_bull.paragraph_format.space_after = Pt(2)
-
-    # --- Projects ---
-    projects = data.get('projects', [])
-    if projects:
-        add_heading("Projects")
-        for proj in projects:
-            p_proj = doc.add_paragraph()
-            r_proj = p_proj.add_run(f"{proj.get('name', '')}")
-            r_proj.bold = True
-            
-            bullets = proj.get('description', '').split('\n')
-            for b in bullets:
-                if b.strip():
-                    p_bull = doc.add_paragraph(b.strip(), style='List Bullet')
-                    p_bull.paragraph_format.space_after = Pt(2)
-
-    # --- Education ---
-    education = data.get('education', [])
-    if education:
-        add_heading("Education")
-        for edu in education:
-            p = doc.add_paragraph()
-            run = p.add_run(f"{edu.get('institution', '')}")
-            run.bold = True
-            
-            p2 = doc.add_paragraph()
-            p2.add_run(f"{edu.get('degree', '')}")
-            if edu.get('year'):
-                p2.add_run(f" | {edu.get('year', '')}")
-
-    # --- Certifications ---
-    certifications = data.get('certifications', [])
-    if certifications:
-        add_heading("Certifications")
-        for cert in certifications:
-             doc.add_paragraph(cert.strip(), style='List Bullet')
-
-    doc.save(output_path)
+        content = _render_bytes(layout, export_format, style)
+    _count_bytes(export_format, content)
+    if stream is not None:
+        stream.write(content)
+        return stream
+    return content
+
+@instrument.traced('render_all')
+def render_all(data, formats=('docx', 'pdf', 'txt'), sanitize=False):
+    """
+    Renders several formats from a single normalization pass.
+    Returns a dict mapping each format to its bytes.
+    """
+    renderers = {fmt: backend(fmt).render for fmt in formats}
+    layout = _normalize(data, sanitize)
+    outputs = {}
+    for fmt, render in renderers.items():
+        buffer = io.BytesIO()
+        render(layout, buffer)
+        outputs[fmt] = buffer.getvalue()
+        _count_bytes(fmt, outputs[fmt])
+    return outputs
+
+@instrument.traced('generate_resume')
+def generate_resume(data, output_path, export_format='docx', cache=None, sanitize=False):
+    """
+    Dispatcher for resume generation. Renders in memory (or takes the bytes
+    from `cache`), then writes the file in one go, so disk I/O shows up as
+    its own 'write' stage. Returns output_path.
+    """
+    content = render_resume(data, export_format, cache=cache, sanitize=sanitize)
+    _write(output_path, content)
     return output_path
 
-def params_to_txt(data, output_path):
-    lines = []
-    
-    # Header
-    lines.append(data.get('full_name', '').upper())
-    contact = []
-    if data.get('phone'): contact.append(data.get('phone'))
-    if data.get('email'): contact.append(data.get('email'))
-    if data.get('linkedin'): contact.append(data.get('linkedin'))
-    if data.get('city'): contact.append(f"{data.get('city')}, {data.get('country', '')}")
-    if data.get('github'): contact.append(data.get('github'))
-    lines.append(" | ".join(contact))
-    lines.append("")
-    
-    def add_sec(title, content_fn):
-        lines.append(title.upper())
-        lines.append("-" * len(title))
-        content_fn()
-        lines.append("")
-
-    if data.get('summary'):
-        def summary_content():
-            lines.append(data.get('summary'))
-        add_sec("Professional Summary", summary_content)
-        
-    if data.get('skills'):
-        def skills_content():
-            lines.append(data.get('skills'))
-        add_sec("Skills", skills_content)
-        
-    if data.get('experience'):
-        def exp_content():
-            for exp in data.get('experience'):
-                lines.append(f"{exp.get('company')} | {exp.get('location', '')}")
-                lines.append(f"{exp.get('title')} | {exp.get('start_date', '')} - {exp.get('end_date', '')}")
-                for line in exp.get('responsibilities', '').split('\n'):
-                    if line.strip():
-                        lines.append(f"- {line.strip()}")
-                lines.append("")
-        add_sec("Work Experience", exp_content)
-
-    if data.get('projects'):
-        def proj_content():
-            for proj in data.get('projects'):
-                lines.append(f"{proj.get('name')}")
-                for line in proj.get('description', '').split('\n'):
-                    if line.strip():
-                        lines.append(f"- {line.strip()}")
-                lines.append("")
-        add_sec("Projects", proj_content)
-
-    if data.get('education'):
-        def edu_content():
-            for edu in data.get('education'):
-                lines.append(f"{edu.get('institution')}")
-                lines.append(f"{edu.get('degree')} | {edu.get('year', '')}")
-                lines.append("")
-        add_sec("Education", edu_content)
-        
-    if data.get('certifications'):
-        def cert_content():
-            for cert in data.get('certifications'):
-                if cert.strip():
-                    lines.append(f"- {cert.strip()}")
-        add_sec("Certifications", cert_content)
+@instrument.traced('generate_fitted_resume')
+def generate_fitted_resume(data, output_path, export_format='pdf', pages=1, cache=None, sanitize=False):
+    """
+    generate_resume for PDF or DOCX, with spacing, margins and then the body
+    font size tightened within the FIT_MIN_* limits until the resume fits on
+    `pages` pages. Returns (output_path, pagefit.FitResult); the result's
+    adjustments list what was changed. For PDF, result.fits is checked
+    against the rendered page count; for DOCX, Word paginates the file
+    itself, so result.fits is None and result.fit is only an estimate.
+    """
+    content, result = _render_fitted(data, export_format, pages, cache, sanitize)
+    _write(output_path, content)
+    return output_path, result
+
+def _write(output_path, content):
+    trace = instrument.active()
+    if trace:
+        trace.lap()
+    with open(output_path, 'wb') as f:
+        f.write(content)
+    if trace:
+        trace.lap('write')
+
+def _render_bytes(layout, export_format, style):
+    buffer = io.BytesIO()
+    backend(export_format).render(layout, buffer, style)
+    return buffer.getvalue()
+
+def _render_cached(layout, export_format, style, cache):
+    key = cache_key(layout, export_format, style or current_styling())
+    content = cache.get(key)
+    trace = instrument.active()
+    if trace:
+        trace.count('cache.hits' if content is not None else 'cache.misses')
+    if content is None:
+        content = _render_bytes(layout, export_format, style)
+        cache.put(key, content)
+    return content
+
+def _render_fitted(data, export_format, pages, cache, sanitize):
+    """
+    Renders with the styling pagefit.fit_to_pages picks. A PDF is checked
+    against its real page count, and refitted with more headroom if the
+    estimate was short.
+    """
+    if export_format not in ('pdf', 'docx'):
+        raise ValueError(f"Cannot fit {export_format} output to pages")
+    layout = _normalize(data, sanitize)
+    trace = instrument.active()
+    for slack in FIT_VERIFY_SLACK:
+        if trace:
+            trace.lap()
+        result = pagefit.fit_to_pages(layout, export_format, pages, slack=slack)
+        if trace:
+            trace.lap('fit')
+        content = (_render_cached(layout, export_format, result.style, cache) if cache is not None
+                   else _render_bytes(layout, export_format, result.style))
+        if export_format != 'pdf':
+            result = result._replace(fits=None) # Only Word knows where its pages break
+            break
+        if not result.fits:
+            break
+        actual = pdf_text.page_count(content)
+        if actual <= pages:
+            break
+        result = result._replace(fit=result.fit._replace(pages=actual), fits=False)
+    _count_bytes(export_format, content)
+    return content, result
+
+def _normalize(data, sanitize=False):
+    """build_layout (after sanitizing), timed as the 'normalize' stage when a trace is recording"""
+    trace = instrument.active()
+    if not trace:
+        return build_layout(sanitize_resume(data)[0] if sanitize else data)
+    trace.lap()
+    if sanitize:
+        data, changes = sanitize_resume(data)
+        trace.lap('sanitize')
+        trace.count('sanitized_fields', len(changes))
+    layout = build_layout(data)
+    trace.lap('normalize')
+    trace.count('bullets', sum(len(s.bullets) + sum(len(e.bullets) for e in s.entries) for s in layout.sections))
+    return layout
+
+def _position(stream):
+    """Where a recorded render starts writing into stream; None when nothing records or it cannot tell"""
+    if not instrument.active():
+        return None
+    try:
+        return stream.tell()
+    except (AttributeError, OSError): # A pipe or socket: the bytes go uncounted
+        return None
+
+def _count_bytes(fmt, content):
+    trace = instrument.active()
+    if trace:
+        trace.count(f'{fmt}.bytes', len(content))
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines))
-    return output_path
+def params_to_docx(data, output_path):
+    return generate_resume(data, output_path, 'docx')
 
 def params_to_pdf(data, output_path):
-    # Plain PDF using ReportLab
-    doc = SimpleDocTemplate(
-        output_path,
-        pagesize=LETTER,
-        rightMargin=72, leftMargin=72,
-        topMargin=72, bottomMargin=72
-    )
-    styles = getSampleStyleSheet()
-    story = []
-    
-    # Custom styles
-    style_name = ParagraphStyle('Name', parent=styles['Normal'], fontSize=14, spaceAfter=6, fontName='Helvetica-Bold')
-    style_heading = ParagraphStyle('Heading', parent=styles['Normal'], fontSize=12, spaceAfter=6, spaceBefore=12, fontName='Helvetica-Bold')
-    style_body = ParagraphStyle('Body', parent=styles['Normal'], fontSize=11, spaceAfter=2, fontName='Helvetica')
-    style_bullet = ParagraphStyle('Bullet', parent=styles['Normal'], fontSize=11, leftIndent=20, spaceAfter=2, fontName='Helvetica', bulletText='•')
-
-    # Header
-    story.append(Paragraph(data.get('full_name', '').upper(), style_name))
-    
-    contact_info = []
-    if data.get('email'): contact_info.append(data.get('email'))
-    if data.get('phone'): contact_info.append(data.get('phone'))
-    if data.get('linkedin'): contact_info.append(data.get('linkedin'))
-    story.append(Paragraph(" | ".join(contact_info), style_body))
-    story.append(Spacer(1, 12))
-
-    # Summary
-    if data.get('summary'):
-        story.append(Paragraph("PROFESSIONAL SUMMARY", style_heading))
-        story.append(Paragraph(data.get('summary', ''), style_body))
-
-    # Skills
-    if data.get('skills'):
-        story.append(Paragraph("SKILLS", style_heading))
-        story.append(Paragraph(data.get('skills', ''), style_body))
-
-    # Experience
-    if data.get('experience'):
-        story.append(Paragraph("WORK EXPERIENCE", style_heading))
-        for exp in data.get('experience'):
-            header = f"<b>{exp.get('company')}</b> | {exp.get('location')} <br/><i>{exp.get('title')}</i> | {exp.get('start_date')} - {exp.get('end_date')}"
-            story.append(Paragraph(header, style_body))
-            for line in exp.get('responsibilities', '').split('\n'):
-                if line.strip():
-                    story.append(Paragraph(line.strip(), style_bullet))
-            story.append(Spacer(1, 6))
+    return generate_resume(data, output_path, 'pdf')
 
-    # Projects
-    if data.get('projects'):
-        story.append(Paragraph("PROJECTS", style_heading))
-        for proj in data.get('projects'):
-            story.append(Paragraph(f"<b>{proj.get('name')}</b>", style_body))
-            for line in proj.get('description', '').split('\n'):
-                if line.strip():
-                    story.append(Paragraph(line.strip(), style_bullet))
-            story.append(Spacer(1, 6))
-
-    # Education
-    if data.get('education'):
-        story.append(Paragraph("EDUCATION", style_heading))
-        for edu in data.get('education'):
-            story.append(Paragraph(f"<b>{edu.get('institution')}</b>", style_body))
-            story.append(Paragraph(f"{edu.get('degree')} | {edu.get('year')}", style_body))
-            story.append(Spacer(1, 6))
-            
-    # Certifications
-    if data.get('certifications'):
-        story.append(Paragraph("CERTIFICATIONS", style_heading))
-        for cert in data.get('certifications'):
-            if cert.strip():
-                story.append(Paragraph(cert.strip(), style_bullet))
-
-    doc.build(story)
-    return output_path
+def params_to_txt(data, output_path):
+    return generate_resume(data, output_path, 'txt')
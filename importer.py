@@ -0,0 +1,290 @@
+"""
+Imports existing DOCX, PDF and TXT resumes back into resume dicts.
+
+The file is reduced to text lines (python-docx paragraphs, pdf_text for PDFs)
+and the lines are split into sections by their headings: the SECTION_ORDER
+titles plus the usual variants in SECTION_ALIASES ("Experience", "Profile",
+"Technical Skills", ...). The result has the same keys as
+ATSResumeApp._collect_data, so it can be loaded into the form, scored or
+rendered again:
+
+    data = import_file("jane_doe.pdf")
+    for result in import_directory("incoming/", workers=8): # {'id': path, 'resume': {...}}
+        ...
+
+    python importer.py incoming/ -o resumes.jsonl
+
+Names printed in capitals are title-cased on the way back ("JANE DOE" ->
+"Jane Doe"). Anything before the first heading is taken as the header (name,
+then contact details split on "|").
+"""
+import argparse
+import io
+import json
+import os
+import re
+import sys
+
+from constants import SECTION_ORDER
+from layout import BULLET_MARKERS
+from models import CONTACT_FIELDS, Education, Experience, Project, Resume
+
+FORMATS = ('docx', 'pdf', 'txt')
+
+# Other headings people use for each section, lower case without a trailing colon
+SECTION_ALIASES = {
+    "Contact": ("contact information", "contact details", "personal details"),
+    "Professional Summary": ("summary", "profile", "professional profile", "objective", "career objective",
+                             "about me", "about"),
+    "Skills": ("technical skills", "core competencies", "key skills", "skills & abilities", "skills and abilities",
+               "competencies", "expertise"),
+    "Work Experience": ("experience", "professional experience", "employment history", "work history",
+                        "employment", "career history", "relevant experience"),
+    "Projects": ("personal projects", "selected projects", "key projects", "project experience"),
+    "Education": ("academic background", "education & training", "education and training", "qualifications"),
+    "Certifications": ("certificates", "licenses & certifications", "licenses and certifications",
+                       "certifications & licenses", "courses"),
+}
+_HEADINGS = {title.lower(): title for title in SECTION_ORDER}
+_HEADINGS.update({alias: title for title, aliases in SECTION_ALIASES.items() for alias in aliases})
+
+_RULE_RE = re.compile(r"^[-=_~\s]{3,}$")                     # Underlines under headings in text files
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(\.[\w-]+)+")
+_PHONE_RE = re.compile(r"^\+?[\d\s().-]{7,}$")
+_DATE_SPLIT_RE = re.compile(r"\s*[–—]\s*|\s+(?:-|to)\s+") # "2019 - 2021", "2019–2021", "2019 to 2021"
+
+def heading_title(line):
+    """The SECTION_ORDER title a heading line stands for, or None"""
+    key = " ".join(line.strip().rstrip(":").split()).lower()
+    return _HEADINGS.get(key)
+
+def _bullet_text(line):
+    """The text of a bulleted line, or None if the line is not a bullet"""
+    stripped = line.strip()
+    if stripped[:1] in BULLET_MARKERS and (stripped[:1] == "•" or stripped[1:2] == " "):
+        return stripped[1:].strip()
+    return None
+
+def _split_detail(line):
+    """'Acme | Paris' -> ('Acme', 'Paris')"""
+    text, _, detail = line.partition("|")
+    return text.strip(), detail.strip()
+
+def _split_dates(text):
+    """'2019 - Present' -> ('2019', 'Present'); a lone date is the start date"""
+    parts = [part.strip() for part in _DATE_SPLIT_RE.split(text.strip(" -–—"), maxsplit=1)]
+    return (parts + [''])[:2]
+
+def _parse_header(lines, data):
+    lines = [line.strip() for line in lines if line.strip()]
+    if not lines:
+        return
+    name = lines[0]
+    data['full_name'] = name.title() if name.isupper() else name
+    for item in " ".join(lines[1:]).split("|"):
+        item = item.strip()
+        lower = item.lower()
+        if not item:
+            continue
+        if _EMAIL_RE.fullmatch(item):
+            data['email'] = data['email'] or item
+        elif "linkedin" in lower:
+            data['linkedin'] = data['linkedin'] or item
+        elif "github" in lower or lower.startswith(("http", "www.")) or re.match(r"^[\w-]+(\.[\w-]+)+/", lower):
+            data['github'] = data['github'] or item # The form's "GitHub/Portfolio" box
+        elif _PHONE_RE.match(item) and sum(c.isdigit() for c in item) >= 7:
+            data['phone'] = data['phone'] or item
+        elif not data['city']:
+            city, comma, country = item.rpartition(",")
+            data['city'], data['country'] = (city.strip(), country.strip()) if comma else (item, '')
+
+def _blocks(lines):
+    """
+    Groups section lines into entries: [[header line, ...], [bullet, ...]].
+    A bullet starts with a marker; an indented or wrapped line continues it.
+    """
+    entries = []
+    for line in lines:
+        if not line.strip():
+            continue
+        bullet = _bullet_text(line)
+        current = entries[-1] if entries else None
+        if bullet is not None:
+            if current is None:
+                current = [[], []]
+                entries.append(current)
+            current[1].append(bullet)
+        elif current and current[1] and line[:1].isspace():
+            current[1][-1] += " " + line.strip()
+        elif current is None or current[1] or len(current[0]) >= 2:
+            entries.append([[line.strip()], []])
+        else:
+            current[0].append(line.strip())
+    return entries
+
+def _experience(lines):
+    jobs = []
+    for headers, bullets in _blocks(lines):
+        company, location = _split_detail(headers[0]) if headers else ('', '')
+        title, dates = _split_detail(headers[1]) if len(headers) > 1 else ('', '')
+        start, end = _split_dates(dates) if dates else ('', '')
+        jobs.append(Experience(company, location, title, start, end, "\n".join(bullets)))
+    return tuple(jobs)
+
+def _projects(lines):
+    return tuple(Project(" ".join(headers), "\n".join(bullets)) for headers, bullets in _blocks(lines))
+
+def _education(lines):
+    schools = []
+    for headers, bullets in _blocks(lines):
+        institution = headers[0] if headers else ''
+        degree, year = _split_detail(headers[1]) if len(headers) > 1 else ('', '')
+        if bullets and not degree:
+            degree = bullets[0]
+        schools.append(Education(institution, degree, year))
+    return tuple(schools)
+
+def _list_items(lines):
+    items = []
+    for line in lines:
+        if not line.strip():
+            continue
+        bullet = _bullet_text(line)
+        if bullet is None and items and line[:1].isspace():
+            items[-1] += " " + line.strip()
+        else:
+            items.append(bullet if bullet is not None else line.strip())
+    return tuple(items)
+
+def _paragraph(lines):
+    return " ".join(line.strip() for line in lines if line.strip())
+
+def parse_lines(lines):
+    """Builds a resume dict from the text lines of a resume"""
+    header = []
+    sections = {}
+    current = None
+    for line in lines:
+        if _RULE_RE.match(line):
+            continue
+        title = heading_title(line)
+        if title:
+            current = sections.setdefault(title, [])
+        elif current is None:
+            header.append(line)
+        else:
+            current.append(line)
+
+    data = Resume().to_dict()
+    _parse_header(header + sections.get("Contact", []), data)
+    resume = Resume(
+        *(data[key] for key in CONTACT_FIELDS),
+        summary=_paragraph(sections.get("Professional Summary", [])),
+        skills=_paragraph(sections.get("Skills", [])),
+        experience=_experience(sections.get("Work Experience", [])),
+        projects=_projects(sections.get("Projects", [])),
+        education=_education(sections.get("Education", [])),
+        certifications=_list_items(sections.get("Certifications", [])),
+    )
+    return resume.to_dict()
+
+def _docx_lines(content):
+    from docx import Document
+    from docx.oxml.ns import qn
+
+    doc = Document(io.BytesIO(content))
+    # Style names by id, read once: paragraph.style rescans the whole style part per call
+    names = {}
+    for style in doc.styles.element.iterchildren(qn('w:style')):
+        name = style.find(qn('w:name'))
+        names[style.get(qn('w:styleId'))] = name.get(qn('w:val')) if name is not None else ''
+    lines = []
+    for p in doc.element.body.iter(qn('w:p')): # Body order, including table cells of two-column templates
+        ppr = p.pPr
+        style = names.get(ppr.style, '') if ppr is not None and ppr.style else ''
+        listed = "List" in style or ppr is not None and ppr.numPr is not None
+        text = "".join(t.text or '' if t.tag == qn('w:t') else "\n" if t.tag in (qn('w:br'), qn('w:cr')) else "\t"
+                       for t in p.iter(qn('w:t'), qn('w:br'), qn('w:cr'), qn('w:tab')))
+        for line in text.split("\n"):
+            lines.append(f"- {line}" if listed and line.strip() else line)
+    return lines
+
+def _pdf_lines(content):
+    import pdf_text
+    return pdf_text.extract_lines(content)
+
+def _txt_lines(content):
+    return content.decode('utf-8-sig', 'replace').splitlines()
+
+_READERS = {'docx': _docx_lines, 'pdf': _pdf_lines, 'txt': _txt_lines}
+
+def extract_lines(content, fmt):
+    """The text lines of a 'docx', 'pdf' or 'txt' resume, in reading order"""
+    reader = _READERS.get(fmt)
+    if reader is None:
+        raise ValueError(f"Unsupported import format: {fmt}")
+    return reader(content)
+
+def import_bytes(content, fmt):
+    """Parses the bytes of a 'docx', 'pdf' or 'txt' resume into a resume dict"""
+    lines = extract_lines(content, fmt)
+    if not any(line.strip() for line in lines):
+        raise ValueError("No text found (scanned, encrypted or empty file)")
+    return parse_lines(lines)
+
+def import_file(path):
+    """Parses a resume file, picking the format from its extension"""
+    fmt = os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt not in _READERS:
+        raise ValueError(f"Unsupported import format: {fmt or path}")
+    with open(path, 'rb') as f:
+        return import_bytes(f.read(), fmt)
+
+def import_record(path):
+    """
+    Imports one file for the bulk importer. Unreadable files are reported
+    in the result instead of stopping the batch.
+    """
+    try:
+        return {'id': path, 'resume': import_file(path)}
+    except Exception as e:
+        return {'id': path, 'error': f"{type(e).__name__}: {e}"}
+
+def iter_paths(source):
+    """Yields the importable files under a directory (recursively, in name order) or a single file"""
+    if not os.path.isdir(source):
+        yield source
+        return
+    for root, dirs, names in os.walk(source):
+        dirs.sort()
+        for name in sorted(names):
+            if os.path.splitext(name)[1].lstrip(".").lower() in FORMATS:
+                yield os.path.join(root, name)
+
+def import_directory(source, workers=None, chunksize=8):
+    """
+    Imports every DOCX, PDF and TXT file under source on all cores.
+    Yields result dicts ({'id': path, 'resume': ...} or {'id': path, 'error': ...})
+    in input order, i.e. sorted by path, whatever order the workers finish in.
+    """
+    from batch import imap_ordered
+    return imap_ordered(import_record, iter_paths(source), workers=workers, chunksize=chunksize)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import DOCX, PDF and TXT resumes into JSONL resume records.")
+    parser.add_argument("source", help="A resume file or a directory of them")
+    parser.add_argument("-o", "--output", default="-", help="Output JSONL path (default: stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--chunksize", type=int, default=8, help="Files sent to a worker at once")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for result in import_directory(args.source, workers=args.workers, chunksize=args.chunksize):
+            out.write(json.dumps(result) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Job-description keyword coverage with TF-IDF weights held in NumPy arrays.
+
+Term statistics (IDF weights) are computed once from a local corpus of job
+descriptions and saved next to the app:
+
+    python jd_match.py build postings/ -o jd_stats.npz
+    python jd_match.py compare resume.json posting.txt
+
+A resume and a posting are each turned into a sparse TF-IDF vector (sorted
+term ids plus weights), so a comparison is a sparse dot product.
+Without a saved corpus every term gets the same IDF weight.
+"""
+import argparse
+import functools
+import glob
+import json
+import math
+import os
+from collections import Counter, namedtuple
+
+import numpy as np
+
+from constants import JD_STATS_PATH
+from tokens import terms, resume_text
+
+# ids: sorted int64 term ids; weights: L2-normalized float64; terms: names aligned with ids
+SparseVector = namedtuple('SparseVector', ['ids', 'weights', 'terms'])
+Coverage = namedtuple('Coverage', ['score', 'similarity', 'missing'])
+
+class TermStats:
+    def __init__(self, vocabulary, idf, documents):
+        self.vocabulary = vocabulary # term -> id
+        self.idf = idf
+        self.documents = documents
+        # A term no posting in the corpus used is as rare as a term can be
+        self.unseen_idf = math.log(1 + documents) + 1.0
+
+    @classmethod
+    def from_documents(cls, documents):
+        """Computes document frequencies over an iterable of job description texts"""
+        df = Counter()
+        n = 0
+        for doc in documents:
+            df.update(set(terms(doc)))
+            n += 1
+        vocab = sorted(df)
+        counts = np.fromiter((df[t] for t in vocab), dtype=np.float64, count=len(vocab))
+        idf = np.log((1 + n) / (1 + counts)) + 1.0
+        return cls({t: i for i, t in enumerate(vocab)}, idf, n)
+
+    @classmethod
+    def from_directory(cls, path, pattern="*.txt"):
+        def read_all():
+            for file_path in sorted(glob.glob(os.path.join(path, pattern))):
+                with open(file_path, encoding='utf-8', errors='replace') as f:
+                    yield f.read()
+        return cls.from_documents(read_all())
+
+    def save(self, path):
+        vocab = sorted(self.vocabulary, key=self.vocabulary.get)
+        np.savez_compressed(path, terms=np.array(vocab, dtype=str), idf=self.idf,
+                            documents=np.array(self.documents))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as f:
+            vocab = f['terms'].tolist()
+            return cls({t: i for i, t in enumerate(vocab)}, f['idf'], int(f['documents']))
+
+    def vectorize(self, text, unseen=None):
+        """
+        Returns the L2-normalized sublinear TF-IDF SparseVector of a text.
+        Terms outside the corpus get ids above the vocabulary, numbered in
+        `unseen` (term -> id); pass the same dict for both sides of a
+        comparison so their ids line up.
+        """
+        if unseen is None:
+            unseen = {}
+        counts = Counter(terms(text))
+        size = len(counts)
+        ids = np.empty(size, dtype=np.int64)
+        weights = np.empty(size, dtype=np.float64)
+        names = list(counts)
+        for i, term in enumerate(names):
+            term_id = self.vocabulary.get(term)
+            if term_id is not None:
+                idf = self.idf[term_id]
+            else:
+                term_id = unseen.get(term)
+                if term_id is None:
+                    term_id = unseen[term] = len(self.vocabulary) + len(unseen)
+                idf = self.unseen_idf
+            ids[i] = term_id
+            weights[i] = (1.0 + math.log(counts[term])) * idf
+
+        order = np.argsort(ids, kind='stable')
+        ids, weights = ids[order], weights[order]
+        norm = np.linalg.norm(weights)
+        if norm:
+            weights /= norm
+        return SparseVector(ids, weights, [names[i] for i in order])
+
+@functools.lru_cache(maxsize=1)
+def default_stats():
+    """Loads JD_STATS_PATH if it has been built, otherwise uses uniform weights"""
+    if os.path.exists(JD_STATS_PATH):
+        return TermStats.load(JD_STATS_PATH)
+    return TermStats.from_documents([])
+
+def compare(resume_vector, job_vector, limit=10):
+    """
+    Scores a resume vector against a job vector.
+    score: share of the posting's term weight the resume covers (0..1)
+    similarity: cosine similarity of the two vectors
+    missing: the heaviest posting terms absent from the resume
+    """
+    _, r_idx, j_idx = np.intersect1d(resume_vector.ids, job_vector.ids,
+                                     assume_unique=True, return_indices=True)
+    similarity = float(resume_vector.weights[r_idx] @ job_vector.weights[j_idx])
+
+    total = job_vector.weights.sum()
+    coverage = float(job_vector.weights[j_idx].sum() / total) if total else 1.0
+
+    absent = np.ones(len(job_vector.ids), dtype=bool)
+    absent[j_idx] = False
+    absent_idx = np.flatnonzero(absent)
+    ranked = absent_idx[np.argsort(-job_vector.weights[absent_idx], kind='stable')]
+    missing = [job_vector.terms[i] for i in ranked[:limit]]
+    return Coverage(coverage, similarity, missing)
+
+def score_job_match(resume, job_description, stats=None, limit=10):
+    """Compares a resume (dict or Resume) to a job description text"""
+    stats = stats or default_stats()
+    unseen = {} # Per comparison: the shared stats object never grows
+    return compare(stats.vectorize(resume_text(resume), unseen), stats.vectorize(job_description, unseen), limit)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Job description keyword coverage.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Precompute term statistics from a corpus of .txt postings")
+    build.add_argument("corpus", help="Directory of job description .txt files")
+    build.add_argument("-o", "--output", default=JD_STATS_PATH)
+
+    cmp_ = sub.add_parser("compare", help="Score one resume JSON against one posting")
+    cmp_.add_argument("resume", help="Resume dict as JSON")
+    cmp_.add_argument("posting", help="Job description text file")
+    cmp_.add_argument("--stats", default=None, help="Saved term statistics (.npz)")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        stats = TermStats.from_directory(args.corpus)
+        stats.save(args.output)
+        print(f"Indexed {stats.documents} postings, {len(stats.vocabulary)} terms -> {args.output}")
+        return
+
+    with open(args.resume, encoding='utf-8') as f:
+        resume = json.load(f)
+    with open(args.posting, encoding='utf-8') as f:
+        posting = f.read()
+    stats = TermStats.load(args.stats) if args.stats else None
+    result = score_job_match(resume, posting, stats)
+    print(json.dumps(result._asdict(), indent=2))
+
+if __name__ == "__main__":
+    main()
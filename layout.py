@@ -0,0 +1,132 @@
+"""
+Normalized resume layout shared by the DOCX, PDF and TXT renderers.
+
+The raw resume dict is walked once: bullets are split and cleaned, contact
+details are ordered and the sections are laid out in SECTION_ORDER. Each
+renderer then only decides how a ResumeLayout looks in its format.
+"""
+import re
+from dataclasses import dataclass, field
+
+from constants import SECTION_ORDER
+from models import as_resume_dict
+
+# Leading markers users type into bullet boxes; the renderers add their own
+BULLET_MARKERS = "•-*–·"
+# "•" is never content; the others only mark a bullet when followed by a space ("-20% latency" keeps its sign)
+_MARKER_RE = re.compile(r"^(?:•\s*|[-*–·](?:\s+|$))")
+
+@dataclass
+class Entry:
+    """One job, project or school: a bold heading line, an optional second line and bullets"""
+    heading: str
+    heading_detail: str = ''
+    subheading: str = ''
+    subheading_detail: str = ''
+    italic_subheading: bool = False
+    bullets: list = field(default_factory=list)
+
+@dataclass
+class Section:
+    """A titled block holding a paragraph, a list of entries or plain bullets"""
+    title: str
+    text: str = ''
+    entries: list = field(default_factory=list)
+    bullets: list = field(default_factory=list)
+
+@dataclass
+class ResumeLayout:
+    name: str
+    contact: list
+    sections: list
+
+def split_bullets(text):
+    """Splits a multi-line field into clean bullet strings"""
+    bullets = []
+    for line in (text or '').split('\n'):
+        line = line.strip()
+        if line and line[0] in BULLET_MARKERS: # Most lines have no marker; skip the regex for them
+            line = _MARKER_RE.sub('', line).strip()
+        if line:
+            bullets.append(line)
+    return bullets
+
+def _joined(*parts, sep=" - "):
+    return sep.join(parts) if any(parts) else ''
+
+def _contact_items(data):
+    items = []
+    if data.get('city') or data.get('country'):
+        items.append(", ".join(p for p in (data.get('city', ''), data.get('country', '')) if p))
+    for key in ('phone', 'email', 'linkedin', 'github'):
+        if data.get(key):
+            items.append(data[key])
+    return items
+
+def _summary(data):
+    if data.get('summary'):
+        return Section("Professional Summary", text=data['summary'])
+
+def _skills(data):
+    if data.get('skills'):
+        return Section("Skills", text=data['skills'])
+
+def _experience(data):
+    entries = [
+        Entry(
+            heading=exp.get('company', ''),
+            heading_detail=exp.get('location', ''),
+            subheading=exp.get('title', ''),
+            subheading_detail=_joined(exp.get('start_date', ''), exp.get('end_date', '')),
+            italic_subheading=True,
+            bullets=split_bullets(exp.get('responsibilities', '')),
+        )
+        for exp in data.get('experience') or []
+    ]
+    if entries:
+        return Section("Work Experience", entries=entries)
+
+def _projects(data):
+    entries = [
+        Entry(heading=proj.get('name', ''), bullets=split_bullets(proj.get('description', '')))
+        for proj in data.get('projects') or []
+    ]
+    if entries:
+        return Section("Projects", entries=entries)
+
+def _education(data):
+    entries = [
+        Entry(
+            heading=edu.get('institution', ''),
+            subheading=edu.get('degree', ''),
+            subheading_detail=edu.get('year', ''),
+        )
+        for edu in data.get('education') or []
+    ]
+    if entries:
+        return Section("Education", entries=entries)
+
+def _certifications(data):
+    certs = [c.strip() for c in data.get('certifications') or [] if c.strip()]
+    if certs:
+        return Section("Certifications", bullets=certs)
+
+_SECTION_BUILDERS = {
+    "Professional Summary": _summary,
+    "Skills": _skills,
+    "Work Experience": _experience,
+    "Projects": _projects,
+    "Education": _education,
+    "Certifications": _certifications,
+}
+
+def build_layout(data):
+    """Builds the ResumeLayout for a resume dict (as produced by _collect_data) or a Resume"""
+    data = as_resume_dict(data)
+    sections = []
+    for title in SECTION_ORDER:
+        builder = _SECTION_BUILDERS.get(title)
+        section = builder(data) if builder else None
+        if section is not None:
+            sections.append(section)
+    return ResumeLayout(name=data.get('full_name', ''), contact=_contact_items(data), sections=sections)
@@ -3,10 +3,66 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import tkinter.scrolledtext as scrolledtext
 import os
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
-from constants import ROLE_KEYWORDS, ACTION_VERBS
+from constants import ACTION_VERBS
 import ats_logic
 import generator
+import importer
+from layout import split_bullets
+from render_cache import RenderCache
+
+LIVE_SCORE_DELAY_MS = 400 # Quiet period after the last edit before re-scoring
+LIVE_SCORE_POLL_MS = 50
+EXPORT_WORKERS = 3 # One per format, so "Export all" renders them side by side
+EXPORT_POLL_MS = 100
+SCROLL_REGION_DELAY_MS = 50 # Bursts of <Configure> events share one scroll-region update
+MAX_EXPANDED_ENTRIES = 3 # Open editors per section; opening another collapses the oldest
+SUMMARY_CHARS = 90
+EXPORT_FILE_TYPES = {
+    'docx': [("Word Document", "*.docx")],
+    'pdf': [("PDF Document", "*.pdf")],
+    'txt': [("Text File", "*.txt")],
+}
+IMPORT_FILE_TYPES = [("Resume", " ".join(f"*.{fmt}" for fmt in importer.FORMATS))]
+
+# Editor layout per section: rows of (caption, key, entry width), then the bullets box (caption, key, height)
+EXPERIENCE_FIELDS = [
+    [("Company:", 'company', 25), ("Location:", 'location', 20)],
+    [("Title:", 'title', 25), ("Start:", 'start_date', 10), ("End:", 'end_date', 10)],
+]
+EXPERIENCE_TEXT = ("Responsibilities (Bullets):", 'responsibilities', 4)
+PROJECT_FIELDS = [[("Project Name:", 'name', 40)]]
+PROJECT_TEXT = ("Description (Bullets):", 'description', 3)
+EDUCATION_FIELDS = [[("School:", 'institution', 25), ("Degree:", 'degree', 25), ("Year:", 'year', 10)]]
+
+def build_preview(data):
+    """Builds the plain text preview shown in the sidebar"""
+    preview_str = f"--- START PREVIEW ---\n"
+    preview_str += f"NAME: {data.get('full_name')}\n"
+    preview_str += f"SUMMARY: {data.get('summary')}\n"
+    preview_str += f"SKILLS: {data.get('skills')}\n"
+    preview_str += f"\n[EXPERIENCE]:\n"
+    for exp in data.get('experience', []):
+        preview_str += f"* {exp.get('title')} at {exp.get('company')}\n"
+    preview_str += f"--- END PREVIEW ---\n"
+    return preview_str
+
+def score_and_preview(data):
+    """Runs on the scoring worker; must not touch any Tk widget"""
+    score, feedback = ats_logic.calculate_ats_score(data)
+    return score, feedback, build_preview(data)
+
+def entry_summary(values, text_key=None):
+    """One line for a collapsed job, project or school: its short fields, then the bullet count"""
+    summary = " | ".join(value.strip() for key, value in values.items() if key != text_key and value.strip()) or "(empty)"
+    if len(summary) > SUMMARY_CHARS:
+        summary = summary[:SUMMARY_CHARS - 3] + "..."
+    if text_key:
+        bullets = len(split_bullets(values.get(text_key)))
+        summary += f" ({bullets} bullet{'' if bullets == 1 else 's'})"
+    return summary
 
 class ScrollableFrame(ttk.Frame):
     def __init__(self, container, *args, **kwargs):
@@ -14,13 +70,10 @@ class ScrollableFrame(ttk.Frame):
         canvas = tk.Canvas(self)
         scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
         self.scrollable_frame = ttk.Frame(canvas)
+        self._scroll_job = None
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(
-                scrollregion=canvas.bbox("all")
-            )
-        )
+        # Every widget added to the form resizes the frame; coalesce the updates
+        self.scrollable_frame.bind("<Configure>", self._schedule_scroll_region)
 
         canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -29,16 +82,174 @@ class ScrollableFrame(ttk.Frame):
         scrollbar.pack(side="right", fill="y")
         self.canvas = canvas
 
+    def _schedule_scroll_region(self, event=None):
+        if self._scroll_job is None:
+            self._scroll_job = self.after(SCROLL_REGION_DELAY_MS, self._update_scroll_region)
+
+    def _update_scroll_region(self):
+        self._scroll_job = None
+        # The frame's requested size is the scrolled area; no need for bbox("all")
+        frame = self.scrollable_frame
+        self.canvas.configure(scrollregion=(0, 0, frame.winfo_reqwidth(), frame.winfo_reqheight()))
+
+class _Entry:
+    __slots__ = ('row', 'toggle', 'values', 'editor')
+
+    def __init__(self, row, toggle, values):
+        self.row = row
+        self.toggle = toggle
+        self.values = values # Saved while collapsed
+        self.editor = None   # (frame, widgets by key) while expanded
+
+class EntrySection(ttk.Frame):
+    """
+    A list of jobs, projects or schools that stays light with dozens of entries.
+    Each entry is a one-line summary row; the editor widgets are only built for
+    the few entries that are expanded (at most MAX_EXPANDED_ENTRIES), and a
+    collapsed editor is kept and reused for the next entry opened.
+    """
+    def __init__(self, container, label, fields, text_field=None, on_change=None):
+        super().__init__(container)
+        self.label = label
+        self.fields = fields
+        self.text_field = text_field
+        self.on_change = on_change
+        self.keys = [key for row in fields for _, key, _ in row] + ([text_field[1]] if text_field else [])
+        self._entries = []
+        self._open = []  # Expanded entries, least recently opened first
+        self._spare = [] # Editors of collapsed entries, ready for reuse
+        ttk.Style(self).configure("Summary.TButton", anchor="w")
+
+    def add(self, values=None, expand=True):
+        row = ttk.Frame(self)
+        row.pack(fill="x", pady=2)
+        header = ttk.Frame(row)
+        header.pack(fill="x")
+        toggle = ttk.Button(header, style="Summary.TButton")
+        toggle.pack(side=tk.LEFT, fill="x", expand=True)
+        entry = _Entry(row, toggle, {key: (values or {}).get(key, '') for key in self.keys})
+        toggle.config(command=lambda: self.collapse(entry) if entry.editor else self.expand(entry))
+        ttk.Button(header, text="Remove", command=lambda: self.remove(entry)).pack(side=tk.RIGHT, padx=5)
+        self._entries.append(entry)
+        if expand:
+            self.expand(entry)
+        else:
+            self._set_header(entry, len(self._entries))
+        self._changed()
+        return entry
+
+    def expand(self, entry):
+        if entry.editor:
+            return
+        while len(self._open) >= MAX_EXPANDED_ENTRIES:
+            self.collapse(self._open[0])
+        frame, widgets = self._spare.pop() if self._spare else self._build_editor()
+        for key, widget in widgets.items():
+            if isinstance(widget, tk.Text):
+                widget.delete("1.0", tk.END)
+                widget.insert("1.0", entry.values[key])
+            else:
+                widget.delete(0, tk.END)
+                widget.insert(0, entry.values[key])
+        frame.pack(in_=entry.row, fill="x", padx=5)
+        frame.lift(entry.row) # A reused editor was created before this row and would draw beneath it
+        entry.editor = (frame, widgets)
+        self._open.append(entry)
+        self._set_header(entry, self._entries.index(entry) + 1)
+
+    def collapse(self, entry):
+        if not entry.editor:
+            return
+        entry.values = self._read(entry.editor[1])
+        self._release(entry)
+        self._set_header(entry, self._entries.index(entry) + 1)
+
+    def load(self, entries):
+        """Replaces the entries with `entries` (dicts), all collapsed, so an imported resume with dozens stays light"""
+        for entry in self._entries:
+            if entry.editor:
+                self._release(entry)
+            entry.row.destroy()
+        self._entries = []
+        for values in entries:
+            self.add(values, expand=False)
+        self._changed()
+
+    def remove(self, entry):
+        if entry.editor:
+            self._release(entry)
+        entry.row.destroy()
+        self._entries.remove(entry)
+        for number, other in enumerate(self._entries, start=1):
+            self._set_header(other, number)
+        self._changed()
+
+    def values(self):
+        """One dict per entry, in order, read from the open editors or the saved values"""
+        return [self._read(entry.editor[1]) if entry.editor else dict(entry.values) for entry in self._entries]
+
+    def _build_editor(self):
+        frame = ttk.Frame(self)
+        widgets = {}
+        for fields in self.fields:
+            line = ttk.Frame(frame)
+            line.pack(fill="x", pady=2)
+            for caption, key, width in fields:
+                ttk.Label(line, text=caption).pack(side=tk.LEFT)
+                widgets[key] = ttk.Entry(line, width=width)
+                widgets[key].pack(side=tk.LEFT, padx=5)
+        if self.text_field:
+            caption, key, height = self.text_field
+            ttk.Label(frame, text=caption).pack(anchor="w")
+            widgets[key] = scrolledtext.ScrolledText(frame, height=height, width=70)
+            widgets[key].pack(fill="x", padx=5, pady=2)
+        return frame, widgets
+
+    def _read(self, widgets):
+        return {key: widget.get("1.0", tk.END).strip() if isinstance(widget, tk.Text) else widget.get()
+                for key, widget in widgets.items()}
+
+    def _release(self, entry):
+        entry.editor[0].pack_forget()
+        self._spare.append(entry.editor)
+        entry.editor = None
+        self._open.remove(entry)
+
+    def _set_header(self, entry, number):
+        if entry.editor:
+            entry.toggle.config(text=f"▾ {self.label} {number}")
+        else:
+            text_key = self.text_field[1] if self.text_field else None
+            entry.toggle.config(text=f"▸ {self.label} {number}: {entry_summary(entry.values, text_key)}")
+
+    def _changed(self):
+        if self.on_change:
+            self.on_change()
+
 class ATSResumeApp(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("ATS-Friendly Resume Generator (100% Parsable)")
         self.geometry("1400x900")
         
-        # Data containers
-        self.experience_frames = []
-        self.project_frames = []
-        self.education_frames = []
+        # Live scoring: edits are debounced, scored on a worker thread and
+        # applied back on the Tk thread by polling with after()
+        self.live_score_var = tk.BooleanVar(value=True)
+        self._score_executor = ThreadPoolExecutor(max_workers=1)
+        self._live_job = None
+        self._score_generation = 0
+
+        # Exports render in a process pool so a ReportLab build never blocks Tk;
+        # the files are written here on the Tk thread, so Cancel stops them all
+        self._export_pool = None
+        self._export_jobs = [] # (fmt, path, future)
+        self._export_settled = [] # Futures of the current export already handled
+        self._export_written = [] # Their paths that were written
+        self._export_failed = []
+        self._export_generation = 0 # Bumped per export and on Cancel, so a stale poll stops
+        # Re-exporting unchanged data is served from the cache's disk tier,
+        # which the export processes share
+        self._render_cache = RenderCache.default()
 
         # Paned Window
         self.paned_window = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
@@ -62,6 +273,18 @@ class ATSResumeApp(tk.Tk):
         # Mousewheel scroll support
         self.bind_all("<MouseWheel>", self._on_mousewheel)
 
+        # Any key typed into the form schedules a live score update
+        self.bind_all("<KeyRelease>", self._schedule_live_score, add="+")
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        if self._live_job is not None:
+            self.after_cancel(self._live_job)
+        self._score_executor.shutdown(wait=False, cancel_futures=True)
+        if self._export_pool is not None:
+            self._export_pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
     def _on_mousewheel(self, event):
         self.form_container.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
@@ -74,9 +297,11 @@ class ATSResumeApp(tk.Tk):
         
         ttk.Label(target_frame, text="Target Role:").pack(side=tk.LEFT)
         self.role_var = tk.StringVar()
-        self.role_combo = ttk.Combobox(target_frame, textvariable=self.role_var, values=list(ROLE_KEYWORDS.keys()))
+        self.role_combo = ttk.Combobox(target_frame, textvariable=self.role_var, values=ats_logic.ROLE_INDEX.complete(""))
         self.role_combo.pack(side=tk.LEFT, padx=5)
         self.role_combo.bind("<<ComboboxSelected>>", self._update_suggestions)
+        self.role_combo.bind("<KeyRelease>", self._autocomplete_role)
+        self.role_combo.bind("<Return>", self._update_suggestions)
         
         ttk.Button(target_frame, text="Inject Keywords to Skills", command=self._inject_keywords).pack(side=tk.LEFT, padx=10)
 
@@ -108,24 +333,27 @@ class ATSResumeApp(tk.Tk):
         self.skills_text = scrolledtext.ScrolledText(self.form_frame, height=3, width=80)
         self.skills_text.grid(row=7, column=0, padx=10, pady=5)
         
-        # 5. Work Experience (Dynamic)
+        # 5. Work Experience (Dynamic; collapsed entries are one-line summaries)
         self._add_section_header("Step 4: Work Experience", 8)
-        self.exp_container = ttk.Frame(self.form_frame)
-        self.exp_container.grid(row=9, column=0, sticky="ew", padx=10)
+        self.exp_section = EntrySection(self.form_frame, "Job", EXPERIENCE_FIELDS, EXPERIENCE_TEXT,
+                                        on_change=self._schedule_live_score)
+        self.exp_section.grid(row=9, column=0, sticky="ew", padx=10)
         ttk.Button(self.form_frame, text="+ Add Job", command=self._add_experience).grid(row=10, column=0, pady=5)
         self._add_experience() # Add one default
 
         # 6. Projects (Dynamic)
         self._add_section_header("Step 5: Projects", 11)
-        self.proj_container = ttk.Frame(self.form_frame)
-        self.proj_container.grid(row=12, column=0, sticky="ew", padx=10)
+        self.proj_section = EntrySection(self.form_frame, "Project", PROJECT_FIELDS, PROJECT_TEXT,
+                                         on_change=self._schedule_live_score)
+        self.proj_section.grid(row=12, column=0, sticky="ew", padx=10)
         ttk.Button(self.form_frame, text="+ Add Project", command=self._add_project).grid(row=13, column=0, pady=5)
         # self._add_project() 
         
         # 7. Education (Dynamic)
         self._add_section_header("Step 6: Education", 14)
-        self.edu_container = ttk.Frame(self.form_frame)
-        self.edu_container.grid(row=15, column=0, sticky="ew", padx=10)
+        self.edu_section = EntrySection(self.form_frame, "Education", EDUCATION_FIELDS,
+                                        on_change=self._schedule_live_score)
+        self.edu_section.grid(row=15, column=0, sticky="ew", padx=10)
         ttk.Button(self.form_frame, text="+ Add Education", command=self._add_education).grid(row=16, column=0, pady=5)
         self._add_education()
 
@@ -139,111 +367,13 @@ class ATSResumeApp(tk.Tk):
         lbl.grid(row=row, column=0, sticky="ew", padx=5, pady=(15, 5))
 
     def _add_experience(self):
-        # A frame for one job
-        frame = ttk.LabelFrame(self.exp_container, text=f"Job {len(self.experience_frames)+1}")
-        frame.pack(fill="x", pady=5)
-        
-        entries = {}
-        # Line 1: Company, Location
-        f1 = ttk.Frame(frame)
-        f1.pack(fill="x")
-        ttk.Label(f1, text="Company:").pack(side=tk.LEFT)
-        e_comp = ttk.Entry(f1, width=25)
-        e_comp.pack(side=tk.LEFT, padx=5)
-        entries['company'] = e_comp
-        
-        ttk.Label(f1, text="Location:").pack(side=tk.LEFT)
-        e_loc = ttk.Entry(f1, width=20)
-        e_loc.pack(side=tk.LEFT, padx=5)
-        entries['location'] = e_loc
-        
-        # Line 2: Title, Dates (Start - End)
-        f2 = ttk.Frame(frame)
-        f2.pack(fill="x", pady=2)
-        ttk.Label(f2, text="Title:").pack(side=tk.LEFT)
-        e_title = ttk.Entry(f2, width=25)
-        e_title.pack(side=tk.LEFT, padx=5)
-        entries['title'] = e_title
-        
-        ttk.Label(f2, text="Start:").pack(side=tk.LEFT)
-        e_start = ttk.Entry(f2, width=10)
-        e_start.pack(side=tk.LEFT, padx=2)
-        entries['start_date'] = e_start
-
-        ttk.Label(f2, text="End:").pack(side=tk.LEFT)
-        e_end = ttk.Entry(f2, width=10)
-        e_end.pack(side=tk.LEFT, padx=2)
-        entries['end_date'] = e_end
-        
-        # Line 3: Description (Bullets)
-        ttk.Label(frame, text="Responsibilities (Bullets):").pack(anchor="w")
-        t_resp = scrolledtext.ScrolledText(frame, height=4, width=70)
-        t_resp.pack(fill="x", padx=5, pady=2)
-        entries['responsibilities'] = t_resp
-        
-        # Delete Button
-        btn_del = ttk.Button(frame, text="Remove Job", command=lambda f=frame: self._remove_frame(f, self.experience_frames))
-        btn_del.pack(anchor="e")
-
-        self.experience_frames.append((frame, entries))
+        self.exp_section.add()
 
     def _add_project(self):
-        frame = ttk.LabelFrame(self.proj_container, text=f"Project {len(self.project_frames)+1}")
-        frame.pack(fill="x", pady=5)
-        
-        entries = {}
-        f1 = ttk.Frame(frame)
-        f1.pack(fill="x")
-        ttk.Label(f1, text="Project Name:").pack(side=tk.LEFT)
-        e_name = ttk.Entry(f1, width=40)
-        e_name.pack(side=tk.LEFT, padx=5)
-        entries['name'] = e_name
-        
-        ttk.Label(frame, text="Description (Bullets):").pack(anchor="w")
-        t_desc = scrolledtext.ScrolledText(frame, height=3, width=70)
-        t_desc.pack(fill="x", padx=5, pady=2)
-        entries['description'] = t_desc
-        
-        btn_del = ttk.Button(frame, text="Remove Project", command=lambda f=frame: self._remove_frame(f, self.project_frames))
-        btn_del.pack(anchor="e")
-
-        self.project_frames.append((frame, entries))
+        self.proj_section.add()
 
     def _add_education(self):
-        frame = ttk.LabelFrame(self.edu_container, text=f"Education {len(self.education_frames)+1}")
-        frame.pack(fill="x", pady=5)
-        
-        entries = {}
-        f1 = ttk.Frame(frame)
-        f1.pack(fill="x")
-        ttk.Label(f1, text="School:").pack(side=tk.LEFT)
-        e_school = ttk.Entry(f1, width=25)
-        e_school.pack(side=tk.LEFT, padx=5)
-        entries['institution'] = e_school
-        
-        ttk.Label(f1, text="Degree:").pack(side=tk.LEFT)
-        e_deg = ttk.Entry(f1, width=25)
-        e_deg.pack(side=tk.LEFT, padx=5)
-        entries['degree'] = e_deg
-        
-        ttk.Label(f1, text="Year:").pack(side=tk.LEFT)
-        e_year = ttk.Entry(f1, width=10)
-        e_year.pack(side=tk.LEFT, padx=5)
-        entries['year'] = e_year
-        
-        btn_del = ttk.Button(frame, text="Remove", command=lambda f=frame: self._remove_frame(f, self.education_frames))
-        btn_del.pack(anchor="e")
-
-        self.education_frames.append((frame, entries))
-
-    def _remove_frame(self, frame, list_ref):
-        frame.destroy()
-        # Filter out destroyed frames from the list tuple
-        # This is a bit tricky since we stored (frame, entries), so we need to find the index
-        for i, (f, _) in enumerate(list_ref):
-            if f == frame:
-                list_ref.pop(i)
-                break
+        self.edu_section.add()
     
     def _build_sidebar(self):
         # Stats & Checks
@@ -260,10 +390,24 @@ class ATSResumeApp(tk.Tk):
         btn_frame = ttk.Frame(self.right_frame)
         btn_frame.pack(fill="x", padx=10, pady=5)
         
+        ttk.Button(btn_frame, text="Import Resume (DOCX/PDF/TXT)...", command=self._import_resume).pack(fill="x", pady=2)
         ttk.Button(btn_frame, text="Check Score & Preview", command=self._update_preview).pack(fill="x", pady=5)
+        ttk.Checkbutton(btn_frame, text="Live score while typing", variable=self.live_score_var,
+                        command=self._schedule_live_score).pack(anchor="w")
         ttk.Button(btn_frame, text="Export to DOCX", command=lambda: self._export("docx")).pack(fill="x", pady=2)
         ttk.Button(btn_frame, text="Export to PDF (Plain)", command=lambda: self._export("pdf")).pack(fill="x", pady=2)
         ttk.Button(btn_frame, text="Export to TXT", command=lambda: self._export("txt")).pack(fill="x", pady=2)
+        ttk.Button(btn_frame, text="Export All Formats (DOCX + PDF + TXT)", command=self._export_all).pack(fill="x", pady=2)
+
+        # Export progress
+        export_frame = ttk.Frame(btn_frame)
+        export_frame.pack(fill="x", pady=2)
+        self.export_progress = ttk.Progressbar(export_frame, mode="determinate")
+        self.export_progress.pack(side=tk.LEFT, fill="x", expand=True)
+        self.export_cancel_btn = ttk.Button(export_frame, text="Cancel", command=self._cancel_export, state=tk.DISABLED)
+        self.export_cancel_btn.pack(side=tk.LEFT, padx=5)
+        self.export_status = ttk.Label(btn_frame, text="")
+        self.export_status.pack(anchor="w")
 
         # Keyword Suggestions
         kw_frame = ttk.LabelFrame(self.right_frame, text="Suggested Keywords for Role")
@@ -284,25 +428,13 @@ class ATSResumeApp(tk.Tk):
         data['skills'] = self.skills_text.get("1.0", tk.END).strip()
         
         # Experience
-        data['experience'] = []
-        for _, entries in self.experience_frames:
-            job = {k: v.get("1.0", tk.END).strip() if isinstance(v, tk.Text) else v.get() for k, v in entries.items()}
-            if job.get('company') or job.get('title'):
-                data['experience'].append(job)
+        data['experience'] = [job for job in self.exp_section.values() if job.get('company') or job.get('title')]
 
         # Projects
-        data['projects'] = []
-        for _, entries in self.project_frames:
-            proj = {k: v.get("1.0", tk.END).strip() if isinstance(v, tk.Text) else v.get() for k, v in entries.items()}
-            if proj.get('name'):
-                data['projects'].append(proj)
+        data['projects'] = [proj for proj in self.proj_section.values() if proj.get('name')]
 
         # Education
-        data['education'] = []
-        for _, entries in self.education_frames:
-            edu = {k: v.get() for k, v in entries.items()}
-            if edu.get('institution'):
-                data['education'].append(edu)
+        data['education'] = [edu for edu in self.edu_section.values() if edu.get('institution')]
 
         # Certifications
         certs = self.cert_text.get("1.0", tk.END).strip().split('\n')
@@ -310,6 +442,34 @@ class ATSResumeApp(tk.Tk):
 
         return data
 
+    def _import_resume(self):
+        path = filedialog.askopenfilename(title="Import resume", filetypes=IMPORT_FILE_TYPES)
+        if not path:
+            return
+        try:
+            data = importer.import_file(path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not import {os.path.basename(path)}:\n{e}")
+            return
+        self._fill_form(data)
+
+    def _fill_form(self, data):
+        """Replaces the form's contents with a resume dict, the inverse of _collect_data"""
+        for key, entry in self.entries.items():
+            entry.delete(0, tk.END)
+            entry.insert(0, data.get(key, ''))
+        for widget, text in ((self.summary_text, data.get('summary', '')), (self.skills_text, data.get('skills', '')),
+                             (self.cert_text, "\n".join(data.get('certifications', [])))):
+            widget.delete("1.0", tk.END)
+            widget.insert("1.0", text)
+        self.exp_section.load(data.get('experience', []))
+        self.proj_section.load(data.get('projects', []))
+        self.edu_section.load(data.get('education', []))
+
+    def _autocomplete_role(self, event=None):
+        # Offer matching roles and aliases from the index as the user types
+        self.role_combo['values'] = ats_logic.ROLE_INDEX.complete(self.role_var.get())
+
     def _update_suggestions(self, event=None):
         role = self.role_var.get()
         keywords = ats_logic.get_role_keywords(role)
@@ -333,33 +493,52 @@ class ATSResumeApp(tk.Tk):
                 self.skills_text.insert(tk.END, ", " + ", ".join(new_keywords))
             else:
                 self.skills_text.insert(tk.END, ", ".join(new_keywords))
+            self._schedule_live_score()
             messagebox.showinfo("Injected", f"Added {len(new_keywords)} keywords for {role}.")
         else:
             messagebox.showinfo("Info", "Keywords already present.")
 
     def _update_preview(self):
+        if self._live_job is not None:
+            self.after_cancel(self._live_job)
+        self._run_live_score()
+
+    def _schedule_live_score(self, event=None):
+        """Debounces form edits: scoring starts once typing pauses"""
+        if not self.live_score_var.get():
+            return
+        # Ignore keys typed outside the form (e.g. in the preview pane)
+        if event is not None and not str(event.widget).startswith(str(self.form_frame)):
+            return
+        if self._live_job is not None:
+            self.after_cancel(self._live_job)
+        self._live_job = self.after(LIVE_SCORE_DELAY_MS, self._run_live_score)
+
+    def _run_live_score(self):
+        self._live_job = None
+        # Widgets can only be read on the Tk thread; the scoring itself is not
         data = self._collect_data()
-        
-        # Score
-        score, feedback = ats_logic.calculate_ats_score(data)
+        self._score_generation += 1
+        future = self._score_executor.submit(score_and_preview, data)
+        self._poll_score(future, self._score_generation)
+
+    def _poll_score(self, future, generation):
+        if not future.done():
+            self.after(LIVE_SCORE_POLL_MS, self._poll_score, future, generation)
+            return
+        if generation != self._score_generation or future.cancelled():
+            return # A newer edit superseded this result
+        try:
+            score, feedback, preview_str = future.result()
+        except Exception as e:
+            self.score_label.config(text=f"ATS Score: error ({e})", foreground="red")
+            return
+
         self.score_label.config(text=f"ATS Score: {score} / 100", foreground="green" if score > 80 else "red")
         
         self.feedback_list.delete(0, tk.END)
         for item in feedback:
             self.feedback_list.insert(tk.END, item)
-            
-        # Preview Text
-        # Generate a temp txt file content in memory to show
-        # We can reuse the logic in generator but we want string return
-        # Let's just create a quick preview string
-        preview_str = f"--- START PREVIEW ---\n"
-        preview_str += f"NAME: {data.get('full_name')}\n"
-        preview_str += f"SUMMARY: {data.get('summary')}\n"
-        preview_str += f"SKILLS: {data.get('skills')}\n"
-        preview_str += f"\n[EXPERIENCE]:\n"
-        for exp in data.get('experience', []):
-            preview_str += f"* {exp.get('title')} at {exp.get('company')}\n"
-        preview_str += f"--- END PREVIEW ---\n"
         
         self.preview_text.delete("1.0", tk.END)
         self.preview_text.insert(tk.END, preview_str)
@@ -370,19 +549,94 @@ class ATSResumeApp(tk.Tk):
         if not data.get('full_name'):
             messagebox.showerror("Error", "Full Name is required.")
             return
-            
-        file_types = []
-        if fmt == 'docx': file_types = [("Word Document", "*.docx")]
-        elif fmt == 'pdf': file_types = [("PDF Document", "*.pdf")]
-        else: file_types = [("Text File", "*.txt")]
 
-        path = filedialog.asksaveasfilename(defaultextension=f".{fmt}", filetypes=file_types)
+        path = filedialog.asksaveasfilename(defaultextension=f".{fmt}", filetypes=EXPORT_FILE_TYPES[fmt])
+        if path:
+            self._start_export(data, [(fmt, path)])
+
+    def _export_all(self):
+        data = self._collect_data()
+        if not data.get('full_name'):
+            messagebox.showerror("Error", "Full Name is required.")
+            return
+
+        # One base name; each format gets its own extension
+        path = filedialog.asksaveasfilename(title="Export all formats (base file name)")
         if path:
-            try:
-                generator.generate_resume(data, path, fmt)
-                messagebox.showinfo("Success", f"Saved to {path}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save: {e}")
+            base = os.path.splitext(path)[0]
+            self._start_export(data, [(fmt, f"{base}.{fmt}") for fmt in EXPORT_FILE_TYPES])
+
+    def _get_export_pool(self):
+        if self._export_pool is None:
+            # spawn: never fork a process that holds a Tk/X connection
+            self._export_pool = ProcessPoolExecutor(
+                max_workers=EXPORT_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return self._export_pool
+
+    def _start_export(self, data, jobs):
+        if self._export_jobs:
+            messagebox.showwarning("Busy", "An export is already running. Cancel it or wait for it to finish.")
+            return
+
+        pool = self._get_export_pool()
+        self._export_jobs = [(fmt, path, pool.submit(generator.render_resume, data, fmt, cache=self._render_cache))
+                             for fmt, path in jobs]
+        self._export_settled = []
+        self._export_written = []
+        self._export_failed = []
+
+        self.export_progress.config(maximum=len(jobs), value=0)
+        self.export_cancel_btn.config(state=tk.NORMAL)
+        self.export_status.config(text=f"Exporting {', '.join(fmt.upper() for fmt, _ in jobs)}...")
+        self._export_generation += 1
+        self.after(EXPORT_POLL_MS, self._poll_exports, self._export_generation)
+
+    def _poll_exports(self, generation):
+        jobs = self._export_jobs
+        if generation != self._export_generation or not jobs:
+            return # Cancelled, maybe with a newer export already running
+
+        for fmt, path, future in jobs:
+            if future.done() and future not in self._export_settled:
+                self._export_settled.append(future)
+                try:
+                    with open(path, 'wb') as f:
+                        f.write(future.result())
+                    self._export_written.append(path)
+                except Exception as e:
+                    self._export_failed.append(f"{fmt.upper()}: {e}")
+        done = len(self._export_settled)
+        self.export_progress.config(value=done)
+        if done < len(jobs):
+            self.export_status.config(text=f"Exporting... {done}/{len(jobs)} done")
+            self.after(EXPORT_POLL_MS, self._poll_exports, generation)
+            return
+
+        self._export_jobs = []
+        self.export_cancel_btn.config(state=tk.DISABLED)
+        saved, failed = self._export_written, self._export_failed
+
+        self.export_status.config(text=f"Exported {len(saved)}/{len(jobs)}")
+        if failed:
+            messagebox.showerror("Error", "Failed to save:\n" + "\n".join(failed))
+        if saved:
+            messagebox.showinfo("Success", "Saved to:\n" + "\n".join(saved))
+
+    def _cancel_export(self):
+        jobs = self._export_jobs
+        if not jobs:
+            return
+        self._export_jobs = []
+        self._export_generation += 1
+        # Renders still running finish in the background, but nothing more is
+        # written: files are only written by _poll_exports, which stops here.
+        # A fresh pool is used for the next export.
+        self._export_pool.shutdown(wait=False, cancel_futures=True)
+        self._export_pool = None
+
+        self.export_progress.config(value=0)
+        self.export_cancel_btn.config(state=tk.DISABLED)
+        self.export_status.config(text=f"Export cancelled ({len(self._export_written)}/{len(jobs)} already written)")
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,118 @@
+import re
+
+# Up to this many phrases, one C-level substring search per phrase is faster
+# than walking the text through the combined regex
+SUBSTRING_SEARCH_LIMIT = 64
+
+
+def _trie_regex(phrases):
+    """
+    Builds a regex source that matches any of the phrases, factored as a trie
+    so the engine branches once per character instead of trying every phrase.
+    Longer phrases win over their prefixes (the optional tails are greedy).
+    """
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[None] = True
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(
+            ((k, v) for k, v in node.items() if k is not None), key=lambda kv: kv[0])]
+        if not branches:
+            return ""
+        terminal = None in node
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        body = "(?:" + "|".join(branches) + ")"
+        return body + "?" if terminal else body
+
+    return build(trie)
+
+
+class PhraseMatcher:
+    """
+    Finds every occurrence of a fixed set of literal phrases in one pass.
+
+    The phrases are compiled into a single trie-shaped regex wrapped in a
+    lookahead, so overlapping hits are reported. Two different phrases can
+    only start at the same position if one is a prefix of the other, so the
+    shorter ones are recovered from a prefix table built at compile time.
+    find_all() on a vocabulary of up to SUBSTRING_SEARCH_LIMIT phrases uses
+    one plain substring search per phrase instead, which CPython runs faster
+    than the regex walk; finditer() always uses the regex.
+    """
+
+    def __init__(self, phrases):
+        self.phrases = list(dict.fromkeys(p for p in phrases if p))
+        if self.phrases:
+            self._regex = re.compile("(?=(" + _trie_regex(self.phrases) + "))")
+        else:
+            self._regex = None
+        self._prefixes = {
+            p: [q for q in self.phrases if q != p and p.startswith(q)]
+            for p in self.phrases
+        }
+
+    def finditer(self, text):
+        """Yields (start, phrase) for every occurrence, overlaps included."""
+        if self._regex is None:
+            return
+        for m in self._regex.finditer(text):
+            start = m.start()
+            phrase = m.group(1)
+            yield start, phrase
+            for shorter in self._prefixes[phrase]:
+                yield start, shorter
+
+    def find_all(self, text):
+        """Returns the set of phrases that occur anywhere in text."""
+        if len(self.phrases) <= SUBSTRING_SEARCH_LIMIT:
+            return {phrase for phrase in self.phrases if phrase in text}
+        found = set(self._regex.findall(text))
+        for phrase in list(found):
+            found.update(self._prefixes[phrase])
+        return found
+
+
+class PatternSetMatcher:
+    """
+    Reports which of a list of regex patterns match anywhere in a text.
+
+    A combined alternation of the patterns not yet seen locates the next
+    position where any of them matches; the patterns matching there are
+    retired and the search resumes from the same position with a smaller
+    alternation. The text is therefore walked once, however many patterns
+    there are. Alternations are compiled once per subset and reused.
+    """
+
+    def __init__(self, patterns, flags=0):
+        self.patterns = list(patterns)
+        self.flags = flags
+        self._compiled = [re.compile(p, flags) for p in self.patterns]
+        self._alternations = {}
+        self._alternation(tuple(range(len(self.patterns))))
+
+    def _alternation(self, indexes):
+        regex = self._alternations.get(indexes)
+        if regex is None:
+            source = "|".join(f"(?:{self.patterns[i]})" for i in indexes)
+            regex = self._alternations[indexes] = re.compile(source, self.flags)
+        return regex
+
+    def matched(self, text):
+        """Returns the set of indexes into `patterns` that match text."""
+        found = set()
+        remaining = tuple(range(len(self.patterns)))
+        pos = 0
+        while remaining:
+            m = self._alternation(remaining).search(text, pos)
+            if m is None:
+                break
+            pos = m.start()
+            hits = {i for i in remaining if self._compiled[i].match(text, pos)}
+            found |= hits
+            remaining = tuple(i for i in remaining if i not in hits)
+        return found
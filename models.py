@@ -0,0 +1,149 @@
+"""
+Compact, slotted resume types.
+
+Resumes normally travel as the nested dicts built by ATSResumeApp._collect_data.
+These classes hold the same fields without a per-instance __dict__, which
+matters when hundreds of thousands of parsed resumes are kept in memory.
+Every API that takes a resume dict also accepts a Resume.
+
+Container overhead per resume (3 jobs, 2 projects, 1 school, 4 certifications;
+field strings excluded, CPython 3.11 64-bit, `python models.py`):
+
+    dict:    ~2.2 KB
+    Resume:  ~0.8 KB
+"""
+from dataclasses import dataclass, fields
+
+@dataclass(slots=True)
+class Experience:
+    company: str = ''
+    location: str = ''
+    title: str = ''
+    start_date: str = ''
+    end_date: str = ''
+    responsibilities: str = ''
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d.get('company', ''), d.get('location', ''), d.get('title', ''),
+                   d.get('start_date', ''), d.get('end_date', ''), d.get('responsibilities', ''))
+
+    def to_dict(self):
+        return {'company': self.company, 'location': self.location, 'title': self.title,
+                'start_date': self.start_date, 'end_date': self.end_date,
+                'responsibilities': self.responsibilities}
+
+@dataclass(slots=True)
+class Project:
+    name: str = ''
+    description: str = ''
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d.get('name', ''), d.get('description', ''))
+
+    def to_dict(self):
+        return {'name': self.name, 'description': self.description}
+
+@dataclass(slots=True)
+class Education:
+    institution: str = ''
+    degree: str = ''
+    year: str = ''
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d.get('institution', ''), d.get('degree', ''), d.get('year', ''))
+
+    def to_dict(self):
+        return {'institution': self.institution, 'degree': self.degree, 'year': self.year}
+
+# Top-level string fields, in the order _collect_data produces them
+CONTACT_FIELDS = ('full_name', 'email', 'phone', 'city', 'country', 'linkedin', 'github')
+TEXT_FIELDS = CONTACT_FIELDS + ('summary', 'skills')
+
+@dataclass(slots=True)
+class Resume:
+    full_name: str = ''
+    email: str = ''
+    phone: str = ''
+    city: str = ''
+    country: str = ''
+    linkedin: str = ''
+    github: str = ''
+    summary: str = ''
+    skills: str = ''
+    experience: tuple = ()
+    projects: tuple = ()
+    education: tuple = ()
+    certifications: tuple = ()
+
+    @classmethod
+    def from_dict(cls, d):
+        """Builds a Resume from a resume dict; unknown keys are dropped"""
+        return cls(
+            *(d.get(key, '') for key in TEXT_FIELDS),
+            experience=tuple(Experience.from_dict(e) for e in d.get('experience') or ()),
+            projects=tuple(Project.from_dict(p) for p in d.get('projects') or ()),
+            education=tuple(Education.from_dict(e) for e in d.get('education') or ()),
+            certifications=tuple(d.get('certifications') or ()),
+        )
+
+    def to_dict(self):
+        """Returns the dict shape produced by _collect_data"""
+        d = {key: getattr(self, key) for key in TEXT_FIELDS}
+        d['experience'] = [e.to_dict() for e in self.experience]
+        d['projects'] = [p.to_dict() for p in self.projects]
+        d['education'] = [e.to_dict() for e in self.education]
+        d['certifications'] = list(self.certifications)
+        return d
+
+def as_resume_dict(resume):
+    """Accepts a Resume or a resume dict and returns the dict form"""
+    if isinstance(resume, Resume):
+        return resume.to_dict()
+    return resume
+
+def _sample_dict(i):
+    s = lambda name: f"{name}-{i}"
+    return {
+        **{key: s(key) for key in TEXT_FIELDS},
+        'experience': [{key: s(key + str(j)) for key in (f.name for f in fields(Experience))} for j in range(3)],
+        'projects': [{'name': s(f"name{j}"), 'description': s(f"desc{j}")} for j in range(2)],
+        'education': [{'institution': s('inst'), 'degree': s('deg'), 'year': s('year')}],
+        'certifications': [s(f"cert{j}") for j in range(4)],
+    }
+
+def memory_report(n=10000):
+    """
+    Measures container overhead per resume for dicts vs Resume objects.
+    Field strings are created up front so only the containers are counted.
+    """
+    import tracemalloc
+
+    samples = [_sample_dict(i) for i in range(n)]
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    as_dicts = [{
+        **d,
+        'experience': [dict(e) for e in d['experience']],
+        'projects': [dict(p) for p in d['projects']],
+        'education': [dict(e) for e in d['education']],
+        'certifications': list(d['certifications']),
+    } for d in samples]
+    dict_bytes = sum(s.size_diff for s in tracemalloc.take_snapshot().compare_to(before, 'filename'))
+    del as_dicts
+
+    before = tracemalloc.take_snapshot()
+    as_models = [Resume.from_dict(d) for d in samples]
+    model_bytes = sum(s.size_diff for s in tracemalloc.take_snapshot().compare_to(before, 'filename'))
+    del as_models
+    tracemalloc.stop()
+
+    return {'resumes': n, 'dict_bytes_per_resume': dict_bytes / n, 'model_bytes_per_resume': model_bytes / n}
+
+if __name__ == "__main__":
+    report = memory_report()
+    print(f"dict:   {report['dict_bytes_per_resume']:.0f} bytes/resume")
+    print(f"Resume: {report['model_bytes_per_resume']:.0f} bytes/resume")
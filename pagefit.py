@@ -0,0 +1,482 @@
+"""
+Page-count prediction without building the document.
+
+Resumes are laid out the way render_pdf (ReportLab) and render_docx (Word)
+lay them out, using the AFM character widths of the base-14 fonts embedded
+below (Arial is metric-compatible with Helvetica), greedy word wrapping and
+each format's paragraph spacing rules:
+
+    fit = estimate_pages(resume, 'pdf')
+    fit.pages, fit.overflow_lines    # 2, 0
+
+    result = fit_to_pages(resume, 'pdf', pages=1)
+    result.adjustments               # [Adjustment('spacing', 1.0, 0.7)]; render with result.style
+
+Most paragraphs fit on one line, which an upper bound of their width, read
+from a per-byte table, shows without splitting them into words. Word widths,
+line counts and whole estimates are cached. For a 30-job, 10-bullet resume a
+first estimate, with nothing cached, is about 80x cheaper than rendering the
+PDF (bench.py fails under 50x); re-estimating after an edit only wraps the
+paragraphs that changed and takes about half as long. The spacing values
+mirror the renderers; test_pagefit checks the PDF predictions against real
+builds.
+"""
+import functools
+import unicodedata
+from collections import namedtuple
+
+from constants import FIT_MIN_FONT_SIZE, FIT_MIN_MARGIN, FIT_MIN_SPACING, MAX_PAGES, PDF_LEADING
+from layout import ResumeLayout, build_layout
+from styling import current_styling
+
+# overflow_lines: text lines past max_pages; last_page_fill: share of the last page's height in use
+PageFit = namedtuple('PageFit', ['pages', 'lines', 'overflow_lines', 'last_page_fill'])
+_Block = namedtuple('_Block', ['lines', 'leading', 'before', 'after', 'text'])
+# style: the Styling to render with; fit: its PageFit; fits: whether it lands on the target page count (None: not checked)
+FitResult = namedtuple('FitResult', ['style', 'fit', 'adjustments', 'fits'])
+Adjustment = namedtuple('Adjustment', ['setting', 'before', 'after']) # setting: 'spacing', 'margins' or 'font_size_body'
+
+PAGE_WIDTH, PAGE_HEIGHT = 612.0, 792.0 # US Letter in points, the size both renderers use
+POINTS_PER_INCH = 72.0
+
+# Advance widths in 1/1000 em for printable ASCII and the typographic characters below
+_CHARS = "".join(map(chr, range(32, 127))) + "‘’“”–—…•"
+_AFM_WIDTHS = {
+    "Helvetica": (
+        278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+        1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+        333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+        556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584, 222,
+        222, 333, 333, 556, 1000, 1000, 350,
+    ),
+    "Helvetica-Bold": (
+        278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+        975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+        333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+        611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584, 278,
+        278, 500, 500, 556, 1000, 1000, 350,
+    ),
+    "Times-Roman": (
+        250, 333, 408, 500, 500, 833, 778, 180, 333, 333, 500, 564, 250, 333, 250, 278,
+        500, 500, 500, 500, 500, 500, 500, 500, 500, 500, 278, 278, 564, 564, 564, 444,
+        921, 722, 667, 667, 722, 611, 556, 722, 722, 333, 389, 722, 611, 889, 722, 722,
+        556, 722, 667, 556, 611, 722, 722, 944, 722, 722, 611, 333, 278, 333, 469, 500,
+        333, 444, 500, 444, 500, 444, 333, 500, 500, 278, 278, 500, 278, 778, 500, 500,
+        500, 500, 333, 389, 278, 500, 500, 722, 500, 500, 444, 480, 200, 480, 541, 333,
+        333, 444, 444, 500, 1000, 1000, 350,
+    ),
+    "Times-Bold": (
+        250, 333, 555, 500, 500, 1000, 833, 278, 333, 333, 500, 570, 250, 333, 250, 278,
+        500, 500, 500, 500, 500, 500, 500, 500, 500, 500, 333, 333, 570, 570, 570, 500,
+        930, 722, 667, 722, 722, 667, 611, 778, 778, 389, 500, 778, 667, 944, 722, 778,
+        611, 778, 722, 556, 667, 722, 722, 1000, 722, 722, 667, 333, 278, 333, 581, 500,
+        333, 500, 556, 444, 556, 444, 333, 500, 556, 278, 333, 556, 278, 833, 556, 500,
+        556, 556, 444, 389, 333, 556, 500, 722, 500, 500, 444, 394, 220, 394, 520, 333,
+        333, 500, 500, 500, 1000, 1000, 350,
+    ),
+    "Times-Italic": (
+        250, 333, 420, 500, 500, 833, 778, 214, 333, 333, 500, 675, 250, 333, 250, 278,
+        500, 500, 500, 500, 500, 500, 500, 500, 500, 500, 333, 333, 675, 675, 675, 500,
+        920, 611, 611, 667, 722, 611, 611, 722, 722, 333, 444, 667, 556, 833, 667, 722,
+        611, 722, 611, 500, 556, 722, 611, 833, 611, 556, 556, 389, 278, 389, 422, 500,
+        333, 500, 500, 444, 500, 444, 278, 500, 500, 278, 278, 444, 278, 722, 500, 500,
+        500, 500, 389, 389, 278, 500, 444, 667, 444, 444, 389, 400, 275, 400, 541, 333,
+        333, 556, 556, 500, 889, 889, 350,
+    ),
+}
+_AFM_WIDTHS["Courier"] = _AFM_WIDTHS["Courier-Bold"] = (600,) * len(_CHARS)
+
+# (regular, bold, italic) faces for each Styling.font_name; Oblique shares the upright widths
+_FAMILIES = {
+    "Arial": ("Helvetica", "Helvetica-Bold", "Helvetica"),
+    "Helvetica": ("Helvetica", "Helvetica-Bold", "Helvetica"),
+    "Times New Roman": ("Times-Roman", "Times-Bold", "Times-Italic"),
+    "Courier New": ("Courier", "Courier-Bold", "Courier"),
+}
+_WIDTHS = {font: dict(zip(_CHARS, widths)) for font, widths in _AFM_WIDTHS.items()}
+
+# ReportLab: SimpleDocTemplate frame padding, paragraph spacing of render_pdf
+_PDF_FRAME_PADDING = 6.0
+_PDF_BULLET_INDENT = 20.0
+# Word: python-docx template defaults (10pt after, 1.15 line spacing) and each font's single line height
+_DOCX_SPACE_AFTER = 10.0
+_DOCX_LINE_SPACING = 276 / 240
+_DOCX_LINE_HEIGHT = {"Arial": 1.149, "Helvetica": 1.149, "Times New Roman": 1.15, "Courier New": 1.133}
+_DOCX_BULLET_INDENT = 18.0
+
+def _fallback_width(widths, ch):
+    """Width of a character outside the table: its unaccented letter, else an 'n'"""
+    base = unicodedata.normalize('NFKD', ch)[:1]
+    width = widths[ch] = widths.get(base, widths['n'])
+    return width
+
+# Per-font tables mapping each UTF-8 byte to an upper bound of its character's width in units of
+# 8/1000 em: a byte outside ASCII counts as the widest character, so a paragraph whose translated
+# bytes sum within the line fits on one line without splitting it into words
+_BOUND_UNIT = 8
+_MAX_WIDTH = max(max(widths) for widths in _AFM_WIDTHS.values())
+_WIDTH_BOUNDS = {
+    font: bytes(-(-widths.get(chr(b), _MAX_WIDTH) // _BOUND_UNIT) if b < 128 else -(-_MAX_WIDTH // _BOUND_UNIT) for b in range(256))
+    for font, widths in _WIDTHS.items()
+}
+
+def _width_bound(text, font):
+    """At least the width of text, in 1/1000 em; summed in C over its UTF-8 bytes"""
+    return sum(text.encode().translate(_WIDTH_BOUNDS[font])) * _BOUND_UNIT
+
+_WORD_CACHE_LIMIT = 100000
+_word_widths = {font: {} for font in _WIDTHS} # Per-font word -> width caches
+
+def word_width(word, font):
+    """Width of a word in a base-14 font, in 1/1000 em"""
+    cache = _word_widths[font]
+    total = cache.get(word)
+    if total is None:
+        widths = _WIDTHS[font]
+        try:
+            total = sum(map(widths.__getitem__, word)) # Summed in C; a KeyError only for a first-seen character
+        except KeyError:
+            total = sum(widths[ch] if ch in widths else _fallback_width(widths, ch) for ch in word)
+        if len(cache) >= _WORD_CACHE_LIMIT:
+            cache.clear()
+        cache[word] = total
+    return total
+
+def count_lines(fragments, width, size):
+    """
+    Number of lines a paragraph of (text, font) fragments wraps to in `width`
+    points at `size`. Greedy, like ReportLab and Word: a word that does not
+    fit starts the next line; a word wider than the line gets a line to itself.
+    """
+    limit = width * 1000.0 / size
+    if len(fragments) == 1:
+        return _line_counts((fragments[0][0],), fragments[0][1], limit)[0]
+    return _wrapped_fragments(tuple(fragments), limit)
+
+@functools.lru_cache(maxsize=4096)
+def _wrapped_fragments(fragments, limit):
+    """count_lines for a paragraph mixing fonts (entry headings)"""
+    # A space may join two fragments: a widest character for each keeps the bound
+    if sum(_width_bound(text, font) + _MAX_WIDTH for text, font in fragments) <= limit:
+        return 1 if any(text.split() for text, _ in fragments) else 0
+    lines = 0
+    used = None # Width of the current line; None before the first word
+    for text, font in fragments:
+        space = _WIDTHS[font][" "]
+        for width_of_word in _word_widths_of(text.split(), font):
+            if used is not None and used + space + width_of_word <= limit:
+                used += space + width_of_word
+            else:
+                lines += 1
+                used = width_of_word
+    return lines
+
+def _word_widths_of(words, font):
+    """word_width of each word; a paragraph with new words measures them all in one pass"""
+    cache = _word_widths[font]
+    try:
+        return list(map(cache.__getitem__, words)) # Every word seen before, the common case
+    except KeyError:
+        pass
+    table = _WIDTHS[font]
+    try:
+        widths = [sum(map(table.__getitem__, word)) for word in words]
+    except KeyError:
+        return [word_width(word, font) for word in words] # A first-seen character
+    if len(cache) >= _WORD_CACHE_LIMIT:
+        cache.clear()
+    cache.update(zip(words, widths))
+    return widths
+
+_LINE_CACHE_LIMIT = 16384 # Paragraphs per (font, limit)
+_LINE_CACHE_WIDTHS = 16
+_line_caches = {} # (font, limit) -> {paragraph: line count}
+
+def _line_counts(paragraphs, font, limit):
+    """
+    Line counts of single-font paragraphs (bullets). Cached, as they are
+    re-estimated on every edit: looking up a run of known bullets is one map().
+    """
+    cache = _line_caches.get((font, limit))
+    if cache is None:
+        if len(_line_caches) >= _LINE_CACHE_WIDTHS:
+            _line_caches.clear()
+        cache = _line_caches[font, limit] = {}
+    lines = list(map(cache.get, paragraphs))
+    if None in lines:
+        if len(cache) >= _LINE_CACHE_LIMIT:
+            cache.clear()
+        for i, text in enumerate(paragraphs):
+            if lines[i] is None:
+                lines[i] = cache[text] = _wrapped_lines(text, font, limit)
+    return lines
+
+def _wrapped_lines(text, font, limit):
+    """count_lines for a single-font paragraph"""
+    if _width_bound(text, font) <= limit:
+        return 1 if text and not text.isspace() else 0
+    widths = _word_widths_of(text.split(), font)
+    space = _WIDTHS[font][" "]
+    if not widths or sum(widths) + space * (len(widths) - 1) <= limit:
+        return 1 if widths else 0
+    lines = 1
+    used = widths[0]
+    for width_of_word in widths[1:]:
+        used += space + width_of_word
+        if used > limit:
+            lines += 1
+            used = width_of_word
+    return lines
+
+def _bullet_blocks(bullets, font, limit, blocks_by_lines, make):
+    """The blocks of a run of bullets; they only differ in line count, so blocks are shared"""
+    lines = _line_counts(bullets, font, limit)
+    for n in set(lines).difference(blocks_by_lines):
+        blocks_by_lines[n] = make(n)
+    return list(map(blocks_by_lines.__getitem__, lines))
+
+def _pdf_blocks(layout, style):
+    regular, bold, italic = _FAMILIES.get(style.font_name, _FAMILIES["Arial"])
+    width = PAGE_WIDTH - (style.margin_left + style.margin_right) * POINTS_PER_INCH - 2 * _PDF_FRAME_PADDING
+    body = style.font_size_body
+    gap = style.spacing
+    bullet_limit = (width - _PDF_BULLET_INDENT) * 1000.0 / body
+    bullet_blocks = {}
+
+    def paragraph(lines, size, before=0.0, after=2.0):
+        return _Block(lines, size * PDF_LEADING, before * gap, after * gap, True)
+
+    def spacer(height):
+        return _Block(1, height * gap, 0.0, 0.0, False)
+
+    def bullet(lines):
+        return paragraph(lines, body)
+
+    entry_gap = spacer(6.0)
+    blocks = [
+        paragraph(count_lines([(layout.name.upper(), bold)], width, style.font_size_name), style.font_size_name, after=6.0),
+        paragraph(count_lines([(" | ".join(layout.contact), regular)], width, body), body),
+        spacer(12.0),
+    ]
+    for section in layout.sections:
+        size = style.font_size_heading
+        blocks.append(paragraph(count_lines([(section.title.upper(), bold)], width, size), size, 12.0, 6.0))
+        if section.text:
+            blocks.append(paragraph(count_lines([(section.text, regular)], width, body), body))
+        for entry in section.entries:
+            lines = count_lines([(entry.heading, bold), (f" | {entry.heading_detail}" if entry.heading_detail else "", regular)], width, body)
+            if entry.subheading or entry.subheading_detail:
+                detail = f" | {entry.subheading_detail}" if entry.subheading_detail else ""
+                lines += count_lines([(entry.subheading, italic if entry.italic_subheading else regular), (detail, regular)], width, body)
+            blocks.append(paragraph(lines, body))
+            blocks += _bullet_blocks(entry.bullets, regular, bullet_limit, bullet_blocks, bullet)
+            blocks.append(entry_gap)
+        blocks += _bullet_blocks(section.bullets, regular, bullet_limit, bullet_blocks, bullet)
+    return blocks
+
+def _docx_blocks(layout, style):
+    regular, bold, italic = _FAMILIES.get(style.font_name, _FAMILIES["Arial"])
+    width = PAGE_WIDTH - (style.margin_left + style.margin_right) * POINTS_PER_INCH
+    body = style.font_size_body
+    line_height = _DOCX_LINE_HEIGHT.get(style.font_name, 1.15) * _DOCX_LINE_SPACING
+    gap = style.spacing
+    bullet_limit = (width - _DOCX_BULLET_INDENT) * 1000.0 / body
+    bullet_blocks = {}
+
+    def paragraph(fragments, size, before=0.0, after=_DOCX_SPACE_AFTER, indent=0.0):
+        return block(count_lines(fragments, width - indent, size), size, before, after)
+
+    def block(lines, size, before=0.0, after=_DOCX_SPACE_AFTER):
+        return _Block(max(1, lines), size * line_height, before * gap, after * gap, True) # An empty paragraph still takes a line
+
+    def bullet(lines):
+        return block(lines, body, after=0.0)
+
+    def bullets(items):
+        # 'List Bullet' has contextual spacing: no space between two bullets
+        run = _bullet_blocks(items, regular, bullet_limit, bullet_blocks, bullet)
+        if run:
+            run[-1] = run[-1]._replace(after=2.0 * gap)
+        return run
+
+    blocks = [
+        paragraph([(layout.name.upper(), bold)], style.font_size_name),
+        paragraph([(" | ".join(layout.contact), regular)], body, after=12.0),
+    ]
+    for section in layout.sections:
+        blocks.append(paragraph([(section.title.upper(), bold)], style.font_size_heading, 12.0, 6.0))
+        if section.text:
+            blocks.append(paragraph([(section.text, regular)], body))
+        for entry in section.entries:
+            blocks.append(paragraph([(entry.heading, bold), (f" | {entry.heading_detail}" if entry.heading_detail else "", regular)], body))
+            if entry.subheading or entry.subheading_detail:
+                detail = f" | {entry.subheading_detail}" if entry.subheading_detail else ""
+                blocks.append(paragraph([(entry.subheading, italic if entry.italic_subheading else regular), (detail, regular)], body))
+            blocks += bullets(entry.bullets)
+        blocks += bullets(section.bullets)
+    return blocks
+
+def _paginate(blocks, height, collapse_spacing, min_first, min_last):
+    """
+    Flows blocks down pages of `height` points. Returns (text lines per page,
+    height used on the last page). A paragraph that does not fit is split
+    between lines if at least min_first lines stay and min_last lines move;
+    otherwise it moves to the next page whole.
+    """
+    pages = []
+    on_page = 0 # Text lines on the current page
+    used = 0.0
+    previous_after = 0.0
+    room = height + 1e-6
+    for lines, leading, before, after, text in blocks:
+        if not used:
+            before = 0.0 # Space before is dropped at the top of a page
+        elif collapse_spacing:
+            before = before - previous_after if before > previous_after else 0.0 # ReportLab: the larger of the two gaps
+        if used + before + lines * leading <= room: # Fits whole, the common case
+            used += before + lines * leading + after
+            previous_after = after
+            if text:
+                on_page += lines
+            continue
+        while lines:
+            fit = int((height - used - before) / leading + 1e-6)
+            take = lines if fit >= lines else min(fit, lines - min_last)
+            if take < min(min_first, lines):
+                take = 0 if used else max(fit, 1) # Taller than a whole page: split anywhere
+            if take:
+                used += before + take * leading
+                if text:
+                    on_page += take
+                lines -= take
+            if lines:
+                pages.append(on_page)
+                on_page = 0
+                used = before = 0.0
+        used += after
+        previous_after = after
+    pages.append(on_page)
+    return pages, used - previous_after
+
+_ESTIMATE_CACHE_LIMIT = 256
+_estimates = {} # (layout content, fmt, style, max_pages) -> PageFit
+
+def _layout_key(layout):
+    """The text of a ResumeLayout as nested tuples, to look up a previous estimate of the same resume"""
+    return (layout.name, tuple(layout.contact), tuple(
+        (section.title, section.text, tuple(section.bullets), tuple(
+            (entry.heading, entry.heading_detail, entry.subheading, entry.subheading_detail,
+             entry.italic_subheading, tuple(entry.bullets))
+            for entry in section.entries))
+        for section in layout.sections))
+
+def estimate_pages(data, fmt='pdf', style=None, max_pages=MAX_PAGES):
+    """
+    Predicts the layout of a resume (dict, Resume or ResumeLayout) in 'pdf' or
+    'docx' with the given Styling (default: the current constants) and
+    returns a PageFit. overflow_lines counts the lines past max_pages.
+    Estimates are cached: scoring an unchanged resume again only rebuilds its layout.
+    """
+    layout = data if isinstance(data, ResumeLayout) else build_layout(data)
+    style = style or current_styling()
+    key = (_layout_key(layout), fmt, style, max_pages)
+    fit = _estimates.get(key)
+    if fit is not None:
+        return fit
+    vertical_margins = (style.margin_top + style.margin_bottom) * POINTS_PER_INCH
+    if fmt == 'pdf':
+        height = PAGE_HEIGHT - vertical_margins - 2 * _PDF_FRAME_PADDING
+        pages, last = _paginate(_pdf_blocks(layout, style), height, True, 2, 1)
+    elif fmt == 'docx':
+        height = PAGE_HEIGHT - vertical_margins
+        pages, last = _paginate(_docx_blocks(layout, style), height, False, 2, 2) # Word's widow control
+    else:
+        raise ValueError(f"No page layout for format: {fmt}")
+    if len(_estimates) >= _ESTIMATE_CACHE_LIMIT:
+        _estimates.clear()
+    fit = _estimates[key] = PageFit(len(pages), sum(pages), sum(pages[max_pages:]), min(1.0, max(0.0, last / height)))
+    return fit
+
+def clear_caches():
+    """Forgets every measured word, wrapped paragraph and estimate, as for a first estimate in a new process"""
+    for cache in _word_widths.values():
+        cache.clear()
+    _line_caches.clear()
+    _wrapped_fragments.cache_clear()
+    _estimates.clear()
+
+_MARGINS = ('margin_top', 'margin_bottom', 'margin_left', 'margin_right')
+
+def _ladder(start, stop, step):
+    """start, start - step, ... down to stop (just start if it is already below stop)"""
+    values = [start]
+    while values[-1] - step >= stop - 1e-9:
+        values.append(round(values[-1] - step, 3))
+    return values
+
+def _fit_ladders(style):
+    """(setting, values from the current styling to the tightest allowed), least visible change first"""
+    return [
+        ('spacing', _ladder(style.spacing, FIT_MIN_SPACING, 0.1)),
+        ('margins', _ladder(max(getattr(style, m) for m in _MARGINS), FIT_MIN_MARGIN, 0.125)),
+        ('font_size_body', _ladder(style.font_size_body, FIT_MIN_FONT_SIZE, 0.5)),
+    ]
+
+def _adjusted(style, ladders, levels):
+    changes = {}
+    for (setting, values), level in zip(ladders, levels):
+        if setting == 'margins':
+            changes.update({m: min(getattr(style, m), values[level]) for m in _MARGINS})
+        else:
+            changes[setting] = values[level]
+    return style._replace(**changes)
+
+def fit_to_pages(data, fmt='pdf', pages=1, style=None, slack=0.0):
+    """
+    Finds the smallest adjustment of the styling (default: the current
+    constants) that lays the resume out on at most `pages` pages: paragraph
+    spacing first, then the margins, then the body font size, each within the
+    FIT_MIN_* limits. Every candidate is an estimate_pages call; paragraph
+    wraps are cached, so only what a change affects is measured again.
+    slack keeps that share of the last page free, as headroom for a check
+    against the real render. Returns a FitResult; when even the tightest
+    styling does not fit, the styling is left unchanged and fits is False.
+    """
+    layout = data if isinstance(data, ResumeLayout) else build_layout(data)
+    style = style or current_styling()
+    ladders = _fit_ladders(style)
+    levels = [0] * len(ladders)
+
+    def estimate(levels):
+        return estimate_pages(layout, fmt, _adjusted(style, ladders, levels), max_pages=pages)
+
+    def fits(fit):
+        return fit.pages < pages or fit.pages == pages and fit.last_page_fill <= 1.0 - slack
+
+    fit = estimate(levels)
+    if not fits(fit):
+        for i, (_, values) in enumerate(ladders):
+            while levels[i] < len(values) - 1 and not fits(fit):
+                levels[i] += 1
+                fit = estimate(levels)
+            if fits(fit):
+                # Loosen what was maxed out before this setting while the resume still fits
+                for j in range(i):
+                    while levels[j]:
+                        levels[j] -= 1
+                        looser = estimate(levels)
+                        if not fits(looser):
+                            levels[j] += 1
+                            break
+                        fit = looser
+                break
+        else:
+            levels = [0] * len(ladders) # Out of reach: leave the styling alone
+            fit = estimate(levels)
+    adjustments = [Adjustment(setting, values[0], values[level])
+                   for (setting, values), level in zip(ladders, levels) if level]
+    return FitResult(_adjusted(style, ladders, levels), fit, adjustments, fits(fit))
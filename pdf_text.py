@@ -0,0 +1,410 @@
+"""
+Minimal PDF text extraction, standard library only.
+
+Enough for text-based resumes: the PDFs this project writes with ReportLab,
+and simple PDFs from word processors (Type1/TrueType fonts with WinAnsi or
+standard encodings, or any font with a ToUnicode map). Streams may be
+FlateDecode and/or ASCII85Decode. Objects are found by scanning the file,
+so the cross-reference table or stream is not needed, and objects packed
+into object streams (PDF 1.5+, as Word, Google Docs and LibreOffice save)
+are unpacked. Scanned images and encrypted files yield no text.
+
+    extract_lines(pdf_bytes) -> ['JANE DOE', 'Paris | jane@example.com', ...]
+
+Lines come back in drawing order. A line that starts to the right of the
+page's text margin is prefixed with spaces (one per ~4pt of indent), so
+wrapped continuation lines of indented bullets can be told from headings.
+"""
+import base64
+import itertools
+import re
+import zlib
+
+INDENT_UNIT = 4.0      # Points of indent per leading space in the output
+TJ_SPACE_GAP = 200     # A TJ adjustment this far left (1/1000 em) is a word gap
+LINE_TOLERANCE = 1.0   # Points of vertical movement that still count as the same line
+
+_OBJECT_RE = re.compile(rb"(\d+)\s+(\d+)\s+obj\b(.*?)\bendobj", re.S)
+_STREAM_RE = re.compile(rb"\bstream\r?\n")
+_DELIMITERS = b"()<>[]{}/%"
+_WHITESPACE = b" \t\r\n\f\x00"
+
+class Ref:
+    __slots__ = ('num',)
+
+    def __init__(self, num):
+        self.num = num
+
+class Name(str):
+    pass
+
+class Operator(str):
+    pass
+
+def _tokens(data):
+    """Yields PDF tokens: Name, bytes (strings), int/float, '<<', '>>', '[', ']' and Operator"""
+    i = 0
+    n = len(data)
+    while i < n:
+        c = data[i]
+        if c in _WHITESPACE:
+            i += 1
+        elif c == 0x25: # % comment
+            while i < n and data[i] not in b"\r\n":
+                i += 1
+        elif c == 0x2F: # /Name
+            j = i + 1
+            while j < n and data[j] not in _WHITESPACE and data[j] not in _DELIMITERS:
+                j += 1
+            yield Name(re.sub(rb"#([0-9A-Fa-f]{2})", lambda m: bytes([int(m.group(1), 16)]), data[i + 1:j]).decode('latin-1'))
+            i = j
+        elif c == 0x28: # (literal string)
+            out = bytearray()
+            depth = 1
+            i += 1
+            while i < n:
+                c = data[i]
+                if c == 0x5C: # backslash escape
+                    i += 1
+                    e = data[i:i + 1]
+                    if e in b"01234567":
+                        octal = re.match(rb"[0-7]{1,3}", data[i:i + 3]).group()
+                        out.append(int(octal, 8) & 0xFF)
+                        i += len(octal)
+                        continue
+                    if e == b"\r" and data[i + 1:i + 2] == b"\n":
+                        i += 1
+                    elif e not in b"\r\n":
+                        out += {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}.get(e, e)
+                elif c == 0x28:
+                    depth += 1
+                    out.append(c)
+                elif c == 0x29:
+                    depth -= 1
+                    if not depth:
+                        break
+                    out.append(c)
+                else:
+                    out.append(c)
+                i += 1
+            i += 1
+            yield bytes(out)
+        elif c == 0x3C: # <hex> or <<
+            if data[i + 1:i + 2] == b"<":
+                yield '<<'
+                i += 2
+            else:
+                j = data.index(b">", i)
+                hexdigits = re.sub(rb"\s", b"", data[i + 1:j])
+                if len(hexdigits) % 2:
+                    hexdigits += b"0"
+                yield bytes.fromhex(hexdigits.decode('ascii'))
+                i = j + 1
+        elif c == 0x3E: # >>
+            yield '>>'
+            i += 2
+        elif c in b"[]{}":
+            yield chr(c)
+            i += 1
+        else:
+            j = i
+            while j < n and data[j] not in _WHITESPACE and data[j] not in _DELIMITERS:
+                j += 1
+            word = data[i:j]
+            i = j
+            try:
+                yield int(word)
+            except ValueError:
+                try:
+                    yield float(word)
+                except ValueError:
+                    yield Operator(word.decode('latin-1'))
+
+def _parse(tokens):
+    """Parses one object from a token iterator (dicts, arrays, refs)"""
+    token = next(tokens)
+    if token == '<<':
+        result = {}
+        items = _parse_until(tokens, '>>')
+        for key, value in zip(items[::2], items[1::2]):
+            result[key] = value
+        return result
+    if token == '[':
+        return _parse_until(tokens, ']')
+    return token
+
+def _parse_until(tokens, end):
+    items = []
+    for token in tokens:
+        if token == end:
+            break
+        if token == '<<':
+            # itertools.chain, unlike a generator, does not close `tokens` when dropped
+            items.append(_parse(itertools.chain((token,), tokens)))
+        elif token == '[':
+            items.append(_parse_until(tokens, ']'))
+        elif token == 'R' and len(items) >= 2 and isinstance(items[-1], int) and isinstance(items[-2], int):
+            items.pop() # Generation number
+            items[-1] = Ref(items[-1])
+        else:
+            items.append(token)
+    return items
+
+class PDFDocument:
+    def __init__(self, data):
+        self.objects = {} # num -> (dictionary or value, raw stream bytes or None)
+        for m in _OBJECT_RE.finditer(data):
+            body = m.group(3)
+            stream = None
+            s = _STREAM_RE.search(body)
+            if s:
+                end = body.rfind(b"endstream")
+                stream = body[s.end():end].rstrip(b"\r\n") if end != -1 else body[s.end():]
+                body = body[:s.start()]
+            try:
+                value = _parse(iter(_tokens(body)))
+            except (StopIteration, ValueError, IndexError):
+                continue
+            self.objects[int(m.group(1))] = (value, stream)
+        for num, (value, _) in list(self.objects.items()):
+            if isinstance(value, dict) and value.get('Type') == 'ObjStm':
+                self._unpack_object_stream(Ref(num))
+        self._fonts = {}
+
+    def _unpack_object_stream(self, ref):
+        """Adds the objects compressed into an object stream; objects stored on their own take precedence"""
+        header = self.objects[ref.num][0]
+        first, count = self.resolve(header.get('First')), self.resolve(header.get('N'))
+        data = self.stream(ref)
+        if not data or not isinstance(first, int) or not isinstance(count, int):
+            raise ValueError("Unsupported PDF (object stream could not be decoded)")
+        numbers = [n for n in _tokens(data[:first]) if isinstance(n, int)][:2 * count]
+        offsets = [first + offset for offset in numbers[1::2]]
+        for num, start, end in zip(numbers[::2], offsets, offsets[1:] + [len(data)]):
+            try:
+                value = _parse(iter(_tokens(data[start:end])))
+            except (StopIteration, ValueError, IndexError):
+                continue
+            self.objects.setdefault(num, (value, None))
+
+    def resolve(self, value):
+        while isinstance(value, Ref):
+            value = self.objects.get(value.num, (None, None))[0]
+        return value
+
+    def stream(self, ref):
+        value, raw = self.objects.get(ref.num, (None, None)) if isinstance(ref, Ref) else (None, None)
+        if raw is None:
+            return b""
+        filters = self.resolve(value.get('Filter')) if isinstance(value, dict) else None
+        if isinstance(filters, str):
+            filters = [filters]
+        for name in filters or []:
+            if name == 'ASCII85Decode':
+                raw = raw.strip()
+                if raw.startswith(b"<~"):
+                    raw = raw[2:]
+                end = raw.find(b"~>")
+                raw = base64.a85decode(raw[:end] if end != -1 else raw, adobe=False)
+            elif name == 'FlateDecode':
+                raw = zlib.decompressobj().decompress(raw)
+            elif name == 'ASCIIHexDecode':
+                raw = bytes.fromhex(re.sub(rb"[^0-9A-Fa-f]", b"", raw).decode('ascii'))
+            else:
+                return b"" # Image or unsupported filter
+        return raw
+
+    def pages(self):
+        """Page dictionaries in document order"""
+        catalog = next((v for v, _ in self.objects.values() if isinstance(v, dict) and v.get('Type') == 'Catalog'), None)
+        if catalog is None:
+            return
+        stack = [self.resolve(catalog.get('Pages'))]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            if node.get('Type') == 'Pages':
+                stack.extend(reversed([self.resolve(kid) for kid in self.resolve(node.get('Kids')) or []]))
+            else:
+                yield node
+
+    def font(self, ref):
+        """Decoder for a font: bytes -> str"""
+        key = ref.num if isinstance(ref, Ref) else id(ref)
+        decoder = self._fonts.get(key)
+        if decoder is None:
+            decoder = self._fonts[key] = self._make_decoder(self.resolve(ref))
+        return decoder
+
+    def _make_decoder(self, font):
+        if not isinstance(font, dict):
+            return _decode_winansi
+        cmap = font.get('ToUnicode')
+        if cmap is not None:
+            mapping, width = _parse_cmap(self.stream(cmap))
+            if mapping:
+                def decode(raw):
+                    return "".join(mapping.get(raw[i:i + width], "") for i in range(0, len(raw), width))
+                return decode
+        if font.get('Subtype') == 'Type0':
+            return lambda raw: raw.decode('utf-16-be', 'replace') # Best effort without a ToUnicode map
+        return _decode_winansi
+
+def _parse_cmap(data):
+    """Returns ({code bytes: text}, code width) from a ToUnicode CMap"""
+    mapping = {}
+    width = 1
+    tokens = list(_tokens(data))
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token == 'beginbfchar':
+            i += 1
+            while tokens[i] != 'endbfchar':
+                src, dst = tokens[i], tokens[i + 1]
+                mapping[src] = dst.decode('utf-16-be', 'replace')
+                width = len(src)
+                i += 2
+        elif token == 'beginbfrange':
+            i += 1
+            while tokens[i] != 'endbfrange':
+                low, high, dst = tokens[i], tokens[i + 1], tokens[i + 2]
+                i += 3
+                if dst == '[':
+                    targets = []
+                    while tokens[i] != ']':
+                        targets.append(tokens[i])
+                        i += 1
+                    i += 1
+                else:
+                    targets = None
+                start, end = int.from_bytes(low, 'big'), int.from_bytes(high, 'big')
+                width = len(low)
+                for offset, code in enumerate(range(start, min(end, start + 0xFFFF) + 1)):
+                    if targets is not None:
+                        if offset >= len(targets):
+                            break
+                        text = targets[offset].decode('utf-16-be', 'replace')
+                    else:
+                        base = int.from_bytes(dst, 'big') + offset
+                        text = base.to_bytes(len(dst), 'big').decode('utf-16-be', 'replace')
+                    mapping[code.to_bytes(width, 'big')] = text
+        i += 1
+    return mapping, width
+
+def page_count(data):
+    """Number of pages in a PDF (bytes)"""
+    return sum(1 for _ in PDFDocument(data).pages())
+
+def _multiply(m, n):
+    """Matrix product m x n of two PDF matrices [a b c d e f]"""
+    a, b, c, d, e, f = m
+    A, B, C, D, E, F = n
+    return (a * A + b * C, a * B + b * D, c * A + d * C, c * B + d * D, e * A + f * C + E, e * B + f * D + F)
+
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+def _page_runs(doc, page):
+    """Yields (x, y, text, moved) runs of one page in drawing order; moved is
+    False when the run continues right where the previous one ended"""
+    resources = doc.resolve(page.get('Resources')) or {}
+    fonts = doc.resolve(resources.get('Font')) or {}
+    contents = doc.resolve(page.get('Contents'))
+    refs = contents if isinstance(contents, list) else [page.get('Contents')]
+    data = b"\n".join(doc.stream(ref) for ref in refs if ref is not None)
+
+    decode = _decode_winansi
+    ctm = _IDENTITY
+    saved = []
+    leading = 0.0
+    line = _IDENTITY # Text line matrix
+    moved = True
+    operands = []
+    arrays = []
+    for token in _tokens(data):
+        if not isinstance(token, Operator):
+            if token == '[':
+                arrays.append([])
+            elif token == ']' and arrays:
+                array = arrays.pop()
+                (arrays[-1] if arrays else operands).append(array)
+            elif token not in ('<<', '>>', '{', '}'):
+                (arrays[-1] if arrays else operands).append(token)
+            continue
+
+        op = str(token)
+        numbers = [float(v) for v in operands if isinstance(v, (int, float))]
+        if op == 'q':
+            saved.append(ctm)
+        elif op == 'Q':
+            ctm = saved.pop() if saved else _IDENTITY
+        elif op == 'cm' and len(numbers) >= 6:
+            ctm = _multiply(tuple(numbers[-6:]), ctm)
+        elif op == 'BT':
+            line = _IDENTITY
+            moved = True
+        elif op == 'Tf' and len(operands) >= 2:
+            font = fonts.get(operands[-2]) if isinstance(operands[-2], str) else None
+            decode = doc.font(font) if font is not None else _decode_winansi
+        elif op == 'TL' and numbers:
+            leading = numbers[-1]
+        elif op in ('Td', 'TD') and len(numbers) >= 2:
+            line = _multiply((1, 0, 0, 1, numbers[-2], numbers[-1]), line)
+            if op == 'TD':
+                leading = -numbers[-1]
+            moved = True
+        elif op == 'Tm' and len(numbers) >= 6:
+            line = tuple(numbers[-6:])
+            moved = True
+        elif op == 'T*':
+            line = _multiply((1, 0, 0, 1, 0, -leading), line)
+            moved = True
+        elif op in ('Tj', "'", '"', 'TJ') and operands:
+            if op in ("'", '"'):
+                line = _multiply((1, 0, 0, 1, 0, -leading), line)
+                moved = True
+            shown = operands[-1]
+            if isinstance(shown, bytes):
+                text = decode(shown)
+            elif isinstance(shown, list):
+                text = "".join(decode(item) if isinstance(item, bytes) else " " if item < -TJ_SPACE_GAP else ""
+                               for item in shown if isinstance(item, (bytes, int, float)))
+            else:
+                text = ""
+            x, y = _multiply(line, ctm)[4:]
+            yield x, y, text, moved
+            moved = False
+        operands = []
+
+def _decode_winansi(raw):
+    # ReportLab writes its bullet as 0x7F. Codes cp1252 leaves undefined stay U+FFFD:
+    # they are unknown glyphs, and turning them into bullets would invent list items
+    return raw.decode('cp1252', 'replace').translate(_WINANSI_BULLETS)
+
+_WINANSI_BULLETS = {0x7F: "•"}
+
+def extract_lines(data):
+    """Returns the text lines of a PDF (bytes), page by page"""
+    doc = PDFDocument(data)
+    lines = []
+    for page in doc.pages():
+        rows = [] # [x, y, text]
+        for x, y, text, moved in _page_runs(doc, page):
+            if not text:
+                continue
+            if rows and abs(rows[-1][1] - y) <= LINE_TOLERANCE:
+                row = rows[-1]
+                # A run placed anew on the same line (a bullet's text, a tab stop) is a separate word
+                if moved and not row[2].endswith(" ") and not text.startswith(" "):
+                    row[2] += " "
+                row[2] += text
+            else:
+                rows.append([x, y, text])
+        if not rows:
+            continue
+        margin = min(row[0] for row in rows)
+        for x, _, text in rows:
+            indent = int(round((x - margin) / INDENT_UNIT))
+            lines.append(" " * indent + text.strip())
+    return lines
@@ -0,0 +1,115 @@
+"""
+Rank a pool of resumes against one job posting.
+
+ResumeIndex is an incremental inverted index over each resume's skills,
+experience bullets and project text, tokenized exactly like the job
+description scorer (tokens.terms). A query scores the posting's terms with
+BM25 over the postings lists only, blends that with the resume's stored ATS
+heuristic score, and keeps the top k with a heap.
+"""
+import heapq
+import math
+from collections import Counter, namedtuple
+
+import ats_logic
+from models import as_resume_dict
+from tokens import terms
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+KEYWORD_WEIGHT = 0.7 # Share of the final score from keyword match; the rest is the ATS score
+
+Match = namedtuple('Match', ['resume_id', 'score', 'keyword_score', 'ats_score'])
+
+def indexed_text(resume):
+    """The text a resume is indexed on: skills, experience bullets and projects"""
+    data = as_resume_dict(resume)
+    parts = [data.get('skills', '')]
+    parts += [exp.get('responsibilities', '') for exp in data.get('experience') or []]
+    for proj in data.get('projects') or []:
+        parts += [proj.get('name', ''), proj.get('description', '')]
+    return "\n".join(p for p in parts if p)
+
+class ResumeIndex:
+    def __init__(self):
+        self._postings = {}   # term -> {resume_id: term frequency}
+        self._doc_terms = {}  # resume_id -> Counter of its terms, for updates
+        self._doc_len = {}    # resume_id -> number of terms
+        self._ats = {}        # resume_id -> ATS heuristic score
+        self._total_len = 0
+
+    def __len__(self):
+        return len(self._doc_len)
+
+    def __contains__(self, resume_id):
+        return resume_id in self._doc_len
+
+    def add(self, resume_id, resume):
+        """Adds a resume (dict or Resume), replacing any previous version with that id"""
+        if resume_id in self._doc_len:
+            self.remove(resume_id)
+
+        counts = Counter(terms(indexed_text(resume)))
+        for term, tf in counts.items():
+            self._postings.setdefault(term, {})[resume_id] = tf
+        length = sum(counts.values())
+        self._doc_terms[resume_id] = counts
+        self._doc_len[resume_id] = length
+        self._total_len += length
+        self._ats[resume_id] = ats_logic.calculate_ats_score(resume)[0]
+
+    update = add
+
+    def add_many(self, items):
+        """Adds (resume_id, resume) pairs"""
+        for resume_id, resume in items:
+            self.add(resume_id, resume)
+
+    def remove(self, resume_id):
+        """Drops a resume; only its own postings are touched"""
+        counts = self._doc_terms.pop(resume_id)
+        for term in counts:
+            postings = self._postings[term]
+            del postings[resume_id]
+            if not postings:
+                del self._postings[term]
+        self._total_len -= self._doc_len.pop(resume_id)
+        del self._ats[resume_id]
+
+    def search(self, job_description, k=50, keyword_weight=KEYWORD_WEIGHT):
+        """
+        Returns the top k Matches for a posting, best first. keyword_score is
+        BM25 normalized to 0..1 by its ceiling for this query; score blends it
+        with the ATS score (0..100 scaled to 0..1).
+        """
+        n = len(self._doc_len)
+        if not n:
+            return []
+        avg_len = self._total_len / n or 1.0
+
+        query = Counter(t for t in terms(job_description) if t in self._postings)
+        accumulators = {}
+        ceiling = 0.0
+        doc_len = self._doc_len
+        length_scale = BM25_K1 * BM25_B / avg_len
+        length_base = BM25_K1 * (1 - BM25_B)
+        for term, qtf in query.items():
+            postings = self._postings[term]
+            df = len(postings)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            weight = qtf * idf * (BM25_K1 + 1)
+            ceiling += weight
+            for resume_id, tf in postings.items():
+                gain = weight * tf / (tf + length_base + length_scale * doc_len[resume_id])
+                accumulators[resume_id] = accumulators.get(resume_id, 0.0) + gain
+        if not ceiling:
+            return []
+
+        def blended(item):
+            resume_id, raw = item
+            keyword_score = raw / ceiling
+            ats_score = self._ats[resume_id]
+            score = keyword_weight * keyword_score + (1 - keyword_weight) * ats_score / 100
+            return Match(resume_id, score, keyword_score, ats_score)
+
+        return heapq.nlargest(k, map(blended, accumulators.items()), key=lambda m: m.score)
@@ -0,0 +1,170 @@
+"""
+Content-addressed cache of rendered resumes.
+
+Entries are keyed by a SHA-256 of the normalized layout (so whitespace and
+bullet-marker differences that render identically share an entry), the
+format and the Styling. Lookups go memory -> disk; each tier has its own
+byte cap and evicts least recently used entries first. A hit returns the
+stored bytes without importing or calling any renderer backend. One cache
+can be shared by threads; worker processes share only the disk tier.
+
+    cache = RenderCache(disk_dir="/tmp/resume_renders")
+    cache = RenderCache.default() # Disk tier in the per-user cache directory
+    generator.generate_resume(data, "out.pdf", "pdf", cache=cache)
+"""
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from constants import CACHE_APP_NAME, RENDER_CACHE_MEMORY_BYTES, RENDER_CACHE_DISK_BYTES
+
+CACHE_VERSION = 1 # Bump when renderer output changes for the same layout
+
+def cache_key(layout, export_format, style):
+    """Hex digest identifying one rendered output"""
+    payload = json.dumps([CACHE_VERSION, export_format, list(style), dataclasses.asdict(layout)],
+                         sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def user_cache_dir():
+    """The per-user cache directory: platformdirs' when installed, else ~/.cache/<CACHE_APP_NAME>"""
+    try:
+        from platformdirs import user_cache_dir as platform_cache_dir
+    except ImportError:
+        return os.path.join(os.path.expanduser("~"), ".cache", CACHE_APP_NAME)
+    return platform_cache_dir(CACHE_APP_NAME)
+
+class RenderCache:
+    def __init__(self, memory_bytes=RENDER_CACHE_MEMORY_BYTES, disk_dir=None, disk_bytes=RENDER_CACHE_DISK_BYTES):
+        """memory_bytes=0 or disk_dir=None turns that tier off"""
+        self.memory_bytes = memory_bytes
+        self.disk_dir = disk_dir
+        self.disk_bytes = disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict() # key -> bytes, least recently used first
+        self._memory_total = 0
+        self._disk = OrderedDict()   # key -> file size, least recently used first
+        self._disk_total = 0
+        self._lock = threading.Lock() # Guards the LRU bookkeeping of both tiers
+        if disk_dir:
+            self._scan_disk()
+
+    @classmethod
+    def default(cls):
+        """Cache with both tiers, configured from constants.py; renders are kept under user_cache_dir()"""
+        return cls(disk_dir=os.path.join(user_cache_dir(), "renders"))
+
+    def __getstate__(self):
+        # Ship the configuration to worker processes, not the memory tier
+        return (self.memory_bytes, self.disk_dir, self.disk_bytes)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._memory.keys() | self._disk.keys())
+
+    def get(self, key):
+        """Returns the cached bytes for key, or None"""
+        with self._lock:
+            content = self._memory.get(key)
+            if content is not None:
+                self._memory.move_to_end(key)
+            else:
+                content = self._read_disk(key)
+                if content is not None:
+                    self._put_memory(key, content)
+            if content is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return content
+
+    def put(self, key, content):
+        with self._lock:
+            self._put_memory(key, content)
+            self._write_disk(key, content)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_total = 0
+            for key in list(self._disk):
+                self._remove_disk(key)
+
+    # --- memory tier ---
+    def _put_memory(self, key, content):
+        if len(content) > self.memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_total -= len(old)
+        self._memory[key] = content
+        self._memory_total += len(content)
+        while self._memory_total > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_total -= len(evicted)
+
+    # --- disk tier ---
+    def _path(self, key):
+        return os.path.join(self.disk_dir, key)
+
+    def _scan_disk(self):
+        """Rebuilds the disk index from the directory, oldest access first"""
+        os.makedirs(self.disk_dir, exist_ok=True)
+        found = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.is_file() and len(entry.name) == 64:
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, key, size in sorted(found):
+            self._disk[key] = size
+            self._disk_total += size
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                content = f.read()
+            os.utime(self._path(key)) # mtime is the LRU clock across processes
+        except FileNotFoundError:
+            self._forget_disk(key)
+            return None
+        if key not in self._disk: # Written by another process
+            self._disk_total += len(content)
+            self._disk[key] = len(content)
+        self._disk.move_to_end(key)
+        return content
+
+    def _write_disk(self, key, content):
+        if not self.disk_dir or len(content) > self.disk_bytes:
+            return
+        # Write then rename, so a concurrent reader never sees a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, self._path(key))
+        self._forget_disk(key)
+        self._disk[key] = len(content)
+        self._disk_total += len(content)
+        while self._disk_total > self.disk_bytes:
+            self._remove_disk(next(iter(self._disk)))
+
+    def _forget_disk(self, key):
+        size = self._disk.pop(key, None)
+        if size is not None:
+            self._disk_total -= size
+
+    def _remove_disk(self, key):
+        self._forget_disk(key)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,118 @@
+"""
+DOCX backend for generator.py, imported the first time a .docx is rendered.
+"""
+import io
+import functools
+from docx import Document
+from docx.shared import Pt, Inches
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+import instrument
+from styling import current_styling
+
+DOCX_SPACE_AFTER = 10 # Points after a Normal paragraph in python-docx's default template
+
+@functools.lru_cache(maxsize=4)
+def _docx_base_template(style):
+    """
+    Builds an empty document with margins, the Normal font and the
+    'List Bullet' style already applied, and returns it saved as bytes.
+    Built once per Styling; a change to the styling constants gives a new key.
+    """
+    doc = Document()
+    
+    # Setup Margins
+    for section in doc.sections:
+        section.top_margin = Inches(style.margin_top)
+        section.bottom_margin = Inches(style.margin_bottom)
+        section.left_margin = Inches(style.margin_left)
+        section.right_margin = Inches(style.margin_right)
+    
+    # Setup Default Font
+    for style_name in ('Normal', 'List Bullet'):
+        font = doc.styles[style_name].font
+        font.name = style.font_name
+        font.size = Pt(style.font_size_body)
+    if style.spacing != 1:
+        doc.styles['Normal'].paragraph_format.space_after = Pt(DOCX_SPACE_AFTER * style.spacing)
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+def _new_docx(style):
+    """Returns a fresh Document cloned from the cached base template"""
+    return Document(io.BytesIO(_docx_base_template(style)))
+
+def render(layout, stream, style=None):
+    trace = instrument.active()
+    if trace:
+        trace.lap()
+    style = style or current_styling()
+    gap = style.spacing
+    doc = _new_docx(style)
+
+    # --- Header (Contact Info) ---
+    name_paragraph = doc.add_paragraph()
+    name_paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    run = name_paragraph.add_run(layout.name.upper())
+    run.bold = True
+    run.font.size = Pt(style.font_size_name)
+    run.font.name = style.font_name
+
+    contact_paragraph = doc.add_paragraph(" | ".join(layout.contact))
+    contact_paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    contact_paragraph.paragraph_format.space_after = Pt(12 * gap)
+
+    # --- Helper for Heading ---
+    def add_heading(text):
+        p = doc.add_paragraph()
+        run = p.add_run(text.upper())
+        run.bold = True
+        run.font.size = Pt(style.font_size_heading)
+        run.font.name = style.font_name
+        p.paragraph_format.space_before = Pt(12 * gap)
+        p.paragraph_format.space_after = Pt(6 * gap)
+        # Add a simple bottom border if possible, or just a line divider? 
+        # Word borders are tricky with python-docx without XML hacking.
+        # Staying simple (No visual lines to avoid graphics issues is safer for strict ATS, 
+        # though border-bottom is usually fine. We'll stick to bold caps).
+
+    def add_bullet(text):
+        p_bull = doc.add_paragraph(text, style='List Bullet')
+        p_bull.paragraph_format.space_after = Pt(2 * gap)
+
+    for section in layout.sections:
+        add_heading(section.title)
+
+        # Summary / Skills: a clean paragraph is safer for density than a list
+        if section.text:
+            p = doc.add_paragraph(section.text)
+            p.alignment = WD_ALIGN_PARAGRAPH.LEFT
+
+        for entry in section.entries:
+            # Line 1: Company | Location (bold name, plain detail)
+            p_head = doc.add_paragraph()
+            p_head.add_run(entry.heading).bold = True
+            if entry.heading_detail:
+                p_head.add_run(f" | {entry.heading_detail}")
+
+            # Line 2: Title | Dates
+            if entry.subheading or entry.subheading_detail:
+                p_sub = doc.add_paragraph()
+                p_sub.add_run(entry.subheading).italic = entry.italic_subheading
+                if entry.subheading_detail:
+                    p_sub.add_run(f" | {entry.subheading_detail}")
+
+            for bullet in entry.bullets:
+                add_bullet(bullet)
+
+        for bullet in section.bullets:
+            add_bullet(bullet)
+
+    if trace:
+        trace.lap('docx.build')
+        trace.count('docx.paragraphs', len(doc.paragraphs))
+    doc.save(stream)
+    if trace:
+        trace.lap('docx.serialize')
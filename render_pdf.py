@@ -0,0 +1,97 @@
+"""
+PDF backend for generator.py, imported the first time a PDF is rendered.
+"""
+import functools
+from xml.sax.saxutils import escape
+from reportlab.lib.pagesizes import LETTER
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+import instrument
+from constants import PDF_LEADING
+from styling import current_styling
+
+# ReportLab has no Arial out of the box; use the metric-compatible base-14 fonts
+_PDF_FONTS = {
+    "Arial": ("Helvetica", "Helvetica-Bold"),
+    "Helvetica": ("Helvetica", "Helvetica-Bold"),
+    "Times New Roman": ("Times-Roman", "Times-Bold"),
+    "Courier New": ("Courier", "Courier-Bold"),
+}
+
+@functools.lru_cache(maxsize=16)
+def _pdf_styles(style):
+    """
+    Paragraph styles for the PDF renderer, derived from the Styling.
+    Built once per Styling and shared by every render.
+    """
+    regular, bold = _PDF_FONTS.get(style.font_name, _PDF_FONTS["Arial"])
+    normal = getSampleStyleSheet()['Normal']
+    gap = style.spacing
+
+    def make(name, size, font, **kwargs):
+        return ParagraphStyle(name, parent=normal, fontName=font, fontSize=size, leading=size * PDF_LEADING, **kwargs)
+
+    return {
+        'name': make('Name', style.font_size_name, bold, spaceAfter=6 * gap),
+        'heading': make('Heading', style.font_size_heading, bold, spaceAfter=6 * gap, spaceBefore=12 * gap),
+        'body': make('Body', style.font_size_body, regular, spaceAfter=2 * gap),
+        'bullet': make('Bullet', style.font_size_body, regular, leftIndent=20, spaceAfter=2 * gap, bulletText='•'),
+    }
+
+def render(layout, stream, style=None):
+    # Plain PDF using ReportLab
+    trace = instrument.active()
+    if trace:
+        trace.lap()
+    style = style or current_styling()
+    doc = SimpleDocTemplate(
+        stream,
+        pagesize=LETTER,
+        rightMargin=style.margin_right * inch, leftMargin=style.margin_left * inch,
+        topMargin=style.margin_top * inch, bottomMargin=style.margin_bottom * inch
+    )
+    styles = _pdf_styles(style)
+    style_name = styles['name']
+    style_heading = styles['heading']
+    style_body = styles['body']
+    style_bullet = styles['bullet']
+    story = []
+
+    # Header (Paragraph text is markup, so user text is escaped)
+    story.append(Paragraph(escape(layout.name.upper()), style_name))
+    story.append(Paragraph(escape(" | ".join(layout.contact)), style_body))
+    story.append(Spacer(1, 12 * style.spacing))
+
+    for section in layout.sections:
+        story.append(Paragraph(escape(section.title.upper()), style_heading))
+        if section.text:
+            story.append(Paragraph(escape(section.text), style_body))
+
+        for entry in section.entries:
+            header = f"<b>{escape(entry.heading)}</b>"
+            if entry.heading_detail:
+                header += f" | {escape(entry.heading_detail)}"
+            if entry.subheading or entry.subheading_detail:
+                sub = escape(entry.subheading)
+                if entry.italic_subheading:
+                    sub = f"<i>{sub}</i>"
+                if entry.subheading_detail:
+                    sub += f" | {escape(entry.subheading_detail)}"
+                header += f"<br/>{sub}"
+            story.append(Paragraph(header, style_body))
+            for bullet in entry.bullets:
+                story.append(Paragraph(escape(bullet), style_bullet))
+            story.append(Spacer(1, 6 * style.spacing))
+
+        for bullet in section.bullets:
+            story.append(Paragraph(escape(bullet), style_bullet))
+
+    if trace:
+        trace.lap('pdf.build')
+        trace.count('pdf.paragraphs', sum(isinstance(f, Paragraph) for f in story))
+    doc.build(story)
+    if trace:
+        trace.lap('pdf.layout')
+        trace.count('pdf.pages', doc.page)
@@ -0,0 +1,38 @@
+"""
+Plain-text backend for generator.py.
+"""
+import instrument
+
+def render(layout, stream, style=None): # Plain text has no styling
+    trace = instrument.active()
+    if trace:
+        trace.lap()
+    lines = []
+    
+    # Header
+    lines.append(layout.name.upper())
+    lines.append(" | ".join(layout.contact))
+    lines.append("")
+
+    for section in layout.sections:
+        lines.append(section.title.upper())
+        lines.append("-" * len(section.title))
+        if section.text:
+            lines.append(section.text)
+        for entry in section.entries:
+            lines.append(_joined_detail(entry.heading, entry.heading_detail))
+            if entry.subheading or entry.subheading_detail:
+                lines.append(_joined_detail(entry.subheading, entry.subheading_detail))
+            for bullet in entry.bullets:
+                lines.append(f"- {bullet}")
+            lines.append("")
+        for bullet in section.bullets:
+            lines.append(f"- {bullet}")
+        lines.append("")
+
+    stream.write("\n".join(lines).encode('utf-8'))
+    if trace:
+        trace.lap('txt.build')
+
+def _joined_detail(text, detail):
+    return f"{text} | {detail}" if detail else text
@@ -0,0 +1,275 @@
+"""
+Rewrites the weak phrases of WEAK_WORDS into their stronger suggestions.
+
+All bullet text of a resume (or of a whole batch) is joined and scanned once
+with a compiled PhraseMatcher. Each hit is rewritten with a few grammar rules:
+
+- the replacement takes the case of what it replaces (line start, mid-sentence, ALL CAPS)
+- "responsible for managing X" / "worked on building X" become "Managed X" / "Built X"
+- "was responsible for X" drops the "was"; "helped (to) build X" becomes "Assisted in building X"
+- "a team player" / "an expert at" drop the article ("collaborative", "proficient in")
+- phrases that map to themselves ("proficient in") are left alone
+
+Nothing is changed in place. The result is a list of Rewrite lines, one per
+changed bullet, that the user accepts or drops before apply_rewrites:
+
+    rewrites = suggest_rewrites(resume)
+    print(format_diff(rewrites))
+    resume = apply_rewrites(resume, [r for r in rewrites if accepted(r)])
+
+    python rewrite.py resumes.jsonl               # diffs as JSONL
+    python rewrite.py resumes.jsonl --apply -o rewritten.jsonl
+"""
+import argparse
+import bisect
+import itertools
+import json
+import sys
+from collections import namedtuple
+
+from constants import ACTION_VERBS, WEAK_WORDS
+from matcher import PhraseMatcher
+from models import as_resume_dict
+
+# field: e.g. 'experience[0].responsibilities'; line_no counts from 0 within the field
+Rewrite = namedtuple('Rewrite', ['field', 'line_no', 'before', 'after', 'phrases'])
+
+REPLACEMENTS = {weak: strong for weak, strong in WEAK_WORDS.items() if weak != strong.lower()}
+_NOUN_PHRASES = {"expert at", "hard worker", "team player"} # Lose a leading "a"/"an"
+_VERB_PHRASES = {"responsible for", "worked on"}             # Merge with a following gerund
+_ARTICLES = ("a ", "an ")
+_BE_VERBS = ("was ", "were ", "is ", "am ", "are ", "been ") # Dropped before a verb phrase
+_HELP_PHRASES = {"helped"}                                   # "helped build" -> "assisted in building"
+_IRREGULAR_PAST = {
+    "leading": "Led", "building": "Built", "overseeing": "Oversaw", "running": "Ran",
+    "writing": "Wrote", "making": "Made", "driving": "Drove", "setting": "Set",
+    "bringing": "Brought", "teaching": "Taught", "selling": "Sold", "taking": "Took",
+    "giving": "Gave", "keeping": "Kept", "holding": "Held", "growing": "Grew",
+    "meeting": "Met", "winning": "Won", "sending": "Sent", "spending": "Spent",
+    "managing": "Managed", "creating": "Created", "designing": "Designed",
+    "maintaining": "Maintained", "handling": "Handled", "supporting": "Supported",
+    "testing": "Tested", "monitoring": "Monitored", "tracking": "Tracked",
+    "reviewing": "Reviewed", "preparing": "Prepared", "organizing": "Organized",
+    "training": "Trained", "planning": "Planned", "launching": "Launched",
+}
+
+def _gerund(past):
+    lower = past.lower()
+    if lower.endswith("ied"):
+        return lower[:-3] + "ying"
+    return lower[:-2] + "ing"
+
+# "developing" -> "Developed", from the action verbs plus common irregular forms
+GERUND_TO_PAST = {_gerund(verb): verb for verb in ACTION_VERBS if verb.endswith("ed")}
+GERUND_TO_PAST.update(_IRREGULAR_PAST)
+
+_MATCHER = PhraseMatcher(REPLACEMENTS)
+_SEPARATOR = "\x00"
+
+def _gerund_of(base):
+    """The -ing form of a base verb if it is one of GERUND_TO_PAST, else None"""
+    for gerund in (base + "ing", base[:-1] + "ing" if base.endswith("e") else None, base + base[-1:] + "ing"):
+        if gerund in GERUND_TO_PAST:
+            return gerund
+    return None
+
+def _next_word(text, pos):
+    """(word, end) of the word starting at pos, or ('', pos)"""
+    end = pos
+    while end < len(text) and _is_word_char(text[end]):
+        end += 1
+    return text[pos:end], end
+
+def _preceded_by(lower, text, start, words, floor):
+    """Start of whichever of words ends right at start (on a word boundary), or None"""
+    for word in words:
+        begin = start - len(word)
+        if begin >= floor and lower[begin:start] == word and (begin == 0 or not _is_word_char(text[begin - 1])):
+            return begin
+    return None
+
+def _cased(replacement, original, line_start):
+    if original.isupper() and any(c.isalpha() for c in original):
+        return replacement.upper()
+    if line_start or original[:1].isupper():
+        return replacement[:1].upper() + replacement[1:]
+    return replacement[:1].lower() + replacement[1:]
+
+def _at_line_start(text, pos):
+    """True when only whitespace, bullet markers or a sentence end precede pos"""
+    while pos and text[pos - 1] in " \t•-*–·":
+        pos -= 1
+    return not pos or text[pos - 1] in "\n.!?:" + _SEPARATOR
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+def _hits(text, lower):
+    """Leftmost-longest whole-word matches as (start, end, phrase)"""
+    taken_until = 0
+    hits = []
+    for start, phrase in sorted(_MATCHER.finditer(lower), key=lambda h: (h[0], -len(h[1]))):
+        end = start + len(phrase)
+        if start < taken_until:
+            continue
+        if start and _is_word_char(text[start - 1]) or end < len(text) and _is_word_char(text[end]):
+            continue
+        if start > 1 and text[start - 1] == "-" and text[start - 2].isalpha(): # Part of a compound: "Co-worked"
+            continue
+        hits.append((start, end, phrase))
+        taken_until = end
+    return hits
+
+def _rewrite_joined(text):
+    """Rewrites every hit in text; returns the new text and the sorted phrase positions"""
+    lower = text.lower()
+    if len(lower) != len(text): # A few characters lowercase to two; keep offsets aligned
+        lower = "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+    pieces = []
+    applied = [] # (position in text, phrase)
+    pos = 0
+    for start, end, phrase in _hits(text, lower):
+        if start < pos:
+            continue
+        replacement = REPLACEMENTS[phrase]
+        original = text[start:end]
+        cut_start = start
+
+        if phrase in _NOUN_PHRASES:
+            cut_start = _preceded_by(lower, text, start, _ARTICLES, pos)
+        elif phrase in _VERB_PHRASES:
+            cut_start = _preceded_by(lower, text, start, _BE_VERBS, pos)
+            word, word_end = _next_word(lower, end + 1)
+            if text[end:end + 1] == " " and word in GERUND_TO_PAST:
+                replacement = GERUND_TO_PAST[word]
+                end = word_end
+        elif phrase in _HELP_PHRASES and text[end:end + 1] == " ":
+            after = end + 4 if lower[end:end + 4] == " to " else end + 1
+            word, word_end = _next_word(lower, after)
+            gerund = _gerund_of(word) if word else None
+            if gerund:
+                replacement = f"{replacement} in {gerund}"
+                end = word_end
+        if cut_start is None:
+            cut_start = start
+        else:
+            original = text[cut_start:start] + original
+
+        pieces.append(text[pos:cut_start])
+        pieces.append(_cased(replacement, original, _at_line_start(text, cut_start)))
+        applied.append((start, phrase))
+        pos = end
+    pieces.append(text[pos:])
+    return "".join(pieces), applied
+
+def rewrite_text(text):
+    """Returns (rewritten text, [phrases rewritten])"""
+    new_text, applied = _rewrite_joined(text or "")
+    return new_text, [phrase for _, phrase in applied]
+
+def _bullet_fields(resume):
+    """(field path, text) for the free-text fields that hold bullets"""
+    fields = []
+    if isinstance(resume.get('summary'), str):
+        fields.append(('summary', resume['summary']))
+    for i, exp in enumerate(resume.get('experience') or []):
+        fields.append((f"experience[{i}].responsibilities", exp.get('responsibilities') or ''))
+    for i, proj in enumerate(resume.get('projects') or []):
+        fields.append((f"projects[{i}].description", proj.get('description') or ''))
+    return fields
+
+def suggest_batch(resumes):
+    """
+    Scans the bullets of every resume in one pass.
+    Returns one list of Rewrite lines per resume.
+    """
+    resumes = [as_resume_dict(resume) for resume in resumes]
+    lines = [] # (resume index, field, line_no, text)
+    for index, resume in enumerate(resumes):
+        for field, text in _bullet_fields(resume):
+            for line_no, line in enumerate(text.split("\n")):
+                lines.append((index, field, line_no, line.replace(_SEPARATOR, " ")))
+
+    joined = _SEPARATOR.join(line for *_, line in lines)
+    rewritten, applied = _rewrite_joined(joined)
+    new_lines = rewritten.split(_SEPARATOR)
+
+    starts = [] # Offset of each line in the joined text, to attribute phrases
+    offset = 0
+    for *_, line in lines:
+        starts.append(offset)
+        offset += len(line) + 1
+    phrases = [[] for _ in lines]
+    for position, phrase in applied:
+        phrases[bisect.bisect_right(starts, position) - 1].append(phrase)
+
+    results = [[] for _ in resumes]
+    for (index, field, line_no, before), after, found in zip(lines, new_lines, phrases):
+        if after != before:
+            results[index].append(Rewrite(field, line_no, before, after, found))
+    return results
+
+def suggest_rewrites(resume):
+    """Rewrite lines for one resume"""
+    return suggest_batch([resume])[0]
+
+def apply_rewrites(resume, rewrites):
+    """
+    Returns a copy of the resume dict with the given (accepted) rewrites applied.
+    Raises ValueError if a line no longer matches what the rewrite was made from.
+    """
+    data = dict(as_resume_dict(resume))
+    for name in ('experience', 'projects'):
+        if data.get(name):
+            data[name] = [dict(entry) for entry in data[name]]
+    for rewrite in rewrites:
+        section, _, key = rewrite.field.partition(".")
+        if key:
+            name, _, index = section.partition("[")
+            target = data[name][int(index.rstrip("]"))]
+        else:
+            target, key = data, section
+        lines = (target.get(key) or "").split("\n")
+        if rewrite.line_no >= len(lines) or lines[rewrite.line_no] != rewrite.before:
+            raise ValueError(f"{rewrite.field} line {rewrite.line_no} changed since the rewrite was suggested")
+        lines[rewrite.line_no] = rewrite.after
+        target[key] = "\n".join(lines)
+    return data
+
+def format_diff(rewrites):
+    """Human-readable diff of rewrite lines"""
+    out = []
+    for rewrite in rewrites:
+        out.append(f"@@ {rewrite.field} line {rewrite.line_no + 1} ({', '.join(rewrite.phrases)})")
+        out.append(f"- {rewrite.before}")
+        out.append(f"+ {rewrite.after}")
+    return "\n".join(out)
+
+def main(argv=None):
+    from batch import iter_records
+    parser = argparse.ArgumentParser(description="Suggest or apply weak-phrase rewrites for a batch of resumes.")
+    parser.add_argument("source", help="Directory of .json files, a .jsonl file, or '-' for stdin")
+    parser.add_argument("-o", "--output", default="-", help="Output JSONL path (default: stdout)")
+    parser.add_argument("--apply", action="store_true", help="Write rewritten resumes instead of the diffs")
+    parser.add_argument("--batch-size", type=int, default=256, help="Resumes scanned together")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        records = iter_records(args.source)
+        while chunk := list(itertools.islice(records, args.batch_size)):
+            ids = [record_id for record_id, _ in chunk]
+            resumes = [json.loads(raw) for _, raw in chunk]
+            for record_id, resume, rewrites in zip(ids, resumes, suggest_batch(resumes)):
+                if args.apply:
+                    record = {'id': record_id, 'resume': apply_rewrites(resume, rewrites)}
+                else:
+                    record = {'id': record_id, 'rewrites': [r._asdict() for r in rewrites]}
+                out.write(json.dumps(record) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()
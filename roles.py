@@ -0,0 +1,188 @@
+"""
+Prebuilt role index: exact, alias, token and fuzzy lookup of target roles.
+
+Lookups run in this order and stop at the first hit:
+1. the whole query is a role name or alias ("hrbp", "Data Scientist")
+2. a role name or alias appears as a run of words in the query
+   ("Senior Software Engineer II", "SWE II") - the longest one wins
+3. ranked fuzzy match on character trigrams ("sofware enginer")
+"""
+import bisect
+import json
+import re
+from collections import defaultdict
+
+FUZZY_MIN_SCORE = 0.45
+FUZZY_CANDIDATES = 256 # Names scored per fuzzy lookup, gathered from the rarest trigrams first
+MAX_NGRAM = 6 # Longest role name, in words, found inside a longer title
+
+def normalize_role(text):
+    """Lowercases and reduces a role title to space separated word tokens"""
+    return " ".join(re.findall(r"[a-z0-9+#]+", (text or "").lower()))
+
+def _trigrams(name):
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class RoleIndex:
+    def __init__(self):
+        self._keywords = {}               # canonical role -> keywords
+        self._names = {}                  # normalized name or alias -> canonical role
+        self._display = {}                # normalized name or alias -> text shown to users
+        self._trigrams = defaultdict(set) # trigram -> normalized names
+        self._name_trigrams = {}          # normalized name -> its trigram set
+        self._tokens = defaultdict(set)   # word -> normalized names containing it
+        self._sorted_names = []           # for prefix completion
+        self._sorted_tokens = []
+
+    @classmethod
+    def from_roles(cls, roles, aliases=None):
+        """Builds an index from {role: keywords} and optional {alias: role}"""
+        index = cls()
+        for role, keywords in roles.items():
+            index.add_role(role, keywords)
+        for alias, role in (aliases or {}).items():
+            index.add_alias(alias, role)
+        return index
+
+    @classmethod
+    def from_taxonomy(cls, path):
+        """
+        Loads a JSON taxonomy of the form
+        {"role": {"keywords": [...], "aliases": [...]}} or {"role": [keywords]}.
+        """
+        with open(path, encoding='utf-8') as f:
+            taxonomy = json.load(f)
+        index = cls()
+        for role, entry in taxonomy.items():
+            if isinstance(entry, dict):
+                index.add_role(role, entry.get('keywords', []), entry.get('aliases', []))
+            else:
+                index.add_role(role, entry)
+        return index
+
+    def __len__(self):
+        return len(self._keywords)
+
+    def add_role(self, role, keywords, aliases=()):
+        """Adds or replaces a role; later lookups see it immediately"""
+        self._keywords[role] = list(keywords)
+        self._add_name(role, role)
+        for alias in aliases:
+            self._add_name(alias, role)
+
+    def add_alias(self, alias, role):
+        if role not in self._keywords:
+            raise KeyError(f"Unknown role: {role}")
+        self._add_name(alias, role)
+
+    def _add_name(self, text, role):
+        name = normalize_role(text)
+        if not name:
+            return
+        if name not in self._names:
+            bisect.insort(self._sorted_names, name)
+            grams = frozenset(_trigrams(name))
+            self._name_trigrams[name] = grams
+            for gram in grams:
+                self._trigrams[gram].add(name)
+            for token in name.split():
+                if token not in self._tokens:
+                    bisect.insort(self._sorted_tokens, token)
+                self._tokens[token].add(name)
+        self._names[name] = role
+        self._display.setdefault(name, text)
+
+    def match(self, query, limit=5):
+        """Returns up to `limit` (role, score) pairs, best first; scores are in 0..1"""
+        name = normalize_role(query)
+        if not name:
+            return []
+        if name in self._names:
+            return [(self._names[name], 1.0)]
+
+        contained = self._contained_names(name)
+        if contained:
+            best = max(contained, key=len)
+            return [(self._names[best], 0.9)]
+
+        return self._fuzzy(name, limit)
+
+    def lookup(self, query):
+        """Returns the best matching canonical role, or None"""
+        matches = self.match(query, limit=1)
+        return matches[0][0] if matches else None
+
+    def keywords(self, query):
+        role = self.lookup(query)
+        return list(self._keywords[role]) if role else []
+
+    def complete(self, prefix, limit=10):
+        """
+        Autocomplete: names starting with the prefix, then names with a word
+        starting with it, then fuzzy matches. An empty prefix lists the roles.
+        """
+        name = normalize_role(prefix)
+        if not name:
+            return list(self._keywords)[:limit]
+
+        results = []
+        start = bisect.bisect_left(self._sorted_names, name)
+        for candidate in self._sorted_names[start:]:
+            if not candidate.startswith(name) or len(results) >= limit:
+                break
+            results.append(candidate)
+
+        if len(results) < limit and " " not in name:
+            extra = set()
+            start = bisect.bisect_left(self._sorted_tokens, name)
+            for token in self._sorted_tokens[start:]:
+                if not token.startswith(name):
+                    break
+                extra |= self._tokens[token]
+            results.extend(sorted(extra.difference(results)))
+
+        if not results:
+            results = [n for n, _ in self._fuzzy_names(name, limit)]
+        return [self._display[n] for n in results[:limit]]
+
+    def _contained_names(self, name):
+        words = name.split()
+        found = []
+        for size in range(min(MAX_NGRAM, len(words)), 0, -1):
+            for i in range(len(words) - size + 1):
+                gram = " ".join(words[i:i + size])
+                if gram in self._names:
+                    found.append(gram)
+            if found:
+                break
+        return found
+
+    def _fuzzy_names(self, name, limit):
+        grams = _trigrams(name)
+        # Rare trigrams are the most selective; common ones ("eng", "er ")
+        # would pull in most of a large taxonomy, so stop once there are
+        # enough candidates and score only those (Dice on trigram sets)
+        postings = sorted((self._trigrams[g] for g in grams if g in self._trigrams), key=len)
+        candidates = set()
+        for names in postings:
+            if candidates and len(candidates) + len(names) > FUZZY_CANDIDATES:
+                break
+            candidates |= names
+
+        scored = []
+        for candidate in candidates:
+            other = self._name_trigrams[candidate]
+            score = 2 * len(grams & other) / (len(grams) + len(other))
+            if score >= FUZZY_MIN_SCORE:
+                scored.append((candidate, score))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
+
+    def _fuzzy(self, name, limit):
+        ranked = {}
+        for candidate, score in self._fuzzy_names(name, limit * 3):
+            role = self._names[candidate]
+            if role not in ranked:
+                ranked[role] = round(score * 0.85, 3)
+        return list(ranked.items())[:limit]
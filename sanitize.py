@@ -0,0 +1,149 @@
+"""
+ATS-safe text normalization for whole resumes and batches.
+
+One translation table, built at import, maps smart quotes and dashes to
+their ASCII forms, transliterates accented Latin letters (José -> Jose,
+Straße -> Strasse) and deletes emoji, so a string is cleaned in a single
+str.translate pass. Every other character is kept, including the symbols
+resumes use as bullets and arrows (✓ ✔ ❖ → ⌘). Only the spaces left on
+either side of a deleted emoji are tidied up.
+
+sanitize_resume and sanitize_batch join all the text of the resumes, clean
+it with one translate call and hand back the cleaned copies together with
+the list of fields that changed:
+
+    clean, changes = sanitize_resume(resume)
+    for change in changes:
+        print(change.field, repr(change.before), '->', repr(change.after))
+"""
+import re
+import unicodedata
+from collections import namedtuple
+
+from models import as_resume_dict
+
+Change = namedtuple('Change', ['field', 'before', 'after']) # field: e.g. 'experience[0].responsibilities'
+
+_PUNCTUATION = {
+    "‘": "'", "’": "'", "‚": "'", "‛": "'", "′": "'", "´": "'",
+    "“": '"', "”": '"', "„": '"', "‟": '"', "″": '"', "«": '"', "»": '"',
+    "‐": "-", "‑": "-", "‒": "-", "–": "-", "—": "-", "―": "-", "−": "-",
+    "…": "...", "\u00a0": " ", "\u2009": " ", "\u202f": " ", "\u2007": " ",
+    "™": "(TM)", "®": "(R)", "©": "(C)",
+}
+# Letters NFKD does not split into a base letter plus accents
+_LETTERS = {
+    "ß": "ss", "Æ": "AE", "æ": "ae", "Œ": "OE", "œ": "oe", "Ø": "O", "ø": "o",
+    "Ł": "L", "ł": "l", "Đ": "D", "đ": "d", "Ð": "D", "ð": "d", "Þ": "Th", "þ": "th", "ı": "i",
+}
+# Extended_Pictographic code points outside the BMP: all emoji, never used as text symbols
+_EMOJI_RANGES = [
+    (0x1F000, 0x1F0FF), (0x1F10D, 0x1F10F), (0x1F12F, 0x1F12F), (0x1F16C, 0x1F171), (0x1F17E, 0x1F17F),
+    (0x1F18E, 0x1F18E), (0x1F191, 0x1F19A), (0x1F1AD, 0x1F1E5), (0x1F201, 0x1F20F), (0x1F21A, 0x1F21A),
+    (0x1F22F, 0x1F22F), (0x1F232, 0x1F23A), (0x1F23C, 0x1F23F), (0x1F249, 0x1F3FA), (0x1F400, 0x1F53D),
+    (0x1F546, 0x1F64F), (0x1F680, 0x1F6FF), (0x1F774, 0x1F77F), (0x1F7D5, 0x1F7FF), (0x1F80C, 0x1F80F),
+    (0x1F848, 0x1F84F), (0x1F85A, 0x1F85F), (0x1F888, 0x1F88F), (0x1F8AE, 0x1F8FF), (0x1F90C, 0x1F93A),
+    (0x1F93C, 0x1F945), (0x1F947, 0x1FAFF), (0x1FC00, 0x1FFFD),
+    # Extended_Pictographic BMP characters that display as emoji by default (Emoji_Presentation):
+    # ⌚ ⏰ ☕ ⚡ ✅ ✨ ❌ ❗ ⭐ ... The rest (✔ ☎ ★ ♥) are ordinary text symbols and stay
+    (0x231A, 0x231B), (0x23E9, 0x23EC), (0x23F0, 0x23F0), (0x23F3, 0x23F3), (0x25FD, 0x25FE),
+    (0x2614, 0x2615), (0x2648, 0x2653), (0x267F, 0x267F), (0x2693, 0x2693), (0x26A1, 0x26A1),
+    (0x26AA, 0x26AB), (0x26BD, 0x26BE), (0x26C4, 0x26C5), (0x26CE, 0x26CE), (0x26D4, 0x26D4),
+    (0x26EA, 0x26EA), (0x26F2, 0x26F3), (0x26F5, 0x26F5), (0x26FA, 0x26FA), (0x26FD, 0x26FD),
+    (0x2705, 0x2705), (0x270A, 0x270B), (0x2728, 0x2728), (0x274C, 0x274C), (0x274E, 0x274E),
+    (0x2753, 0x2755), (0x2757, 0x2757), (0x2795, 0x2797), (0x27B0, 0x27B0), (0x27BF, 0x27BF),
+    (0x2B1B, 0x2B1C), (0x2B50, 0x2B50), (0x2B55, 0x2B55),
+    # Parts of emoji sequences: flags, skin tones, keycaps, tag flags; VS16 turns ✔ into ✔️, so ✔️ -> ✔
+    (0x1F1E6, 0x1F1FF), (0x1F3FB, 0x1F3FF), (0x20E3, 0x20E3), (0xE0020, 0xE007F), (0xFE0F, 0xFE0F),
+]
+_INVISIBLE = "\u200b\u200c\u200d\u2060\ufeff" # Zero-width spaces and joiners (ZWJ glues emoji), word joiner, BOM
+_REMOVED = "\uffff" # Left where a character is deleted, for _tidy; a noncharacter, never in real text
+
+def _build_table():
+    table = {}
+    for low, high in _EMOJI_RANGES:
+        table.update(dict.fromkeys(range(low, high + 1), _REMOVED))
+    table.update(dict.fromkeys(map(ord, _INVISIBLE), _REMOVED))
+    # Latin-1 Supplement through Latin Extended-B
+    for code in range(0x00C0, 0x0250):
+        char = chr(code)
+        base = ''.join(c for c in unicodedata.normalize('NFKD', char) if not unicodedata.combining(c))
+        if base != char and base.isascii() and base:
+            table[code] = base
+    table.update({ord(k): v for k, v in _LETTERS.items()})
+    table.update({ord(k): v for k, v in _PUNCTUATION.items()})
+    return table
+
+TRANSLATION_TABLE = _build_table()
+# A deleted run with the spaces around it: at a line's edge it goes, between words one space stays
+_REMOVED_AT_EDGE_RE = re.compile(f"^[ \t]*{_REMOVED}[{_REMOVED} \t]*|[ \t]*{_REMOVED}[{_REMOVED} \t]*$", re.MULTILINE)
+_REMOVED_RE = re.compile(f"[ \t]*{_REMOVED}[{_REMOVED} \t]*")
+_SEPARATOR = "\x00" # Joins fields for the single translate pass; left alone by the table
+
+def _tidy(text):
+    """Closes the gaps left where emoji were removed; other spacing is kept as typed"""
+    if _REMOVED not in text:
+        return text
+    text = _REMOVED_AT_EDGE_RE.sub("", text)
+    return _REMOVED_RE.sub(lambda m: " " if m.group().strip(_REMOVED) else "", text)
+
+def sanitize_text(text):
+    """Cleans one string"""
+    cleaned = text.translate(TRANSLATION_TABLE)
+    return _tidy(cleaned) if cleaned != text else text
+
+def _texts(obj, path=''):
+    """Yields (field path, string) for every string in a nested resume dict"""
+    if isinstance(obj, str):
+        yield path, obj
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            yield from _texts(value, f"{path}.{key}" if path else key)
+    elif isinstance(obj, (list, tuple)):
+        for i, value in enumerate(obj):
+            yield from _texts(value, f"{path}[{i}]")
+
+def _rebuild(obj, cleaned):
+    """Copies obj, taking its strings from the `cleaned` iterator in _texts order"""
+    if isinstance(obj, str):
+        return next(cleaned)
+    if isinstance(obj, dict):
+        return {key: _rebuild(value, cleaned) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_rebuild(value, cleaned) for value in obj)
+    return obj
+
+def _translate_all(texts):
+    """Translates a list of strings with one str.translate call"""
+    if not texts:
+        return []
+    if any(_SEPARATOR in text for text in texts):
+        return [text.translate(TRANSLATION_TABLE) for text in texts]
+    return _SEPARATOR.join(texts).translate(TRANSLATION_TABLE).split(_SEPARATOR)
+
+def sanitize_batch(resumes):
+    """
+    Sanitizes a list of resumes (dicts or Resumes) in one pass.
+    Returns a list of (cleaned resume dict, [Change, ...]) pairs.
+    """
+    resumes = [as_resume_dict(resume) for resume in resumes]
+    fields = [list(_texts(resume)) for resume in resumes]
+    originals = [text for resume_fields in fields for _, text in resume_fields]
+    translated = iter(_translate_all(originals))
+
+    results = []
+    for resume, resume_fields in zip(resumes, fields):
+        cleaned = []
+        changes = []
+        for path, before in resume_fields:
+            after = next(translated)
+            if after != before:
+                after = _tidy(after)
+                changes.append(Change(path, before, after))
+            cleaned.append(after)
+        results.append((_rebuild(resume, iter(cleaned)), changes))
+    return results
+
+def sanitize_resume(resume):
+    """Returns (cleaned resume dict, [Change, ...]) for one resume"""
+    return sanitize_batch([resume])[0]
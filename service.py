@@ -0,0 +1,302 @@
+"""
+Headless HTTP service for scoring and rendering, standard library only.
+
+    python service.py --port 8080 --workers 4
+
+    POST /score   {"resume": {...}, "job_description": "..."}  -> {"score": 82, "feedback": [...]}
+    POST /render  {"resume": {...}, "format": "pdf"}           -> the file bytes
+    POST /batch   {"resumes": [{...}, ...]}                    -> {"results": [{"id": 0, "score": ...}, ...]}
+    GET  /metrics                                              -> throughput, latency percentiles, queue depth
+
+Requests are handled on one asyncio loop; scoring and rendering run in a
+bounded process pool. When `max_pending` requests are already queued or
+running, new ones are refused with 503 and a Retry-After header instead of
+piling up. A batch takes one of those slots and keeps at most one chunk per
+worker in the pool, so it fits on any server and still leaves room for others.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+import ats_logic
+import batch
+import generator
+from render_cache import RenderCache
+
+DEFAULT_PORT = 8080
+MAX_BODY_BYTES = 2 * 1024 * 1024
+MAX_BATCH_SIZE = 1000
+BATCH_CHUNKSIZE = 32
+KEEPALIVE_TIMEOUT = 15     # Seconds an idle connection is kept open
+LATENCY_WINDOW = 1024      # Recent requests per endpoint used for the percentiles
+THROUGHPUT_WINDOW = 60     # Seconds averaged for requests_per_second
+RETRY_AFTER = 1
+
+CONTENT_TYPES = {
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'pdf': 'application/pdf',
+    'txt': 'text/plain; charset=utf-8',
+}
+
+class HTTPError(Exception):
+    def __init__(self, status, message=None):
+        super().__init__(message or HTTPStatus(status).phrase)
+        self.status = status
+
+# --- Worker-side jobs (run in the process pool) ---
+_worker_cache = None
+
+def _score_job(resume, job_description):
+    return ats_logic.calculate_ats_score(resume, job_description)
+
+def _render_job(resume, export_format):
+    global _worker_cache
+    if _worker_cache is None:
+        _worker_cache = RenderCache() # Memory tier only, one per worker
+    return generator.render_resume(resume, export_format, cache=_worker_cache)
+
+def _batch_job(records):
+    return [batch.score_record(record) for record in records]
+
+class Metrics:
+    """Request counts, status counts, recent latencies and throughput per endpoint"""
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = Counter()
+        self.statuses = Counter()
+        self.rejected = 0
+        self._latencies = {}
+        self._recent = deque() # completion times within THROUGHPUT_WINDOW
+
+    def observe(self, endpoint, status, seconds):
+        now = time.monotonic()
+        self.requests[endpoint] += 1
+        self.statuses[status] += 1
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            self.rejected += 1
+        self._latencies.setdefault(endpoint, deque(maxlen=LATENCY_WINDOW)).append(seconds * 1000.0)
+        self._recent.append(now)
+        while self._recent and self._recent[0] < now - THROUGHPUT_WINDOW:
+            self._recent.popleft()
+
+    def snapshot(self, pending, max_pending):
+        now = time.monotonic()
+        while self._recent and self._recent[0] < now - THROUGHPUT_WINDOW:
+            self._recent.popleft()
+        window = min(THROUGHPUT_WINDOW, now - self.started) or 1.0
+        return {
+            'uptime_s': round(now - self.started, 3),
+            'requests_total': sum(self.requests.values()),
+            'requests_per_second': round(len(self._recent) / window, 3),
+            'requests': dict(self.requests),
+            'statuses': {str(k): v for k, v in self.statuses.items()},
+            'rejected': self.rejected,
+            'pending_jobs': pending,
+            'max_pending_jobs': max_pending,
+            'latency_ms': {name: _percentiles(values) for name, values in self._latencies.items()},
+        }
+
+def _percentiles(values):
+    ordered = sorted(values)
+    def pct(p):
+        return round(ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))], 3)
+    return {'n': len(ordered), 'p50': pct(50), 'p90': pct(90), 'p99': pct(99), 'max': round(ordered[-1], 3)}
+
+class ResumeService:
+    def __init__(self, workers=None, max_pending=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 4
+        self.pending = 0
+        self.metrics = Metrics()
+        # spawn: a forked worker would inherit open client sockets and hold connections open
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        self._routes = {
+            ('POST', '/score'): self.score,
+            ('POST', '/render'): self.render,
+            ('POST', '/batch'): self.batch,
+            ('GET', '/metrics'): self.get_metrics,
+        }
+
+    async def start(self, host='127.0.0.1', port=DEFAULT_PORT):
+        """Starts listening and returns the asyncio Server"""
+        return await asyncio.start_server(self._serve_connection, host, port)
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # --- Process pool with backpressure ---
+    async def _run(self, jobs, in_flight=None):
+        """
+        Runs (fn, *args) jobs in the pool as one pending request, or refuses
+        them if the queue is full. At most in_flight of them are in the pool at once.
+        """
+        if self.pending >= self.max_pending:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Server is busy, retry shortly")
+        self.pending += 1
+        loop = asyncio.get_running_loop()
+        limit = asyncio.Semaphore(in_flight or len(jobs))
+
+        async def run(job):
+            async with limit:
+                return await loop.run_in_executor(self._pool, *job)
+        try:
+            return await asyncio.gather(*(run(job) for job in jobs))
+        finally:
+            self.pending -= 1
+
+    # --- Endpoints: return (status, content_type, body bytes) ---
+    async def score(self, payload):
+        resume = _field(payload, 'resume', dict)
+        job_description = _field(payload, 'job_description', str, optional=True)
+        [(score, feedback)] = await self._run([(_score_job, resume, job_description)])
+        return _json(HTTPStatus.OK, {'score': score, 'feedback': feedback})
+
+    async def render(self, payload):
+        resume = _field(payload, 'resume', dict)
+        export_format = _field(payload, 'format', str, optional=True) or 'pdf'
+        if export_format not in CONTENT_TYPES:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Unsupported format: {export_format}")
+        [content] = await self._run([(_render_job, resume, export_format)])
+        return HTTPStatus.OK, CONTENT_TYPES[export_format], content
+
+    async def batch(self, payload):
+        resumes = _field(payload, 'resumes', (list, dict))
+        records = list(resumes.items() if isinstance(resumes, dict) else enumerate(resumes))
+        if len(records) > MAX_BATCH_SIZE:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"At most {MAX_BATCH_SIZE} resumes per batch")
+        chunks = [records[i:i + BATCH_CHUNKSIZE] for i in range(0, len(records), BATCH_CHUNKSIZE)]
+        results = await self._run([(_batch_job, chunk) for chunk in chunks], in_flight=self.workers)
+        return _json(HTTPStatus.OK, {'results': [r for chunk in results for r in chunk]})
+
+    async def get_metrics(self, payload):
+        return _json(HTTPStatus.OK, self.metrics.snapshot(self.pending, self.max_pending))
+
+    # --- HTTP/1.1 plumbing ---
+    async def handle(self, method, path, body):
+        """Routes one request; errors become JSON error responses"""
+        endpoint = urlsplit(path).path
+        handler = self._routes.get((method, endpoint))
+        try:
+            if handler is None:
+                known = any(route_path == endpoint for _, route_path in self._routes)
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED if known else HTTPStatus.NOT_FOUND)
+            payload = {}
+            if method == 'POST':
+                try:
+                    payload = json.loads(body or b'null')
+                except ValueError:
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be JSON")
+                if not isinstance(payload, dict):
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+            return await handler(payload)
+        except HTTPError as e:
+            return _json(e.status, {'error': str(e)})
+        except Exception as e:
+            return _json(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f"{type(e).__name__}: {e}"})
+
+    async def _serve_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                start = time.perf_counter()
+                try:
+                    method, path, version, headers = _parse_head(head)
+                    length = int(headers.get('content-length') or 0)
+                    if length < 0:
+                        raise ValueError(f"Negative Content-Length: {length}")
+                except ValueError:
+                    path = ''
+                    response = _json(HTTPStatus.BAD_REQUEST, {'error': "Malformed request line or headers"})
+                    keep_alive = False # Where the next request would start is unknown
+                else:
+                    keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                    if length > MAX_BODY_BYTES:
+                        response = _json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': "Body too large"})
+                        keep_alive = False # The unread body is still on the socket
+                    else:
+                        body = await reader.readexactly(length) if length else b''
+                        response = await self.handle(method, path, body)
+
+                status, content_type, content = response
+                writer.write(_response_head(status, content_type, len(content), keep_alive) + content)
+                await writer.drain()
+                endpoint = urlsplit(path).path
+                if not any(route_path == endpoint for _, route_path in self._routes):
+                    endpoint = 'other' # Keeps arbitrary paths out of the metrics
+                self.metrics.observe(endpoint, status, time.perf_counter() - start)
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            return
+        finally:
+            writer.close()
+
+def _parse_head(head):
+    lines = head.decode('latin-1').split("\r\n")
+    method, path, version = lines[0].split(" ", 2)
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return method.upper(), path, version, headers
+
+def _response_head(status, content_type, length, keep_alive):
+    status = HTTPStatus(status)
+    lines = [
+        f"HTTP/1.1 {status.value} {status.phrase}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {length}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if status == HTTPStatus.SERVICE_UNAVAILABLE:
+        lines.append(f"Retry-After: {RETRY_AFTER}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1')
+
+def _json(status, obj):
+    return status, 'application/json', json.dumps(obj).encode('utf-8')
+
+def _field(payload, name, kind, optional=False):
+    value = payload.get(name)
+    if optional and value is None:
+        return None
+    if not isinstance(value, kind):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"'{name}' is missing or has the wrong type")
+    return value
+
+async def serve(host, port, workers=None, max_pending=None):
+    service = ResumeService(workers, max_pending)
+    server = await service.start(host, port)
+    addresses = ", ".join(f"http://{s.getsockname()[0]}:{s.getsockname()[1]}" for s in server.sockets)
+    print(f"Serving on {addresses} with {service.workers} workers")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve resume scoring and rendering over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help="Requests queued or running before new ones get 503 (default: 4 per worker)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_pending))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
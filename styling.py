@@ -0,0 +1,29 @@
+"""
+Snapshot of the styling constants used by the renderers.
+
+The values are read from `constants` at call time, so anything cached on a
+Styling (prebuilt templates, stylesheets) is rebuilt when a constant changes.
+"""
+from collections import namedtuple
+
+import constants
+
+Styling = namedtuple('Styling', [
+    'font_name', 'font_size_body', 'font_size_heading', 'font_size_name',
+    'margin_top', 'margin_bottom', 'margin_left', 'margin_right',
+    'spacing', # Multiplier on the space between paragraphs
+])
+
+def current_styling():
+    """Returns the Styling described by the current values in constants.py"""
+    return Styling(
+        font_name=constants.FONT_NAME,
+        font_size_body=constants.FONT_SIZE_BODY,
+        font_size_heading=constants.FONT_SIZE_HEADING,
+        font_size_name=constants.FONT_SIZE_NAME,
+        margin_top=constants.MARGIN_TOP,
+        margin_bottom=constants.MARGIN_BOTTOM,
+        margin_left=constants.MARGIN_LEFT,
+        margin_right=constants.MARGIN_RIGHT,
+        spacing=constants.PARAGRAPH_SPACING,
+    )
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import async_api
+import ats_logic
+import generator
+import instrument
+from bench import synthetic_resume
+
+def test_score_and_render_match_sync():
+    resume = synthetic_resume(jobs=2, bullets=2)
+
+    async def main():
+        with instrument.record() as trace:
+            score = await async_api.score_async(resume)
+            content = await async_api.render_resume_async(resume, 'txt')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'out.txt')
+            with ThreadPoolExecutor(1) as pool:
+                assert await async_api.generate_resume_async(resume, path, 'txt', executor=pool) == path
+            with open(path, 'rb') as f:
+                written = f.read()
+        return score, content, written, trace
+
+    score, content, written, trace = asyncio.run(main())
+    assert score == ats_logic.calculate_ats_score(resume)
+    assert content == written == generator.render_resume(resume, 'txt')
+    assert 'verbs' in trace.stages and 'txt.build' in trace.stages # Context reaches the thread
+
+def test_render_many_bounds_concurrency_and_keeps_order():
+    resumes = [synthetic_resume(jobs=1, bullets=1, seed=i) for i in range(7)]
+    running = 0
+    peak = 0
+    original = generator.render_resume
+
+    def slow_render(*args, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            time.sleep(0.02)
+            return original(*args, **kwargs)
+        finally:
+            running -= 1
+
+    async def source():
+        for resume in resumes:
+            yield resume
+
+    async def main():
+        with ThreadPoolExecutor(8) as pool:
+            return [content async for content in async_api.render_many(source(), 'txt', limit=3, executor=pool)]
+
+    generator.render_resume = slow_render
+    try:
+        outputs = asyncio.run(main())
+    finally:
+        generator.render_resume = original
+    assert outputs == [generator.render_resume(r, 'txt') for r in resumes]
+    assert 1 < peak <= 3
+
+def test_render_many_on_threads_shares_one_cache(tmp_path):
+    from render_cache import RenderCache
+    resumes = [synthetic_resume(jobs=1, bullets=1, seed=i % 3) for i in range(60)]
+    expected = {i: generator.render_resume(resumes[i], 'txt') for i in range(3)}
+    # Room for one entry in memory, so hits keep evicting each other
+    cache = RenderCache(memory_bytes=max(map(len, expected.values())) + 1, disk_dir=str(tmp_path))
+
+    async def main():
+        return [content async for content in async_api.render_many(resumes, 'txt', limit=8, cache=cache)]
+
+    outputs = asyncio.run(main())
+    assert outputs == [expected[i % 3] for i in range(60)]
+    assert cache.hits + cache.misses == 60 and cache.hits and cache.misses >= 3
+    assert cache._memory_total == sum(map(len, cache._memory.values()))
+    assert cache._disk_total == sum(cache._disk.values()) == sum(map(len, expected.values()))
+
+def test_render_many_records_each_render_separately():
+    resumes = [synthetic_resume(jobs=2, bullets=2, seed=i) for i in range(5)]
+
+    async def main():
+        with instrument.record() as trace:
+            outputs = [content async for content in async_api.render_many(resumes, 'txt', limit=3)]
+        return outputs, trace
+
+    outputs, trace = asyncio.run(main())
+    assert trace.counters['txt.bytes'] == sum(map(len, outputs))
+    assert trace.counters['bullets'] == 5 * (2 * 2 + 3 + 2)
+    assert set(trace.stages) == {'normalize', 'txt.build'}
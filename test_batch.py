@@ -0,0 +1,22 @@
+import json
+import batch
+
+def _resume(i):
+    return {'full_name': f'User {i}', 'email': 'a@b.c', 'phone': '1', 'summary': 'Developed things. ' * i}
+
+def test_score_batch_keeps_input_order(tmp_path):
+    src = tmp_path / "resumes.jsonl"
+    src.write_text("\n".join(json.dumps(_resume(i)) for i in range(50)) + "\n\nnot json\n")
+
+    results = list(batch.score_batch(batch.iter_records(str(src)), workers=2, chunksize=4))
+    assert [r['id'] for r in results] == list(range(1, 51)) + [52]
+    assert all('score' in r for r in results[:50])
+    assert results[-1]['error'].startswith("JSONDecodeError")
+
+def test_directory_source_and_cli(tmp_path):
+    for i in range(3):
+        (tmp_path / f"r{i}.json").write_text(json.dumps(_resume(i)))
+    out = tmp_path / "out.jsonl"
+    batch.main([str(tmp_path), "-o", str(out), "-j", "1"])
+    lines = [json.loads(l) for l in out.read_text().splitlines()]
+    assert [l['id'] for l in lines] == ["r0.json", "r1.json", "r2.json"]
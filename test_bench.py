@@ -0,0 +1,41 @@
+import json
+import pytest
+import bench
+
+def test_synthetic_resume_sizes():
+    resume = bench.synthetic_resume(jobs=7, bullets=3, seed=1)
+    assert len(resume['experience']) == 7
+    assert all(len(e['responsibilities'].split('\n')) == 3 for e in resume['experience'])
+    assert resume == bench.synthetic_resume(jobs=7, bullets=3, seed=1)
+    with pytest.raises(ValueError):
+        bench.synthetic_resume(jobs=101)
+
+def test_compare_flags_regressions():
+    baseline = {'results': {'a': {'p50': 1.0}, 'b': {'p50': 2.0}}}
+    current = {'results': {'a': {'p50': 1.1}, 'b': {'p50': 3.0}, 'new': {'p50': 5.0}}}
+    regressions, rows = bench.compare(current, baseline, threshold=0.25)
+    assert [r['name'] for r in regressions] == ['b']
+    assert len(rows) == 2
+
+    # Startup times clamp to 0: a 0 ms baseline regresses only past an absolute floor
+    baseline = {'results': {'still 0': {'p50': 0.0}, 'noise': {'p50': 0.0}, 'slow': {'p50': 0.0}}}
+    current = {'results': {'still 0': {'p50': 0.0}, 'noise': {'p50': 0.4}, 'slow': {'p50': 5.0}}}
+    regressions, rows = bench.compare(current, baseline)
+    assert [r['name'] for r in regressions] == ['slow']
+    assert rows[0]['ratio'] == 1.0
+
+def test_run_reports_percentiles():
+    report = bench.run(sizes=["2x2"], repeat=2, formats=('txt',), startup=("render_txt",))
+    assert report['results']['import render_txt']['n'] == 2
+    stats = report['results']['calculate_ats_score[2x2]']
+    assert stats['min'] <= stats['p50'] <= stats['p99'] <= stats['max']
+    assert 'params_to_txt[2x2]' in report['results']
+    assert report['estimate_speedup'] is None # Only measured against the PDF renderer
+
+def test_main_fails_under_min_speedup(tmp_path):
+    args = ["--sizes", "1x1", "--repeat", "1", "--formats", "pdf", "--startup", "-o", str(tmp_path / "bench.json")]
+    with pytest.raises(SystemExit):
+        bench.main(args + ["--min-speedup", "1e9"])
+    report = json.loads((tmp_path / "bench.json").read_text())
+    assert report['estimate_speedup'] > 0
+    assert 'estimate_pages[30x10]' in report['results']
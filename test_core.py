@@ -1,7 +1,11 @@
 
 import os
 import ats_logic
+import constants
 import generator
+import render_docx
+import render_pdf
+from styling import current_styling
 
 def test_logic():
     print("Testing ATS Logic...")
@@ -56,6 +60,74 @@ def test_generation():
     else:
         print("PDF Generation Failed")
 
+def test_docx_template_cache():
+    print("Testing DOCX template cache...")
+    render_docx._docx_base_template.cache_clear()
+    data = {'full_name': 'Cache User', 'experience': [{'company': 'A', 'responsibilities': 'One.\nTwo.'}]}
+    generator.params_to_docx(data, "test_resume.docx")
+    generator.params_to_docx(data, "test_resume.docx")
+    assert render_docx._docx_base_template.cache_info().misses == 1
+
+    # Changing a styling constant must produce a freshly built template
+    original = constants.FONT_SIZE_BODY
+    try:
+        constants.FONT_SIZE_BODY = 10
+        generator.params_to_docx(data, "test_resume.docx")
+        assert render_docx._docx_base_template.cache_info().misses == 2
+    finally:
+        constants.FONT_SIZE_BODY = original
+    print("Template Cache Test Passed!")
+
+def test_pdf_styles_follow_constants():
+    print("Testing PDF style registry...")
+    styles = render_pdf._pdf_styles(current_styling())
+    assert styles['body'].fontSize == constants.FONT_SIZE_BODY
+    assert styles['heading'].fontSize == constants.FONT_SIZE_HEADING
+    assert styles['name'].fontSize == constants.FONT_SIZE_NAME
+    # Same Styling -> same shared objects
+    assert render_pdf._pdf_styles(current_styling()) is styles
+    print("PDF Style Test Passed!")
+
+def test_render_in_memory():
+    print("Testing in-memory rendering...")
+    import io
+    import instrument
+    data = {'full_name': 'Stream User', 'email': 'a@b.c', 'skills': 'Python'}
+    for fmt, magic in (('docx', b'PK'), ('pdf', b'%PDF'), ('txt', b'STREAM USER')):
+        content = generator.render_resume(data, fmt)
+        assert content.startswith(magic)
+        stream = io.BytesIO(b"header")
+        stream.seek(0, io.SEEK_END)
+        with instrument.record() as trace:
+            assert generator.render_resume(data, fmt, stream) is stream
+        assert stream.getvalue()[6:].startswith(magic)
+        assert trace.counters[f'{fmt}.bytes'] == len(stream.getvalue()) - 6 # Only what the render wrote
+    print("In-Memory Rendering Test Passed!")
+
+def test_render_all():
+    print("Testing render_all...")
+    data = {'full_name': 'Fan Out', 'city': 'Paris', 'github': 'gh/fan', 'skills': 'R&D <scale>'}
+    outputs = generator.render_all(data)
+    assert set(outputs) == {'docx', 'pdf', 'txt'}
+    assert b'Paris | gh/fan' in outputs['txt']
+    print("render_all Test Passed!")
+
+def test_backends_load_lazily():
+    print("Testing lazy renderer imports...")
+    import subprocess
+    import sys
+    check = (
+        "import sys, ats_logic, generator\n"
+        "assert not {'docx', 'reportlab'} & set(sys.modules), 'scoring imported a renderer'\n"
+        "ats_logic.calculate_ats_score({'full_name': 'Lazy'})\n"
+        "generator.render_resume({'full_name': 'Lazy'}, 'txt')\n"
+        "assert not {'docx', 'reportlab'} & set(sys.modules), 'txt imported a renderer'\n"
+        "generator.render_resume({'full_name': 'Lazy'}, 'pdf')\n"
+        "assert 'reportlab' in sys.modules and 'docx' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", check], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    print("Lazy Import Test Passed!")
+
 if __name__ == "__main__":
     test_logic()
     test_generation()
@@ -0,0 +1,127 @@
+import json
+import re
+import zlib
+
+import pytest
+
+import generator
+import importer
+from bench import synthetic_resume
+
+@pytest.mark.parametrize("fmt", importer.FORMATS)
+def test_rendered_resume_round_trips(fmt):
+    data = synthetic_resume(jobs=3, bullets=4, seed=2)
+    data['summary'] = "Café “quoted” & R&D. " + "Long summary text that wraps. " * 12
+    data['summary'] = data['summary'].strip()
+    assert importer.import_bytes(generator.render_resume(data, fmt), fmt) == data
+
+def pdf_with_object_streams(pdf):
+    """
+    Rewrites a classic PDF the way Word and LibreOffice save PDF 1.5+: every
+    object that is not a stream packed into one object stream, and a
+    cross-reference stream instead of an xref table
+    """
+    objects = [(int(num), body.strip()) for num, body in re.findall(rb"(\d+) 0 obj(.*?)endobj", pdf, re.S)]
+    root = int(re.search(rb"/Root (\d+) 0 R", pdf).group(1))
+    packed = [(num, body) for num, body in objects if b"stream" not in body]
+    objstm, xref = max(num for num, _ in objects) + 1, max(num for num, _ in objects) + 2
+
+    header, bodies = [], b""
+    for num, body in packed:
+        header.append(b"%d %d" % (num, len(bodies)))
+        bodies += body + b"\n"
+    header = b" ".join(header) + b"\n"
+    payload = zlib.compress(header + bodies)
+
+    out = b"%PDF-1.5\n%\xe2\xe3\xcf\xd3\n"
+    entries = {num: (2, objstm, i) for i, (num, _) in enumerate(packed)}
+    for num, body in [(num, body) for num, body in objects if b"stream" in body] + [(objstm, None)]:
+        entries[num] = (1, len(out), 0)
+        if body is None:
+            body = b"<< /Type /ObjStm /N %d /First %d /Filter /FlateDecode /Length %d >>\nstream\n%s\nendstream" % (
+                len(packed), len(header), len(payload), payload)
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    entries[xref] = (1, len(out), 0)
+    rows = b"".join(bytes([kind]) + a.to_bytes(4, 'big') + b.to_bytes(2, 'big')
+                    for kind, a, b in (entries.get(n, (0, 0, 0)) for n in range(xref + 1)))
+    rows = zlib.compress(rows)
+    out += b"%d 0 obj\n<< /Type /XRef /Size %d /Root %d 0 R /W [1 4 2] /Filter /FlateDecode /Length %d >>\nstream\n%s\nendstream\nendobj\n" % (
+        xref, xref + 1, root, len(rows), rows)
+    return out + b"startxref\n%d\n%%%%EOF\n" % entries[xref][1]
+
+def test_pdf_with_object_streams_round_trips():
+    data = synthetic_resume(jobs=2, bullets=3, seed=5)
+    pdf = pdf_with_object_streams(generator.render_resume(data, 'pdf'))
+    assert b"/ObjStm" in pdf and b"/Type /Catalog" not in pdf # The page tree is only inside the object stream
+    assert importer.import_bytes(pdf, 'pdf') == data
+    with pytest.raises(ValueError, match="Unsupported PDF"):
+        importer.import_bytes(re.sub(rb"(/Type /ObjStm [^>]*)/FlateDecode", rb"\1/LZWDecode", pdf), 'pdf')
+
+def handwritten_pdf(content):
+    """A one-page PDF drawing `content` in Helvetica, with its resources inline like most writers but ReportLab"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+    ]
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1) + b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    return out + b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+def test_pdf_undefined_glyphs_are_not_bullets():
+    pdf = handwritten_pdf(b"BT /F1 10 Tf 72 700 Td (\x7f Shipped) Tj 0 -12 Td (\x81 Led the team) Tj ET")
+    # 0x7F is ReportLab's bullet; 0x81 has no WinAnsi character and must not become one
+    assert importer.extract_lines(pdf, 'pdf') == ["• Shipped", "\ufffd Led the team"]
+
+def test_parses_aliases_and_handwritten_layout():
+    text = """Jane Doe
+jane@example.com | +1 (555) 010-0199 | Paris, France | https://jane.dev
+
+Profile:
+Engineer who ships.
+
+Technical Skills
+Python, SQL
+
+Professional Experience
+Acme Corp | Berlin
+Senior Engineer | 2019 – Present
+• Built the billing pipeline serving
+    two million users
+* Led four engineers
+
+Education
+MIT
+B.S. Physics | 2015
+"""
+    data = importer.parse_lines(text.splitlines())
+    assert (data['full_name'], data['email'], data['phone']) == ("Jane Doe", "jane@example.com", "+1 (555) 010-0199")
+    assert (data['city'], data['country'], data['github']) == ("Paris", "France", "https://jane.dev")
+    assert data['summary'] == "Engineer who ships." and data['skills'] == "Python, SQL"
+    assert data['experience'] == [{
+        'company': "Acme Corp", 'location': "Berlin", 'title': "Senior Engineer", 'start_date': "2019",
+        'end_date': "Present", 'responsibilities': "Built the billing pipeline serving two million users\nLed four engineers",
+    }]
+    assert data['education'] == [{'institution': "MIT", 'degree': "B.S. Physics", 'year': "2015"}]
+    assert data['projects'] == [] and data['certifications'] == []
+
+def test_import_directory_streams_in_order(tmp_path):
+    for i, fmt in enumerate(importer.FORMATS):
+        (tmp_path / f"r{i}.{fmt}").write_bytes(generator.render_resume(synthetic_resume(1, 1, seed=i), fmt))
+    (tmp_path / "broken.pdf").write_bytes(b"not a pdf")
+    (tmp_path / "notes.md").write_text("ignored")
+
+    out = tmp_path / "out.jsonl"
+    importer.main([str(tmp_path), "-o", str(out), "-j", "2", "--chunksize", "1"])
+    results = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [r['id'].rsplit("/", 1)[1] for r in results] == ["broken.pdf", "r0.docx", "r1.pdf", "r2.txt"]
+    assert results[0]['error'].startswith("ValueError: No text found")
+    assert [r['resume']['full_name'] for r in results[1:]] == [
+        "Synthetic Candidate 0", "Synthetic Candidate 1", "Synthetic Candidate 2"]
@@ -0,0 +1,35 @@
+import ats_logic
+import generator
+import instrument
+from bench import synthetic_resume
+
+RESUME = synthetic_resume(jobs=3, bullets=4)
+
+def test_record_generate_resume(tmp_path):
+    path = str(tmp_path / "out.docx")
+    with instrument.record() as trace:
+        generator.generate_resume(RESUME, path, 'docx')
+    assert set(trace.stages) == {'normalize', 'docx.build', 'docx.serialize', 'write'}
+    assert trace.counters['bullets'] == 3 * 4 + 3 + 2 # jobs, projects, certifications
+    assert trace.counters['docx.bytes'] == (tmp_path / "out.docx").stat().st_size
+    assert trace.counters['docx.paragraphs'] > trace.counters['bullets']
+    assert instrument.active() is None
+
+def test_listener_gets_one_trace_per_call():
+    traces = []
+    instrument.add_listener(traces.append)
+    try:
+        ats_logic.calculate_ats_score(RESUME)
+        generator.render_all(RESUME, ('txt', 'pdf'))
+    finally:
+        instrument.remove_listener(traces.append)
+    ats_logic.calculate_ats_score(RESUME) # Not recorded once removed
+
+    assert [t.name for t in traces] == ['calculate_ats_score', 'render_all']
+    assert 'verbs' in traces[0].stages
+    assert traces[0].counters['pages'] >= 1
+    assert set(traces[1].stages) == {'normalize', 'txt.build', 'pdf.build', 'pdf.layout'}
+
+def test_disabled_by_default():
+    assert instrument.active() is None
+    assert generator.render_resume(RESUME, 'txt') == generator.render_all(RESUME, ('txt',))['txt']
@@ -0,0 +1,48 @@
+import ats_logic
+import jd_match
+
+POSTINGS = [
+    "Senior Python engineer. Kubernetes, AWS and distributed systems experience.",
+    "Frontend engineer with React and TypeScript. Python a plus.",
+    "Data scientist: Python, SQL, machine learning, A/B testing.",
+]
+RESUME = {
+    'email': 'a@b.c', 'phone': '1', 'linkedin': 'x', 'skills': 'Python, AWS, Docker',
+    'experience': [{'title': 'Engineer', 'responsibilities': 'Built distributed systems on AWS'}],
+}
+
+def test_coverage_and_missing_terms(tmp_path):
+    stats = jd_match.TermStats.from_documents(POSTINGS)
+    path = str(tmp_path / "stats.npz")
+    stats.save(path)
+    loaded = jd_match.TermStats.load(path)
+    assert loaded.vocabulary == stats.vocabulary
+
+    result = jd_match.score_job_match(RESUME, POSTINGS[0], loaded)
+    assert 0 < result.score < 1
+    assert 0 < result.similarity <= 1
+    assert "kubernetes" in result.missing
+    assert "python" not in result.missing and "distributed systems" not in result.missing
+
+def test_optional_factor_in_calculate_ats_score():
+    base_score, base_feedback = ats_logic.calculate_ats_score(RESUME)
+    stats = jd_match.TermStats.from_documents(POSTINGS)
+    score, feedback = ats_logic.calculate_ats_score(RESUME, job_description=POSTINGS[0], term_stats=stats)
+    assert score < base_score
+    assert feedback[:len(base_feedback)] == base_feedback
+    assert "kubernetes" in feedback[-1]
+
+def test_unseen_terms_get_distinct_ids_per_comparison():
+    stats = jd_match.TermStats.from_documents(POSTINGS)
+    unseen = {}
+    text = ", ".join(f"term{i}" for i in range(5000))
+    vector = stats.vectorize(text, unseen)
+    assert len(set(vector.ids.tolist())) == 5000
+    assert vector.ids.min() >= len(stats.vocabulary)
+    again = stats.vectorize("term42, python", unseen)
+    assert dict(zip(again.terms, again.ids.tolist()))['term42'] == dict(zip(vector.terms, vector.ids.tolist()))['term42']
+    assert len(unseen) == 5000 and not hasattr(stats, 'unseen') # The stats object is shared; it keeps no terms
+
+    posting = "Rust and Zig developer, Rust services"
+    result = jd_match.score_job_match({'skills': "Rust"}, posting, stats)
+    assert "rust" not in result.missing and "zig" in result.missing
@@ -0,0 +1,23 @@
+import layout
+
+def test_build_layout_normalizes_once_for_all_renderers():
+    data = {
+        'full_name': 'Jane Roe', 'city': 'Austin', 'country': '', 'phone': '555', 'github': 'gh/jane',
+        'skills': 'Python',
+        'experience': [{'company': 'Acme', 'title': 'Engineer', 'start_date': '2020', 'end_date': 'Present',
+                        'responsibilities': '• Built things\n\n  - Shipped more  \n'}],
+        'projects': [{'name': 'Tool', 'description': 'Wrote it'}],
+        'certifications': ['AWS', '  '],
+    }
+    result = layout.build_layout(data)
+    assert result.contact == ['Austin', '555', 'gh/jane']
+    assert [s.title for s in result.sections] == ["Skills", "Work Experience", "Projects", "Certifications"]
+    job = result.sections[1].entries[0]
+    assert job.bullets == ['Built things', 'Shipped more']
+    assert job.subheading_detail == '2020 - Present'
+    assert result.sections[3].bullets == ['AWS']
+
+def test_split_bullets_keeps_signs_and_dashes_that_are_content():
+    text = "- -20% p99 latency\n-15 ms per request\n•Led the team\n*  Shipped\n-\n*nix tooling"
+    assert layout.split_bullets(text) == ['-20% p99 latency', '-15 ms per request', 'Led the team', 'Shipped',
+                                          '*nix tooling']
@@ -0,0 +1,16 @@
+import main
+
+def test_entry_summary():
+    job = {'company': " Acme ", 'title': "Engineer", 'location': "", 'responsibilities': "• Built it\n• Shipped it"}
+    assert main.entry_summary(job, 'responsibilities') == "Acme | Engineer (2 bullets)"
+    assert main.entry_summary(dict(job, responsibilities="Built it"), 'responsibilities') == "Acme | Engineer (1 bullet)"
+    assert main.entry_summary(dict(job, responsibilities=""), 'responsibilities') == "Acme | Engineer (0 bullets)"
+    assert main.entry_summary({'institution': "", 'degree': " "}) == "(empty)"
+    assert main.entry_summary({'company': "", 'responsibilities': "- Led it"}, 'responsibilities') == "(empty) (1 bullet)"
+
+def test_entry_summary_truncates_short_fields():
+    fits = {'name': "x" * main.SUMMARY_CHARS}
+    assert main.entry_summary(fits) == "x" * main.SUMMARY_CHARS
+    long = {'name': "x" * (main.SUMMARY_CHARS + 1), 'description': "One\nTwo\nThree"}
+    summary = main.entry_summary(long, 'description')
+    assert summary == "x" * (main.SUMMARY_CHARS - 3) + "... (3 bullets)" # The bullet count is never cut off
@@ -0,0 +1,33 @@
+import re
+import ats_logic
+from matcher import PhraseMatcher, PatternSetMatcher
+
+def test_phrase_matcher_overlaps_and_prefixes():
+    m = PhraseMatcher(["team", "team player", "player", "am"])
+    hits = sorted(m.finditer("a team player"))
+    assert hits == [(2, "team"), (2, "team player"), (4, "am"), (7, "player")]
+    assert m.find_all("nothing here") == set()
+
+def test_phrase_matcher_regex_path_agrees_with_substring_path(monkeypatch):
+    import matcher
+    m = PhraseMatcher(["team", "team player", "player", "am", "helped"])
+    text = "a team player who helped"
+    expected = m.find_all(text)
+    monkeypatch.setattr(matcher, "SUBSTRING_SEARCH_LIMIT", 0)
+    assert m.find_all(text) == expected == {"team", "team player", "player", "am", "helped"}
+
+def test_pattern_set_matcher_reports_shadowed_patterns():
+    # 'reduced.*by' would swallow the rest of the line in a plain alternation
+    m = PatternSetMatcher([r"reduced.*by", r"saved", r"\d+%"], re.IGNORECASE)
+    assert m.matched("Reduced cost by 20% and saved time by a lot") == {0, 1, 2}
+    assert m.matched("no metrics") == set()
+
+def test_score_counts_duplicate_verbs_and_weak_words():
+    data = {
+        'email': 'a@b.c', 'phone': '1', 'linkedin': 'x',
+        'summary': 'Evaluated vendors and helped the team. Worked on things.',
+    }
+    score, feedback = ats_logic.calculate_ats_score(data)
+    # 'Evaluated' appears twice in ACTION_VERBS and is counted twice
+    assert any("Found 2)" in f for f in feedback)
+    assert "Found weak words: 'helped' -> 'Assisted', 'worked on' -> 'Executed'..." in feedback
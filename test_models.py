@@ -0,0 +1,25 @@
+import ats_logic
+import layout
+from models import Resume, Experience
+
+DATA = {
+    'full_name': 'Ann Lee', 'email': 'ann@x.io', 'phone': '1', 'city': '', 'country': '',
+    'linkedin': 'li/ann', 'github': '', 'summary': 'Developed and Optimized systems; saved 20%.',
+    'skills': 'Python',
+    'experience': [{'company': 'Acme', 'location': 'NYC', 'title': 'Dev', 'start_date': '2020',
+                    'end_date': 'Now', 'responsibilities': 'Reduced cost by 30%\nHelped team'}],
+    'projects': [{'name': 'P', 'description': 'Built $5M tool'}],
+    'education': [{'institution': 'U', 'degree': 'BS', 'year': '2019'}],
+    'certifications': ['AWS'],
+}
+
+def test_round_trip():
+    resume = Resume.from_dict(DATA)
+    assert isinstance(resume.experience[0], Experience)
+    assert resume.to_dict() == DATA
+    assert not hasattr(resume, '__dict__')
+
+def test_resume_accepted_where_dicts_are():
+    resume = Resume.from_dict(DATA)
+    assert ats_logic.calculate_ats_score(resume) == ats_logic.calculate_ats_score(DATA)
+    assert layout.build_layout(resume) == layout.build_layout(DATA)
@@ -0,0 +1,85 @@
+import io
+
+import pytest
+
+import ats_logic
+import instrument
+import pagefit
+import render_pdf
+from bench import synthetic_resume
+from layout import build_layout
+from styling import current_styling
+
+def _real_pages(data):
+    with instrument.record() as trace:
+        render_pdf.render(build_layout(data), io.BytesIO())
+    return trace.counters['pdf.pages']
+
+@pytest.mark.parametrize("jobs,bullets", [(1, 1), (2, 5), (4, 4), (5, 6), (7, 3), (10, 8)])
+def test_pdf_page_count_matches_reportlab(jobs, bullets):
+    data = synthetic_resume(jobs, bullets, seed=jobs)
+    data['summary'] = "Café “quoted” & naïve text that wraps. " * (jobs + bullets)
+    assert pagefit.estimate_pages(data, 'pdf').pages == _real_pages(data)
+
+def test_wrapping_and_overflow():
+    style = current_styling()
+    width = 100.0
+    assert pagefit.count_lines([("", "Helvetica")], width, 10) == 0
+    assert pagefit.count_lines([("WWWWWWWWWWWWWWWWWWWW", "Helvetica")], width, 10) == 1 # Too wide, own line
+    assert pagefit.count_lines([("ab " * 30, "Helvetica")], width, 10) == 5 # 7 words of 1112 + 278 per space fit in 10000
+    assert pagefit.word_width("é", "Helvetica") == pagefit.word_width("e", "Helvetica")
+
+    long = synthetic_resume(10, 8)
+    fit = pagefit.estimate_pages(long, 'pdf', style, max_pages=1)
+    assert fit.pages > 1 and 0 < fit.overflow_lines < fit.lines
+    assert pagefit.estimate_pages(long, 'pdf', style, max_pages=fit.pages).overflow_lines == 0
+    docx = pagefit.estimate_pages(long, 'docx', style)
+    assert docx.pages >= fit.pages # Word's 1.15 spacing and 10pt paragraph gaps take more room
+    with pytest.raises(ValueError):
+        pagefit.estimate_pages(long, 'txt')
+
+def test_cached_estimates_follow_edits():
+    layout = build_layout(synthetic_resume(2, 3))
+    fit = pagefit.estimate_pages(layout)
+    assert pagefit.estimate_pages(layout) == fit
+    next(s for s in layout.sections if s.entries).entries[0].bullets.append("Led a short extra project " * 6) # Wraps to 2 lines
+    assert pagefit.estimate_pages(layout).lines == fit.lines + 2
+    pagefit.clear_caches()
+    assert pagefit.estimate_pages(build_layout(synthetic_resume(2, 3))) == fit
+
+def test_length_feedback_uses_page_estimate():
+    short = {'full_name': "Jo", 'email': "jo@example.com", 'summary': "Engineer."}
+    assert any("too short" in f for f in ats_logic.calculate_ats_score(short)[1])
+    long_fit = pagefit.estimate_pages(synthetic_resume(10, 8))
+    feedback = ats_logic.calculate_ats_score(synthetic_resume(10, 8))[1]
+    assert f"Resume runs to {long_fit.pages} pages" in " ".join(feedback)
+    assert not any("too short" in f or "runs to" in f for f in ats_logic.calculate_ats_score(synthetic_resume(4, 4))[1])
+
+def test_fit_to_pages_prefers_the_smallest_change():
+    style = current_styling()
+    already = pagefit.fit_to_pages(synthetic_resume(1, 1), 'pdf', 1, style)
+    assert already.fits and already.adjustments == [] and already.style == style
+
+    result = pagefit.fit_to_pages(synthetic_resume(4, 4), 'pdf', 1, style)
+    assert result.fits and result.fit.pages == 1
+    assert [a.setting for a in result.adjustments] == ['spacing', 'margins', 'font_size_body']
+    assert 10 <= result.style.font_size_body < style.font_size_body
+    assert min(result.style[4:8]) >= 0.5 and result.style.spacing >= 0.5
+
+    hopeless = pagefit.fit_to_pages(synthetic_resume(10, 8), 'pdf', 1, style)
+    assert not hopeless.fits and hopeless.style == style and hopeless.adjustments == []
+
+def test_generate_fitted_resume(tmp_path):
+    import generator
+    import pdf_text
+    data = synthetic_resume(2, 6)
+    assert pagefit.estimate_pages(data, 'pdf').pages == 2
+    path, result = generator.generate_fitted_resume(data, str(tmp_path / "fit.pdf"), 'pdf', pages=1)
+    assert result.fits and result.adjustments
+    with open(path, 'rb') as f:
+        assert pdf_text.page_count(f.read()) == 1
+    path, result = generator.generate_fitted_resume(data, str(tmp_path / "fit.docx"), 'docx', pages=1)
+    assert result.fits is None and result.adjustments # Word's page breaks cannot be checked here
+    assert generator.generate_resume(data, str(tmp_path / "plain.pdf"), 'pdf') == str(tmp_path / "plain.pdf")
+    with pytest.raises(ValueError):
+        generator.generate_fitted_resume(data, str(tmp_path / "fit.txt"), 'txt', pages=1)
@@ -0,0 +1,26 @@
+from ranking import ResumeIndex
+
+def _resume(skills, bullets=''):
+    return {'email': 'a@b.c', 'phone': '1', 'linkedin': 'x', 'skills': skills,
+            'experience': [{'title': 'Engineer', 'responsibilities': bullets}]}
+
+POSTING = "Python engineer with Kubernetes and distributed systems experience"
+
+def test_top_k_and_incremental_updates():
+    index = ResumeIndex()
+    index.add('a', _resume('Python, Kubernetes', 'Built distributed systems'))
+    index.add('b', _resume('Python'))
+    index.add('c', _resume('Photoshop, Illustrator'))
+    assert len(index) == 3
+
+    top = index.search(POSTING, k=2)
+    assert [m.resume_id for m in top] == ['a', 'b']
+    assert 0 < top[1].keyword_score < top[0].keyword_score <= 1
+
+    # Updating one resume re-ranks without rebuilding the rest
+    index.update('c', _resume('Python, Kubernetes', 'Python engineer running Kubernetes distributed systems'))
+    assert index.search(POSTING, k=1)[0].resume_id == 'c'
+
+    index.remove('b')
+    assert 'b' not in index
+    assert [m.resume_id for m in index.search(POSTING)] == ['c', 'a']
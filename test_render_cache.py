@@ -0,0 +1,101 @@
+import os
+import sys
+import tempfile
+
+import constants
+import generator
+from render_cache import RenderCache, cache_key
+from layout import build_layout
+from styling import current_styling
+
+DATA = {'full_name': 'Cached User', 'email': 'c@u.io', 'skills': 'Python',
+        'experience': [{'company': 'A', 'responsibilities': 'Built it.\nShipped it.'}]}
+
+def test_key_follows_layout_format_and_styling():
+    style = current_styling()
+    key = cache_key(build_layout(DATA), 'pdf', style)
+    # Bullet markers and whitespace normalize away
+    messy = dict(DATA, experience=[{'company': 'A', 'responsibilities': '• Built it.\n\n- Shipped it.  '}])
+    assert cache_key(build_layout(messy), 'pdf', style) == key
+    assert cache_key(build_layout(DATA), 'docx', style) != key
+    assert cache_key(build_layout(DATA), 'pdf', style._replace(font_size_body=10)) != key
+
+def test_hit_skips_backend():
+    cache = RenderCache()
+    first = generator.render_resume(DATA, 'pdf', cache=cache)
+    render_pdf = sys.modules['render_pdf']
+    original = render_pdf.render
+    render_pdf.render = None # A miss would fail
+    try:
+        assert generator.render_resume(DATA, 'pdf', cache=cache) == first
+    finally:
+        render_pdf.render = original
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    constants.FONT_SIZE_BODY, original_size = 10, constants.FONT_SIZE_BODY
+    try:
+        generator.render_resume(DATA, 'pdf', cache=cache)
+    finally:
+        constants.FONT_SIZE_BODY = original_size
+    assert cache.misses == 2
+
+def test_disk_hit_does_not_import_backend(tmp_path):
+    import subprocess
+    cache_dir = str(tmp_path / "cache")
+    generator.render_resume(DATA, 'pdf', cache=RenderCache(disk_dir=cache_dir))
+    check = (
+        "import sys, generator, render_cache, test_render_cache\n"
+        f"cache = render_cache.RenderCache(disk_dir={cache_dir!r})\n"
+        "generator.render_resume(test_render_cache.DATA, 'pdf', cache=cache)\n"
+        "assert cache.hits == 1, 'expected a disk hit'\n"
+        "assert not {'render_pdf', 'reportlab'} & set(sys.modules), 'a hit imported the backend'\n"
+    )
+    subprocess.run([sys.executable, "-c", check], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+def test_memory_lru_eviction():
+    cache = RenderCache(memory_bytes=10)
+    cache.put('a', b'1234')
+    cache.put('b', b'1234')
+    cache.get('a')           # 'b' is now least recently used
+    cache.put('c', b'1234')
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1234' and cache.get('c') == b'1234'
+    cache.put('big', b'x' * 11) # Larger than the tier: not kept
+    assert cache.get('big') is None
+
+def test_disk_tier_survives_restart_and_evicts():
+    key = lambda n: f"{n:064x}"
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = RenderCache(memory_bytes=0, disk_dir=tmp, disk_bytes=10)
+        cache.put(key(1), b'abcd')
+        cache.put(key(2), b'efgh')
+        assert cache.get(key(1)) == b'abcd'
+        os.utime(os.path.join(tmp, key(2)), (0, 0)) # Oldest on disk too
+        cache.put(key(3), b'ijkl')
+        assert sorted(os.listdir(tmp)) == [key(1), key(3)]
+
+        reopened = RenderCache(memory_bytes=0, disk_dir=tmp, disk_bytes=10)
+        assert reopened.get(key(3)) == b'ijkl'
+        assert reopened.get(key(2)) is None
+        assert len(reopened) == 2
+
+def test_generate_resume_with_cache_writes_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = RenderCache(disk_dir=os.path.join(tmp, 'cache'))
+        out = os.path.join(tmp, 'out.txt')
+        generator.generate_resume(DATA, out, 'txt', cache=cache)
+        generator.generate_resume(DATA, out, 'txt', cache=cache)
+        with open(out, 'rb') as f:
+            assert f.read() == generator.render_resume(DATA, 'txt')
+        assert cache.hits == 1
+
+def test_default_disk_tier_is_per_user(tmp_path, monkeypatch):
+    home, cwd = tmp_path / "home", tmp_path / "launched_from"
+    cwd.mkdir()
+    monkeypatch.setenv('HOME', str(home))
+    monkeypatch.delenv('XDG_CACHE_HOME', raising=False)
+    monkeypatch.chdir(cwd)
+    cache = RenderCache.default()
+    assert cache.disk_dir == os.path.join(str(home), ".cache", constants.CACHE_APP_NAME, "renders")
+    assert os.path.isdir(cache.disk_dir)
+    assert os.listdir(cwd) == []
@@ -0,0 +1,49 @@
+import pytest
+
+import ats_logic
+from rewrite import apply_rewrites, format_diff, rewrite_text, suggest_batch, suggest_rewrites
+
+@pytest.mark.parametrize("text, expected", [
+    ("Responsible for managing a team of 5", "Managed a team of 5"),
+    ("I was responsible for the budget", "I spearheaded the budget"),
+    ("Helped to build the API", "Assisted in building the API"),
+    ("Shipped v2 and helped the team", "Shipped v2 and assisted the team"),
+    ("A team player and an expert at SQL", "Collaborative and proficient in SQL"),
+    ("WORKED ON BILLING. tried Rust", "EXECUTED BILLING. Attempted Rust"),
+    ("Proficient in Go; unhelpedly helpedx", "Proficient in Go; unhelpedly helpedx"),
+    ("Co-worked on billing - worked on Rust", "Co-worked on billing - executed Rust"),
+])
+def test_rewrite_text(text, expected):
+    assert rewrite_text(text)[0] == expected
+
+def test_suggest_and_apply():
+    resume = {
+        'summary': 'Hard worker with 5 years in retail.',
+        'experience': [{'company': 'A', 'responsibilities': 'Helped design the store layout\nSaved $5k\nWorked on reporting'}],
+        'projects': [{'name': 'P', 'description': 'Team player on a 3-person project'}],
+    }
+    rewrites = suggest_rewrites(resume)
+    assert [(r.field, r.line_no) for r in rewrites] == [
+        ('summary', 0), ('experience[0].responsibilities', 0),
+        ('experience[0].responsibilities', 2), ('projects[0].description', 0)]
+    assert rewrites[1].phrases == ['helped']
+    assert "+ Assisted in designing the store layout" in format_diff(rewrites)
+
+    accepted = [r for r in rewrites if r.field != 'summary']
+    updated = apply_rewrites(resume, accepted)
+    assert updated['summary'] == resume['summary']
+    assert updated['experience'][0]['responsibilities'] == \
+        'Assisted in designing the store layout\nSaved $5k\nExecuted reporting'
+    assert resume['experience'][0]['responsibilities'].startswith('Helped') # Input untouched
+    with pytest.raises(ValueError):
+        apply_rewrites(updated, accepted) # Already applied
+
+def test_batch_matches_single():
+    resumes = [{'summary': f'Good at sales, helped {i} clients'} for i in range(4)] + [{}]
+    assert suggest_batch(resumes) == [suggest_rewrites(r) for r in resumes]
+    assert suggest_batch(resumes)[2][0].after == 'Skilled in sales, assisted 2 clients'
+
+def test_identity_mapping_not_penalized():
+    base = {'email': 'a@b.c', 'phone': '1', 'linkedin': 'x', 'summary': 'Engineer.'}
+    with_phrase = dict(base, summary='Engineer proficient in Go.')
+    assert ats_logic.calculate_ats_score(with_phrase)[0] == ats_logic.calculate_ats_score(base)[0]
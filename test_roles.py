@@ -0,0 +1,20 @@
+import ats_logic
+from roles import RoleIndex
+
+def test_get_role_keywords_matches_aliases_titles_and_typos():
+    swe = ats_logic.get_role_keywords("software engineer")
+    assert ats_logic.get_role_keywords("Senior Software Engineer II") == swe
+    assert ats_logic.get_role_keywords("SWE II") == swe
+    assert ats_logic.get_role_keywords("sofware enginer") == swe
+    assert ats_logic.get_role_keywords("HRBP") == ats_logic.get_role_keywords("human resources")
+    assert ats_logic.get_role_keywords("pastry chef") == []
+
+def test_index_from_taxonomy_and_completion(tmp_path):
+    path = tmp_path / "roles.json"
+    path.write_text('{"Site Reliability Engineer": {"keywords": ["SLOs"], "aliases": ["SRE"]},'
+                    ' "Nurse Practitioner": ["Triage"]}')
+    index = RoleIndex.from_taxonomy(str(path))
+    assert len(index) == 2
+    assert index.keywords("sre") == ["SLOs"]
+    assert index.match("nurse practicioner")[0][0] == "Nurse Practitioner"
+    assert index.complete("rel") == ["Site Reliability Engineer"]
@@ -0,0 +1,46 @@
+import ats_logic
+import batch
+import generator
+from sanitize import sanitize_batch, sanitize_resume, sanitize_text
+
+def test_sanitize_text():
+    assert sanitize_text("José’s “naïve” café — Straße") == "Jose's \"naive\" cafe - Strasse"
+    assert sanitize_text("Shipped v2 🚀 to 3M users 👍🏽") == "Shipped v2 to 3M users"
+    assert sanitize_text("Łódź ⭐ São Paulo") == "Lodz Sao Paulo"
+    assert sanitize_text("• Kept: 中文, ×2, $5k") == "• Kept: 中文, ×2, $5k" # Only emoji and Latin accents change
+
+def test_text_symbols_and_spacing_survive():
+    bullets = "✓ Shipped → prod ✔ done ❖ ⌘K ★ ↔ ☎"
+    assert sanitize_text(bullets) == bullets # Symbols, not emoji
+    assert sanitize_text("✔️ Done") == "✔ Done" # The emoji form drops back to the symbol
+    assert sanitize_text("👩‍💻 Dev 🇫🇷 Paris ✅") == "Dev Paris" # ZWJ sequence, flag, emoji-style symbol
+    # Only the spaces next to a deleted emoji change
+    assert sanitize_text("Kept  double  spaces — 🚀 here") == "Kept  double  spaces - here"
+    assert sanitize_text("  indented\tcell 🚀\nnext") == "  indented\tcell\nnext"
+
+def test_sanitize_resume_records_changes():
+    resume = {
+        'full_name': 'Zoë Brontë', 'email': 'zoe@example.com',
+        'experience': [{'company': 'Acme', 'responsibilities': 'Led the “Atlas” launch 🚀\nSaved $5k'}],
+        'certifications': ['AWS™', 'PMP'],
+    }
+    clean, changes = sanitize_resume(resume)
+    assert clean['full_name'] == 'Zoe Bronte'
+    assert clean['experience'][0]['responsibilities'] == 'Led the "Atlas" launch\nSaved $5k'
+    assert clean['certifications'] == ['AWS(TM)', 'PMP']
+    assert [c.field for c in changes] == ['full_name', 'experience[0].responsibilities', 'certifications[0]']
+    assert resume['full_name'] == 'Zoë Brontë' # Input left alone
+
+def test_batch_matches_single_and_handles_separator():
+    resumes = [{'full_name': f'Renée {i}', 'summary': 'x\x00y ✅'} for i in range(3)]
+    assert sanitize_batch(resumes) == [sanitize_resume(r) for r in resumes]
+    assert sanitize_batch(resumes)[0][0] == {'full_name': 'Renee 0', 'summary': 'x\x00y'}
+
+def test_optional_stage():
+    resume = {'full_name': 'José Núñez', 'email': 'j@n.io', 'phone': '1', 'skills': 'C++ 🔥'}
+    assert b'JOSE NUNEZ' in generator.render_resume(resume, 'txt', sanitize=True)
+    assert 'JOSÉ NÚÑEZ'.encode() in generator.render_resume(resume, 'txt')
+    assert ats_logic.calculate_ats_score(resume, sanitize=True)[0] == ats_logic.calculate_ats_score(sanitize_resume(resume)[0])[0]
+    result = batch.score_record((1, resume), sanitize=True)
+    assert [c['field'] for c in result['changes']] == ['full_name', 'skills']
+    assert ats_logic.refine_text_with_ats_rules("  café 😀") == "Cafe"
@@ -0,0 +1,94 @@
+import asyncio
+import json
+import time
+
+import service
+from bench import synthetic_resume
+
+async def request(port, method, path, payload=None, raw=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = raw if raw is not None else (json.dumps(payload).encode() if payload is not None else b'')
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+    head, _, content = (await reader.read()).partition(b"\r\n\r\n")
+    writer.close()
+    lines = head.decode().split("\r\n")
+    headers = dict(line.split(": ", 1) for line in lines[1:])
+    return int(lines[0].split()[1]), headers, content
+
+async def raw_request(port, data):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return int(response.split(b" ", 2)[1])
+
+def run_with_service(scenario, **kwargs):
+    async def main():
+        svc = service.ResumeService(**kwargs)
+        server = await svc.start('127.0.0.1', 0)
+        try:
+            return await scenario(svc, server.sockets[0].getsockname()[1])
+        finally:
+            server.close()
+            await server.wait_closed()
+            svc.close()
+    return asyncio.run(main())
+
+def test_endpoints():
+    resume = synthetic_resume(jobs=2, bullets=3)
+
+    async def scenario(svc, port):
+        status, _, content = await request(port, 'POST', '/score', {'resume': resume})
+        assert status == 200
+        assert json.loads(content)['score'] == service.ats_logic.calculate_ats_score(resume)[0]
+
+        status, headers, content = await request(port, 'POST', '/render', {'resume': resume, 'format': 'pdf'})
+        assert status == 200 and headers['Content-Type'] == 'application/pdf'
+        assert content.startswith(b'%PDF')
+
+        status, _, content = await request(port, 'POST', '/batch', {'resumes': [resume, "not a resume", resume]})
+        results = json.loads(content)['results']
+        assert [r['id'] for r in results] == [0, 1, 2]
+        assert 'error' in results[1] and results[0]['score'] == results[2]['score']
+
+        assert (await request(port, 'POST', '/render', {'resume': resume, 'format': 'rtf'}))[0] == 400
+        assert (await request(port, 'POST', '/score', raw=b'{oops'))[0] == 400
+        assert (await request(port, 'POST', '/score', {'resume': resume, 'job_description': ['x']}))[0] == 400
+        assert await raw_request(port, b"GARBAGE\r\n\r\n") == 400
+        assert await raw_request(port, b"POST /score HTTP/1.1\r\nContent-Length: ten\r\n\r\n") == 400
+        assert await raw_request(port, b"POST /score HTTP/1.1\r\nContent-Length: -5\r\n\r\n") == 400
+        assert (await request(port, 'GET', '/score'))[0] == 405
+        assert (await request(port, 'GET', '/nope'))[0] == 404
+
+        metrics = json.loads((await request(port, 'GET', '/metrics'))[2])
+        assert metrics['requests']['/score'] == 4
+        assert metrics['statuses']['200'] == 3
+        assert metrics['latency_ms']['/render']['n'] == 2
+        assert metrics['pending_jobs'] == 0
+
+    run_with_service(scenario, workers=2)
+
+def test_backpressure_rejects_when_full():
+    resume = synthetic_resume(jobs=1, bullets=1)
+    many = [resume] * (service.BATCH_CHUNKSIZE * 2 + 1) # 3 chunks
+
+    async def scenario(svc, port):
+        # Fill the queue with two slow requests
+        busy = [asyncio.create_task(svc._run([(time.sleep, 0.5)])) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert svc.pending == 2
+        status, headers, _ = await request(port, 'POST', '/score', {'resume': resume})
+        assert status == 503 and headers['Retry-After'] == str(service.RETRY_AFTER)
+        assert (await request(port, 'POST', '/batch', {'resumes': many}))[0] == 503
+        await asyncio.gather(*busy)
+
+        # Once idle, a batch takes one slot however many chunks it has
+        status, _, content = await request(port, 'POST', '/batch', {'resumes': many})
+        assert status == 200 and len(json.loads(content)['results']) == len(many)
+        metrics = json.loads((await request(port, 'GET', '/metrics'))[2])
+        assert metrics['rejected'] == 2
+        assert metrics['pending_jobs'] == 0
+
+    run_with_service(scenario, workers=1, max_pending=2)
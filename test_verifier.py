@@ -0,0 +1,35 @@
+import json
+
+import verifier
+from bench import synthetic_resume
+
+def test_clean_resume_has_no_issues():
+    data = synthetic_resume(jobs=2, bullets=3)
+    data['summary'] = "Café “quoted” <br/> & R&D"
+    data['certifications'] = ["", "PMP"]
+    assert verifier.verify_resume(data) == {'docx': [], 'pdf': [], 'txt': []}
+
+def test_reports_fields_that_do_not_survive():
+    data = synthetic_resume(jobs=1, bullets=1)
+    data['experience'][0]['company'] = "Acme | Sons"
+    issues = verifier.verify_resume(data, formats=('pdf',))['pdf']
+    assert [(i.field, i.kind) for i in issues] == [("experience[0].company", 'changed'), ("experience[0].location", 'changed')]
+    assert issues[0].found == "Acme"
+
+def test_missing_and_reordered():
+    data = synthetic_resume(jobs=1, bullets=1)
+    content = "\n".join(["SYNTHETIC CANDIDATE 0", data['skills'], data['summary']]).encode()
+    kinds = {i.field: i.kind for i in verifier.verify_content(data, content, 'txt')}
+    assert kinds['skills'] == 'reordered' # Summary is matched first, so skills come out of order
+    assert kinds['email'] == 'missing' and kinds['experience[0].company'] == 'missing'
+
+def test_cli_writes_failures_and_exit_status(tmp_path):
+    bad = synthetic_resume(1, 1)
+    bad['education'][0]['degree'] = "B.S. | Honors"
+    src = tmp_path / "corpus.jsonl"
+    src.write_text("\n".join(json.dumps(r) for r in (synthetic_resume(1, 1), bad)) + "\n")
+    out = tmp_path / "failures.jsonl"
+    assert verifier.main([str(src), "-o", str(out), "-j", "2", "--chunksize", "1", "-f", "txt"]) == 1
+    [failure] = [json.loads(line) for line in out.read_text().splitlines()]
+    assert failure['id'] == 2 and failure['issues']['txt'][0]['field'] == "education[0].degree"
+    assert verifier.main(["--synthetic", "3", "-o", str(out), "-j", "1"]) == 0
@@ -0,0 +1,53 @@
+"""
+Tokenization shared by the job-description scorer and the resume index.
+"""
+import re
+
+from models import as_resume_dict
+
+# Keeps technical tokens intact: c++, c#, ci/cd, node.js, a/b
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./&-]*[a-z0-9+#]|[a-z0-9]")
+# Bigrams never span these
+_PHRASE_BREAK_RE = re.compile(r"[,;:!?()\[\]|\n]|\.(?:\s|$)")
+
+STOPWORDS = frozenset("""
+a about above across after all also an and any are as at be been being both but by can could
+did do does doing during each either etc for from had has have having he her here his how i if in
+into is it its itself may me more most must my no nor not of off on once only or other our ours
+out over own per same she should so some such than that the their them then there these they this
+those through to too under until up us very via was we were what when where which while who whom
+why will with within without would you your yours
+ability able experience experienced including work working years year strong plus preferred
+required requirements responsibilities role team join looking candidate ideal using use
+""".split())
+
+def tokenize(text):
+    """Lowercase word tokens with stopwords removed"""
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+def terms(text):
+    """
+    Unigrams plus bigrams of adjacent non-stopword tokens within a phrase,
+    e.g. 'distributed systems' but not 'aws distributed' from 'AWS and distributed'.
+    """
+    unigrams, bigrams = [], []
+    for phrase in _PHRASE_BREAK_RE.split((text or "").lower()):
+        raw = _TOKEN_RE.findall(phrase)
+        for a, b in zip(raw, raw[1:]):
+            if a not in STOPWORDS and b not in STOPWORDS:
+                bigrams.append(f"{a} {b}")
+        unigrams += [t for t in raw if t not in STOPWORDS]
+    return unigrams + bigrams
+
+def resume_text(resume):
+    """Joins the searchable text of a resume: summary, skills, jobs, projects, education, certifications"""
+    data = as_resume_dict(resume)
+    parts = [data.get('summary', ''), data.get('skills', '')]
+    for exp in data.get('experience') or []:
+        parts += [exp.get('title', ''), exp.get('responsibilities', '')]
+    for proj in data.get('projects') or []:
+        parts += [proj.get('name', ''), proj.get('description', '')]
+    for edu in data.get('education') or []:
+        parts.append(edu.get('degree', ''))
+    parts += list(data.get('certifications') or [])
+    return "\n".join(p for p in parts if p)
@@ -0,0 +1,167 @@
+"""
+Round-trip parsability check for generated resumes.
+
+Each resume is rendered in memory (generator.render_all, one layout pass for
+all formats), its text is extracted back the way an ATS would read it
+(importer.extract_lines) and compared with the input:
+
+- missing:   a field's text is nowhere in the extracted text
+- reordered: the text is there, but not after the field drawn before it
+- changed:   the text is there, but parsing the file back gives another value
+             (a '|' in a company name, a bullet glyph that leaks into the text)
+
+    issues = verify_resume(resume)           # {'pdf': [Issue, ...], 'docx': [], ...}
+
+    python verifier.py corpus.jsonl -j 8      # exit status 1 if any resume fails
+    python verifier.py --synthetic 10000      # generated corpus, no input needed
+"""
+import argparse
+import json
+import sys
+from collections import namedtuple
+
+import generator
+import importer
+from batch import imap_ordered, iter_records
+from constants import SECTION_ORDER
+from layout import split_bullets
+
+Issue = namedtuple('Issue', ['field', 'kind', 'expected', 'found']) # kind: 'missing', 'reordered' or 'changed'
+
+DEFAULT_FORMATS = ('docx', 'pdf', 'txt')
+_CASE_INSENSITIVE = {'full_name'} # Printed in capitals
+
+def _section_fields(data):
+    """(section title, [(field path, text), ...]) pairs"""
+    yield "Professional Summary", [('summary', data.get('summary') or '')]
+    yield "Skills", [('skills', data.get('skills') or '')]
+    jobs = []
+    for i, exp in enumerate(data.get('experience') or []):
+        for key in ('company', 'location', 'title', 'start_date', 'end_date'):
+            jobs.append((f"experience[{i}].{key}", exp.get(key) or ''))
+        for j, bullet in enumerate(split_bullets(exp.get('responsibilities'))):
+            jobs.append((f"experience[{i}].responsibilities[{j}]", bullet))
+    yield "Work Experience", jobs
+    projects = []
+    for i, proj in enumerate(data.get('projects') or []):
+        projects.append((f"projects[{i}].name", proj.get('name') or ''))
+        for j, bullet in enumerate(split_bullets(proj.get('description'))):
+            projects.append((f"projects[{i}].description[{j}]", bullet))
+    yield "Projects", projects
+    yield "Education", [(f"education[{i}].{key}", edu.get(key) or '')
+                        for i, edu in enumerate(data.get('education') or [])
+                        for key in ('institution', 'degree', 'year')]
+    certs = [cert.strip() for cert in data.get('certifications') or [] if cert.strip()] # Blank ones are not drawn
+    yield "Certifications", [(f"certifications[{i}]", cert) for i, cert in enumerate(certs)]
+
+def expected_fields(data):
+    """(field path, text) for every non-empty field, in the order the renderers draw them"""
+    fields = [('full_name', data.get('full_name') or '')]
+    fields += [(key, data.get(key) or '') for key in ('city', 'country', 'phone', 'email', 'linkedin', 'github')]
+    by_section = dict(_section_fields(data))
+    for title in SECTION_ORDER:
+        fields += by_section.get(title, [])
+    return [(path, text) for path, text in fields if text.strip()]
+
+def _normalized(text):
+    return " ".join(text.split()).casefold()
+
+def verify_content(data, content, fmt):
+    """Returns the Issues found in one rendered file (bytes) of resume data"""
+    lines = importer.extract_lines(content, fmt)
+    text = _normalized(" ".join(lines))
+    parsed = dict(expected_fields(importer.parse_lines(lines)))
+
+    issues = []
+    cursor = 0
+    for path, value in expected_fields(data):
+        wanted = _normalized(value)
+        pos = text.find(wanted, cursor)
+        if pos != -1:
+            cursor = pos + len(wanted)
+        elif wanted in text:
+            issues.append(Issue(path, 'reordered', value, value))
+            continue
+        else:
+            issues.append(Issue(path, 'missing', value, ''))
+            continue
+
+        found = parsed.get(path, '')
+        same = _normalized(found) == wanted if path in _CASE_INSENSITIVE else " ".join(found.split()) == " ".join(value.split())
+        if not same:
+            issues.append(Issue(path, 'changed', value, found))
+    return issues
+
+def verify_resume(data, formats=DEFAULT_FORMATS):
+    """Renders data in memory in each format and returns {format: [Issue, ...]}"""
+    outputs = generator.render_all(data, formats)
+    return {fmt: verify_content(data, outputs[fmt], fmt) for fmt in formats}
+
+def verify_record(record, formats=DEFAULT_FORMATS):
+    """
+    Verifies one (record_id, resume) pair, where resume is a dict or its JSON
+    text. Rendering errors are reported in the result instead of stopping the batch.
+    """
+    record_id, resume = record
+    try:
+        if isinstance(resume, str):
+            resume = json.loads(resume)
+        issues = verify_resume(resume, formats)
+    except Exception as e:
+        return {'id': record_id, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+    return {
+        'id': record_id,
+        'ok': not any(issues.values()),
+        'issues': {fmt: [issue._asdict() for issue in found] for fmt, found in issues.items() if found},
+    }
+
+class _Verify:
+    """Picklable verify_record with fixed formats"""
+    def __init__(self, formats):
+        self.formats = tuple(formats)
+
+    def __call__(self, record):
+        return verify_record(record, self.formats)
+
+def verify_batch(records, formats=DEFAULT_FORMATS, workers=None, chunksize=16):
+    """
+    Verifies an iterable of (record_id, resume) pairs on all cores.
+    Yields result dicts in input order.
+    """
+    return imap_ordered(_Verify(formats), records, workers=workers, chunksize=chunksize)
+
+def _synthetic_records(n):
+    from bench import synthetic_resume
+    for seed in range(n):
+        yield seed, synthetic_resume(jobs=1 + seed % 5, bullets=1 + seed % 6, seed=seed)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render resumes, extract their text back and report fields that do not survive.")
+    parser.add_argument("source", nargs="?", help="Directory of .json files, a .jsonl file, or '-' for stdin")
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N", help="Verify N generated resumes instead")
+    parser.add_argument("-f", "--formats", default=",".join(DEFAULT_FORMATS), help="Comma-separated formats")
+    parser.add_argument("-o", "--output", default="-", help="JSONL path for failing records (default: stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--chunksize", type=int, default=16, help="Resumes sent to a worker at once")
+    args = parser.parse_args(argv)
+    if not args.source and not args.synthetic:
+        parser.error("give a source or --synthetic N")
+
+    records = _synthetic_records(args.synthetic) if args.synthetic else iter_records(args.source)
+    formats = [fmt.strip() for fmt in args.formats.split(",") if fmt.strip()]
+    total = failed = 0
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for result in verify_batch(records, formats, workers=args.workers, chunksize=args.chunksize):
+            total += 1
+            if not result['ok']:
+                failed += 1
+                out.write(json.dumps(result) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"{total - failed}/{total} resumes round-trip cleanly", file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())